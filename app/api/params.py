@@ -0,0 +1,8 @@
+"""
+Shared request parameter constraints for route signatures.
+"""
+
+# ID path params stay strings; the repositories pass them straight to
+# PostgREST, so parsing them into UUID objects per request buys nothing.
+# Malformed IDs are rejected with 422 before the handler runs.
+UUID_PATTERN = r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
@@ -5,13 +5,22 @@ Provides REST endpoints for person management, data submission history,
 and persona retrieval with versioning and lineage tracking.
 """
 
-from fastapi import APIRouter, HTTPException, Query, status
-from typing import Optional, List
-from uuid import UUID
-from app.models.person import PersonResponse, PersonInDB, PersonCreate
-from app.models.person_data import PersonDataResponse, PersonDataListResponse
-from app.models.persona import PersonaResponse, PersonaWithHistory
+from fastapi import APIRouter, Body, HTTPException, Path, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from typing import AsyncIterator, Optional, List
+from app.models.person import PersonResponse, PersonCreate
+from app.models.person_data import PersonDataCreate, PersonDataResponse, PersonDataListResponse
+from app.models.persona import PersonaResponse, PersonaWithHistory, PersonDataWithPersonaResponse
 from app.services.person_service import get_person_service
+from app.repositories.persona_repo import get_persona_repository
+from app.core.cache import get_cache, person_cache_key, persona_cache_key
+from app.api.params import UUID_PATTERN
+from app.api.responses import (
+    INTERNAL_ERROR_RESPONSE,
+    INVALID_REQUEST_RESPONSE,
+    PERSON_NOT_FOUND_RESPONSE,
+)
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -19,6 +28,34 @@ logger = get_logger(__name__)
 # Create single router for all person endpoints
 router = APIRouter(prefix="/v1/person", tags=["Person"])
 
+
+def _person_etag(person: PersonResponse) -> str:
+    """Weak ETag that changes with the person, its data count, or persona version."""
+    return (
+        f'W/"{person.id}:{person.updated_at.timestamp()}:'
+        f'{person.person_data_count}:{person.latest_persona_version}"'
+    )
+
+
+def _persona_etag(persona: PersonaResponse) -> str:
+    """Weak ETag that changes with each persona version."""
+    return f'W/"{persona.id}:{persona.version}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's If-None-Match header matches an ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+async def _ndjson_lines(items: AsyncIterator[BaseModel]) -> AsyncIterator[bytes]:
+    """Serialize models from an async iterator as newline-delimited JSON."""
+    async for item in items:
+        yield item.model_dump_json().encode() + b"\n"
+
 # ============================================================================
 # PERSON MANAGEMENT ENDPOINTS
 # ============================================================================
@@ -31,8 +68,8 @@ router = APIRouter(prefix="/v1/person", tags=["Person"])
     summary="Create a new person",
     responses={
         201: {"description": "Person created successfully"},
-        400: {"description": "Invalid request data"},
-        500: {"description": "Internal server error"},
+        400: INVALID_REQUEST_RESPONSE,
+        500: INTERNAL_ERROR_RESPONSE,
     },
 )
 async def create_person(person_create: PersonCreate) -> PersonResponse:
@@ -49,39 +86,31 @@ async def create_person(person_create: PersonCreate) -> PersonResponse:
         PersonResponse: Created person with ID, timestamps, demographic info, and metadata
 
     Raises:
-        HTTPException: If creation fails
+        ServiceError: If creation fails
     """
-    try:
-        logger.info("POST /v1/person - Creating new person")
-        logger.debug(f"  - first_name: {person_create.first_name}")
-        logger.debug(f"  - last_name: {person_create.last_name}")
-        logger.debug(f"  - gender: {person_create.gender}")
-
-        service = get_person_service()
+    logger.info("POST /v1/person - Creating new person")
+    logger.debug("  - first_name: {}", person_create.first_name)
+    logger.debug("  - last_name: {}", person_create.last_name)
+    logger.debug("  - gender: {}", person_create.gender)
 
-        # Create person with demographic data
-        person = await service.create_person(
-            first_name=person_create.first_name,
-            last_name=person_create.last_name,
-            gender=person_create.gender
-        )
+    service = get_person_service()
 
-        # Build response with metadata
-        response = PersonResponse(
-            **person.model_dump(),
-            person_data_count=0,
-            latest_persona_version=None,
-        )
+    # Create person with demographic data
+    person = await service.create_person(
+        first_name=person_create.first_name,
+        last_name=person_create.last_name,
+        gender=person_create.gender
+    )
 
-        logger.info(f"Person created successfully: {person.id}")
-        return response
+    # Build response with metadata
+    response = PersonResponse.model_construct(
+        **person.__dict__,
+        person_data_count=0,
+        latest_persona_version=None,
+    )
 
-    except Exception as e:
-        logger.error(f"Failed to create person: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create person: {str(e)}",
-        )
+    logger.info(f"Person created successfully: {person.id}")
+    return response
 
 
 @router.get(
@@ -90,11 +119,16 @@ async def create_person(person_create: PersonCreate) -> PersonResponse:
     summary="Get person by ID",
     responses={
         200: {"description": "Person found"},
-        404: {"description": "Person not found"},
-        500: {"description": "Internal server error"},
+        304: {"description": "Person unchanged since the given ETag"},
+        404: PERSON_NOT_FOUND_RESPONSE,
+        500: INTERNAL_ERROR_RESPONSE,
     },
 )
-async def get_person(person_id: UUID) -> PersonResponse:
+async def get_person(
+    request: Request,
+    response: Response,
+    person_id: str = Path(..., pattern=UUID_PATTERN),
+) -> PersonResponse:
     """
     Retrieve a person by ID with metadata.
 
@@ -103,17 +137,28 @@ async def get_person(person_id: UUID) -> PersonResponse:
     - Count of data submissions
     - Latest persona version
 
+    The response carries an ETag; a matching If-None-Match returns
+    304 Not Modified without a body.
+
     Args:
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (for the ETag header)
         person_id: UUID of the person to retrieve
 
     Returns:
         PersonResponse: Person with metadata
 
     Raises:
-        HTTPException: If person not found or operation fails
+        HTTPException: If person not found
     """
-    try:
-        logger.debug(f"GET /v1/person/{person_id}")
+    logger.debug("GET /v1/person/{}", person_id)
+    cache = get_cache()
+    cache_key = person_cache_key(person_id)
+
+    person = cache.get(cache_key)
+    if person is not None:
+        logger.debug("Person served from cache: {}", person_id)
+    else:
         service = get_person_service()
 
         person = await service.get_person(person_id)
@@ -124,60 +169,62 @@ async def get_person(person_id: UUID) -> PersonResponse:
                 detail=f"Person not found: {person_id}",
             )
 
-        logger.debug(f"Person retrieved: {person_id}")
-        return person
+        cache.set(cache_key, person)
+        logger.debug("Person retrieved: {}", person_id)
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to get person {person_id}: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get person: {str(e)}",
-        )
+    etag = _person_etag(person)
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    return person
 
 
 @router.get(
     "",
-    response_model=List[PersonInDB],
+    response_model=List[PersonResponse],
     summary="List all persons",
     responses={
         200: {"description": "Persons retrieved"},
-        500: {"description": "Internal server error"},
+        500: INTERNAL_ERROR_RESPONSE,
     },
 )
 async def list_persons(
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
-) -> List[PersonInDB]:
+    stream: bool = Query(False, description="Stream persons as NDJSON"),
+) -> List[PersonResponse]:
     """
     List all persons with pagination.
 
+    Each person includes its data submission count and latest persona version.
+    With stream=true, persons are sent as newline-delimited JSON as they are
+    fetched instead of as a single JSON array.
+
     Args:
         limit: Maximum persons per page (1-100, default 50)
         offset: Number of persons to skip (default 0)
+        stream: Stream the page as NDJSON (default false)
 
     Returns:
-        List[PersonInDB]: Paginated list of persons
+        List[PersonResponse]: Paginated list of persons with metadata
 
     Raises:
-        HTTPException: If operation fails
+        ServiceError: If listing fails
     """
-    try:
-        logger.debug(f"GET /v1/person (limit={limit}, offset={offset})")
-        service = get_person_service()
+    logger.debug("GET /v1/person (limit={}, offset={})", limit, offset)
+    service = get_person_service()
 
-        persons, total = await service.list_persons(limit, offset)
-        logger.debug(f"Listed {len(persons)} persons (total: {total})")
+    if stream:
+        return StreamingResponse(
+            _ndjson_lines(service.stream_persons(limit, offset)),
+            media_type="application/x-ndjson",
+        )
 
-        return persons
+    persons, total = await service.list_persons(limit, offset)
+    logger.debug("Listed {} persons (total: {})", len(persons), total)
 
-    except Exception as e:
-        logger.error(f"Failed to list persons: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to list persons: {str(e)}",
-        )
+    return persons
 
 
 @router.delete(
@@ -186,11 +233,11 @@ async def list_persons(
     summary="Delete a person",
     responses={
         204: {"description": "Person deleted successfully"},
-        404: {"description": "Person not found"},
-        500: {"description": "Internal server error"},
+        404: PERSON_NOT_FOUND_RESPONSE,
+        500: INTERNAL_ERROR_RESPONSE,
     },
 )
-async def delete_person(person_id: UUID) -> None:
+async def delete_person(person_id: str = Path(..., pattern=UUID_PATTERN)) -> None:
     """
     Delete a person and all related data.
 
@@ -201,31 +248,21 @@ async def delete_person(person_id: UUID) -> None:
         person_id: UUID of the person to delete
 
     Raises:
-        HTTPException: If person not found or operation fails
+        HTTPException: If person not found
     """
-    try:
-        logger.info(f"DELETE /v1/person/{person_id}")
-        service = get_person_service()
+    logger.info(f"DELETE /v1/person/{person_id}")
+    service = get_person_service()
 
-        success = await service.delete_person(person_id)
-        if not success:
-            logger.warning(f"Person not found for deletion: {person_id}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Person not found: {person_id}",
-            )
-
-        logger.info(f"Person deleted: {person_id}")
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to delete person {person_id}: {str(e)}")
+    success = await service.delete_person(person_id)
+    if not success:
+        logger.warning(f"Person not found for deletion: {person_id}")
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to delete person: {str(e)}",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Person not found: {person_id}",
         )
 
+    logger.info(f"Person deleted: {person_id}")
+
 
 # ============================================================================
 # PERSON DATA HISTORY ENDPOINTS
@@ -239,13 +276,13 @@ async def delete_person(person_id: UUID) -> None:
     summary="Add data to a person",
     responses={
         201: {"description": "Data added successfully"},
-        404: {"description": "Person not found"},
-        400: {"description": "Invalid request data"},
-        500: {"description": "Internal server error"},
+        404: PERSON_NOT_FOUND_RESPONSE,
+        400: INVALID_REQUEST_RESPONSE,
+        500: INTERNAL_ERROR_RESPONSE,
     },
 )
 async def add_person_data(
-    person_id: UUID,
+    person_id: str = Path(..., pattern=UUID_PATTERN),
     raw_text: str = Query(..., min_length=1, max_length=100000),
     source: str = Query("api", max_length=50),
 ) -> PersonDataResponse:
@@ -264,29 +301,56 @@ async def add_person_data(
         PersonDataResponse: Created submission record
 
     Raises:
-        HTTPException: If person not found or operation fails
+        NotFoundError: If person not found
     """
-    try:
-        logger.info(f"POST /v1/person/{person_id}/data")
-        service = get_person_service()
+    logger.info(f"POST /v1/person/{person_id}/data")
+    service = get_person_service()
 
-        submission = await service.add_person_data(person_id, raw_text, source)
-        logger.info(f"Data added to person {person_id}: {submission.id}")
+    submission = await service.add_person_data(person_id, raw_text, source)
+    logger.info(f"Data added to person {person_id}: {submission.id}")
 
-        return PersonDataResponse(**submission.model_dump())
+    return PersonDataResponse.model_construct(**submission.__dict__)
 
-    except ValueError as e:
-        logger.warning(f"Validation error: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
-    except Exception as e:
-        logger.error(f"Failed to add data to person {person_id}: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to add data: {str(e)}",
-        )
+
+@router.post(
+    "/{person_id}/data:bulk",
+    response_model=List[PersonDataResponse],
+    status_code=status.HTTP_201_CREATED,
+    summary="Add multiple data submissions to a person",
+    responses={
+        201: {"description": "Data added successfully"},
+        404: PERSON_NOT_FOUND_RESPONSE,
+        400: INVALID_REQUEST_RESPONSE,
+        500: INTERNAL_ERROR_RESPONSE,
+    },
+)
+async def add_person_data_bulk(
+    person_id: str = Path(..., pattern=UUID_PATTERN),
+    items: List[PersonDataCreate] = Body(..., min_length=1, max_length=500),
+) -> List[PersonDataResponse]:
+    """
+    Add several unstructured data submissions to a person in one request.
+
+    Intended for imports and backfills: all submissions are written with a
+    single insert. Does NOT trigger persona recomputation.
+
+    Args:
+        person_id: UUID of the person
+        items: Submissions to add (1-500), each with raw_text and optional source
+
+    Returns:
+        List[PersonDataResponse]: Created submission records, in request order
+
+    Raises:
+        NotFoundError: If person not found
+    """
+    logger.info(f"POST /v1/person/{person_id}/data:bulk ({len(items)} items)")
+    service = get_person_service()
+
+    submissions = await service.add_person_data_bulk(person_id, items)
+    logger.info(f"{len(submissions)} submissions added to person {person_id}")
+
+    return [PersonDataResponse.model_construct(**s.__dict__) for s in submissions]
 
 
 @router.get(
@@ -295,52 +359,53 @@ async def add_person_data(
     summary="Get person data history",
     responses={
         200: {"description": "Data history retrieved"},
-        404: {"description": "Person not found"},
-        500: {"description": "Internal server error"},
+        404: PERSON_NOT_FOUND_RESPONSE,
+        500: INTERNAL_ERROR_RESPONSE,
     },
 )
 async def get_person_data_history(
-    person_id: UUID,
+    person_id: str = Path(..., pattern=UUID_PATTERN),
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    stream: bool = Query(False, description="Stream submissions as NDJSON"),
 ) -> PersonDataListResponse:
     """
     Get paginated history of data submissions for a person.
 
     Results are ordered by created_at (oldest first) to show
-    the accumulation order of submissions.
+    the accumulation order of submissions. With stream=true, submissions
+    are sent as newline-delimited JSON without the total count wrapper.
 
     Args:
         person_id: UUID of the person
         limit: Maximum submissions per page (1-100, default 50)
         offset: Number of submissions to skip (default 0)
+        stream: Stream the page as NDJSON (default false)
 
     Returns:
         PersonDataListResponse: Paginated list with total count
 
     Raises:
-        HTTPException: If operation fails
+        ServiceError: If retrieval fails
     """
-    try:
-        logger.debug(f"GET /v1/person/{person_id}/data (limit={limit}, offset={offset})")
-        service = get_person_service()
+    logger.debug("GET /v1/person/{}/data (limit={}, offset={})", person_id, limit, offset)
+    service = get_person_service()
 
-        submissions, total = await service.get_person_data_history(person_id, limit, offset)
-        logger.debug(f"Retrieved {len(submissions)} submissions for {person_id}")
-
-        return PersonDataListResponse(
-            items=submissions,
-            total=total,
-            limit=limit,
-            offset=offset,
+    if stream:
+        return StreamingResponse(
+            _ndjson_lines(service.stream_person_data_history(person_id, limit, offset)),
+            media_type="application/x-ndjson",
         )
 
-    except Exception as e:
-        logger.error(f"Failed to get data history for {person_id}: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get data history: {str(e)}",
-        )
+    submissions, total = await service.get_person_data_history(person_id, limit, offset)
+    logger.debug("Retrieved {} submissions for {}", len(submissions), person_id)
+
+    return PersonDataListResponse(
+        items=submissions,
+        total=total,
+        limit=limit,
+        offset=offset,
+    )
 
 
 # ============================================================================
@@ -354,17 +419,26 @@ async def get_person_data_history(
     summary="Get current persona for a person",
     responses={
         200: {"description": "Persona retrieved"},
+        304: {"description": "Persona unchanged since the given ETag"},
         404: {"description": "Person or persona not found"},
-        500: {"description": "Internal server error"},
+        500: INTERNAL_ERROR_RESPONSE,
     },
 )
-async def get_current_persona(person_id: UUID) -> PersonaResponse:
+async def get_current_persona(
+    request: Request,
+    response: Response,
+    person_id: str = Path(..., pattern=UUID_PATTERN),
+) -> PersonaResponse:
     """
     Get the current/latest persona for a person.
 
     Returns the latest computed persona with version and lineage information.
+    The response carries an ETag; a matching If-None-Match returns
+    304 Not Modified without a body.
 
     Args:
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (for the ETag header)
         person_id: UUID of the person (not the persona)
 
     Returns:
@@ -373,41 +447,37 @@ async def get_current_persona(person_id: UUID) -> PersonaResponse:
     Raises:
         HTTPException: If person or persona not found
     """
-    try:
-        logger.debug(f"GET /v1/person/{person_id}/persona")
-        service = get_person_service()
-
-        # Get person to verify exists
-        person = await service.get_person(person_id)
-        if not person:
+    logger.debug("GET /v1/person/{}/persona", person_id)
+    cache = get_cache()
+    cache_key = persona_cache_key(person_id)
+
+    persona = cache.get(cache_key)
+    if persona is not None:
+        logger.debug("Persona served from cache for {}", person_id)
+    else:
+        # Verify the person exists and fetch the current persona together
+        person_exists, persona = await get_persona_repository().get_with_person(person_id)
+        if not person_exists:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Person not found: {person_id}",
             )
 
-        # Get current persona
-        from app.repositories.persona_repo import PersonaRepository
-
-        persona_repo = PersonaRepository()
-        persona = await persona_repo.get_by_person_id(person_id)
-
         if not persona:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"No persona found for person: {person_id}",
             )
 
-        logger.debug(f"Persona retrieved for {person_id} (v{persona.version})")
-        return persona
+        cache.set(cache_key, persona)
+        logger.debug("Persona retrieved for {} (v{})", person_id, persona.version)
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to get persona for {person_id}: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get persona: {str(e)}",
-        )
+    etag = _persona_etag(persona)
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    return persona
 
 
 # ============================================================================
@@ -417,21 +487,21 @@ async def get_current_persona(person_id: UUID) -> PersonaResponse:
 
 @router.post(
     "/{person_id}/data-and-regenerate",
-    response_model=dict,
+    response_model=PersonDataWithPersonaResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Add data and regenerate persona",
     responses={
         201: {"description": "Data added and persona regenerated"},
-        404: {"description": "Person not found"},
-        400: {"description": "Invalid request data"},
-        500: {"description": "Internal server error"},
+        404: PERSON_NOT_FOUND_RESPONSE,
+        400: INVALID_REQUEST_RESPONSE,
+        500: INTERNAL_ERROR_RESPONSE,
     },
 )
 async def add_data_and_regenerate_persona(
-    person_id: UUID,
+    person_id: str = Path(..., pattern=UUID_PATTERN),
     raw_text: str = Query(..., min_length=1, max_length=100000),
     source: str = Query("api", max_length=50),
-) -> dict:
+) -> PersonDataWithPersonaResponse:
     """
     Add data to a person and regenerate their persona atomically.
 
@@ -447,40 +517,26 @@ async def add_data_and_regenerate_persona(
         source: Source of data (api, urls, import, etc)
 
     Returns:
-        dict: Contains 'person_data' (submission) and 'persona' (regenerated)
+        PersonDataWithPersonaResponse: Contains 'person_data' (submission)
+            and 'persona' (regenerated)
 
     Raises:
-        HTTPException: If person not found or operation fails
+        NotFoundError: If person not found
+        ServiceError: If persona regeneration fails
     """
-    try:
-        logger.info(f"POST /v1/person/{person_id}/data-and-regenerate")
-        service = get_person_service()
-
-        submission, persona = await service.add_person_data_and_regenerate(
-            person_id, raw_text, source
-        )
-
-        logger.info(
-            f"Data added and persona regenerated for {person_id} "
-            f"(persona v{persona.version})"
-        )
-
-        return {
-            "person_data": PersonDataResponse(**submission.model_dump()),
-            "persona": PersonaResponse(**persona.model_dump()),
-        }
-
-    except ValueError as e:
-        logger.warning(f"Validation error: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
-    except Exception as e:
-        logger.error(
-            f"Failed to add data and regenerate persona for {person_id}: {str(e)}"
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to add data and regenerate: {str(e)}",
-        )
+    logger.info(f"POST /v1/person/{person_id}/data-and-regenerate")
+    service = get_person_service()
+
+    submission, persona = await service.add_person_data_and_regenerate(
+        person_id, raw_text, source
+    )
+
+    logger.info(
+        f"Data added and persona regenerated for {person_id} "
+        f"(persona v{persona.version})"
+    )
+
+    return PersonDataWithPersonaResponse.model_construct(
+        person_data=submission,
+        persona=persona,
+    )
@@ -0,0 +1,12 @@
+"""
+Shared OpenAPI response descriptions for route decorators.
+
+Endpoints reference these instead of repeating identical literal dicts.
+"""
+
+from typing import Any, Dict
+
+INTERNAL_ERROR_RESPONSE: Dict[str, Any] = {"description": "Internal server error"}
+INVALID_REQUEST_RESPONSE: Dict[str, Any] = {"description": "Invalid request data"}
+PERSON_NOT_FOUND_RESPONSE: Dict[str, Any] = {"description": "Person not found"}
+PERSONA_NOT_FOUND_RESPONSE: Dict[str, Any] = {"description": "Persona not found"}
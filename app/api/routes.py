@@ -5,8 +5,11 @@ Provides REST endpoints for persona creation, retrieval, and updates
 with full Swagger documentation and error handling.
 """
 
-from fastapi import APIRouter, HTTPException, Query, status
-from typing import Optional, Dict, Any, List
+from fastapi import APIRouter, HTTPException, Path, Query, status
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, Optional, Dict, Any, List
+from datetime import datetime, timezone
+import json
 from uuid import UUID
 from app.models.persona import (
     PersonaCreate,
@@ -17,6 +20,12 @@ from app.models.persona import (
 )
 from app.services.persona_service import get_persona_service
 from app.services.url_fetcher import URLFetcher, URLFetchError
+from app.api.params import UUID_PATTERN
+from app.api.responses import (
+    INTERNAL_ERROR_RESPONSE,
+    INVALID_REQUEST_RESPONSE,
+    PERSONA_NOT_FOUND_RESPONSE,
+)
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -27,6 +36,26 @@ router = APIRouter(
 )
 
 
+async def _json_export_chunks(
+    format: str, total_in_system: int, personas: AsyncIterator[PersonaInDB]
+) -> AsyncIterator[bytes]:
+    """Serialize a persona export as a JSON document, one persona at a time."""
+    header = json.dumps({
+        "export_format": format,
+        "exported_at": datetime.now(timezone.utc).isoformat(),
+        "total_in_system": total_in_system,
+    })
+    yield header[:-1].encode() + b', "personas": ['
+
+    exported = 0
+    async for persona in personas:
+        yield (b"," if exported else b"") + persona.model_dump_json().encode()
+        exported += 1
+
+    yield f'], "total_exported": {exported}}}'.encode()
+    logger.info(f"Export complete: {exported} personas")
+
+
 @router.post(
     "",
     response_model=PersonaCreateResponse,
@@ -34,7 +63,7 @@ router = APIRouter(
     summary="Create a new persona",
     responses={
         201: {"description": "Persona created successfully"},
-        400: {"description": "Invalid request data"},
+        400: INVALID_REQUEST_RESPONSE,
         500: {"description": "Internal server error during persona generation"},
     },
 )
@@ -61,7 +90,8 @@ async def create_persona(
         (minimal response excluding raw_text and persona JSON for optimized payload)
 
     Raises:
-        HTTPException: If persona generation fails or URL fetching fails
+        HTTPException: If URL fetching fails
+        ServiceError: If persona generation fails
 
     Example:
         ```json
@@ -77,116 +107,48 @@ async def create_persona(
         }
         ```
     """
-    try:
-        # Detailed request validation logging
-        logger.debug(f"create_persona() endpoint called")
-        logger.debug(f"  - request type: {type(request)}")
-        logger.debug(f"  - request class: {request.__class__.__name__}")
-
-        # Determine input source
-        logger.debug(f"Processing request input:")
-        logger.debug(f"  - request.raw_text type: {type(request.raw_text)}")
-        logger.debug(f"  - request.raw_text value: {request.raw_text if request.raw_text else 'None or empty'}")
-        logger.debug(f"  - request.urls type: {type(request.urls)}")
-        logger.debug(f"  - request.urls value: {request.urls if request.urls else 'None or empty'}")
-
-        input_text = request.raw_text or ""
-
-        logger.debug(f"Initial input_text: type={type(input_text)}, length={len(input_text)}")
-
-        # Fetch content from URLs if provided
-        if request.urls:
-            logger.info(f"Creating persona from {len(request.urls)} URL(s)")
-            try:
-                url_fetcher = URLFetcher()
-                logger.debug(f"Fetching content from {len(request.urls)} URL(s)...")
-                url_content = await url_fetcher.fetch_multiple(
-                    [str(url) for url in request.urls]
-                )
-                logger.debug(f"URL fetch complete: {len(url_content)} chars retrieved")
-
-                # Combine URL content with raw_text if provided
-                if input_text:
-                    input_text = f"{input_text}\n\n---\n\n{url_content}"
-                    logger.debug(f"Combined input: raw_text + url_content = {len(input_text)} chars")
-                else:
-                    input_text = url_content
-                    logger.debug(f"Using url_content only: {len(input_text)} chars")
-
-                logger.debug(f"Final combined input_text: type={type(input_text)}, length={len(input_text)}")
-
-            except URLFetchError as e:
-                error_msg = (
-                    f"Failed to fetch content from provided URLs: {str(e)}. "
-                    f"Please verify that all URLs are accessible and return valid content. "
-                    f"URLs provided: {request.urls}"
-                )
-                logger.error(error_msg)
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=error_msg,
-                )
-        else:
-            logger.info("Creating persona from raw text")
-            logger.debug(f"Input text length: {len(input_text)} chars")
-            logger.debug(f"Input text type: {type(input_text)}")
-            logger.debug(f"Input text preview: {input_text[:200] if input_text else 'empty'}")
-
-        # Create persona with combined input
-        logger.debug(f"About to call service.generate_persona() with:")
-        logger.debug(f"  - input_text type: {type(input_text)}")
-        logger.debug(f"  - input_text length: {len(input_text)}")
-        logger.debug(f"  - input_text preview: {input_text[:300]}")
-
-        service = get_persona_service()
-        persona = await service.generate_persona(input_text)
-
-        logger.debug(f"service.generate_persona() returned:")
-        logger.debug(f"  - persona type: {type(persona)}")
-        logger.debug(f"  - persona class: {persona.__class__.__name__}")
-        logger.debug(f"  - persona.id: {persona.id}")
-        logger.debug(f"  - persona.created_at: {persona.created_at}")
-        logger.debug(f"  - persona.updated_at: {persona.updated_at}")
-
-        logger.info(f"Persona created successfully: {persona.id}")
-
-        # Return minimal response with only id, created_at, updated_at
-        logger.debug(f"Building PersonaCreateResponse...")
-        response = PersonaCreateResponse(
-            id=str(persona.id),
-            created_at=persona.created_at,
-            updated_at=persona.updated_at,
-        )
-        logger.debug(f"PersonaCreateResponse created successfully")
-        return response
-
-    except HTTPException:
-        # Re-raise HTTP exceptions as-is
-        raise
-    except ValueError as e:
-        error_msg = f"Validation error creating persona: {str(e)}"
-        logger.error(error_msg)
-        logger.error(f"  - ValueError type: {type(e).__name__}")
-        logger.error(f"  - ValueError details: {str(e)}")
-        logger.error(f"  - Full traceback: ", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=error_msg,
-        )
-    except Exception as e:
-        error_msg = (
-            f"Failed to generate persona: {type(e).__name__}: {str(e)}. "
-            f"This may be due to API issues, invalid input, or service unavailability. "
-            f"Please verify your input and try again. If the problem persists, check the service status."
-        )
-        logger.error(error_msg)
-        logger.error(f"  - Exception type: {type(e).__name__}")
-        logger.error(f"  - Exception details: {str(e)}")
-        logger.error(f"  - Full traceback: ", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=error_msg,
-        )
+    input_text = request.raw_text or ""
+
+    # Fetch content from URLs if provided
+    if request.urls:
+        logger.info(f"Creating persona from {len(request.urls)} URL(s)")
+        try:
+            url_fetcher = URLFetcher()
+            # raw_text (if any) goes first; the fetcher joins everything once
+            input_text = await url_fetcher.fetch_multiple(
+                request.urls,
+                leading_text=input_text,
+            )
+
+        except URLFetchError as e:
+            error_msg = (
+                f"Failed to fetch content from provided URLs: {str(e)}. "
+                f"Please verify that all URLs are accessible and return valid content. "
+                f"URLs provided: {request.urls}"
+            )
+            logger.error(error_msg)
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=error_msg,
+            )
+    else:
+        logger.info("Creating persona from raw text")
+
+    logger.debug("Generating persona from {} chars of input", len(input_text))
+
+    service = get_persona_service()
+    persona = await service.generate_persona(input_text)
+
+    logger.bind(persona_id=str(persona.id), input_len=len(input_text)).info(
+        f"Persona created successfully: {persona.id}"
+    )
+
+    # Return minimal response with only id, created_at, updated_at
+    return PersonaCreateResponse.model_construct(
+        id=str(persona.id),
+        created_at=persona.created_at,
+        updated_at=persona.updated_at,
+    )
 
 
 @router.get(
@@ -195,7 +157,7 @@ async def create_persona(
     summary="List all personas",
     responses={
         200: {"description": "Personas retrieved successfully"},
-        500: {"description": "Internal server error"},
+        500: INTERNAL_ERROR_RESPONSE,
     },
     include_in_schema=False,
 )
@@ -214,39 +176,25 @@ async def list_personas(
         PersonaListResponse: List of personas with pagination metadata
 
     Raises:
-        HTTPException: If listing fails
+        ServiceError: If listing fails
 
     Example:
         ```
         GET /v1/persona?limit=20&offset=0
         ```
     """
-    try:
-        logger.debug(f"Listing personas: limit={limit}, offset={offset}")
-
-        service = get_persona_service()
-        personas, total = await service.list_personas(limit, offset)
-
-        logger.info(f"Listed {len(personas)} personas (total: {total})")
-        return PersonaListResponse(
-            items=personas,
-            total=total,
-            limit=limit,
-            offset=offset,
-        )
+    logger.debug("Listing personas: limit={}, offset={}", limit, offset)
 
-    except Exception as e:
-        error_msg = (
-            f"Failed to list personas: {type(e).__name__}: {str(e)}. "
-            f"Parameters: limit={limit}, offset={offset}. "
-            f"Please verify query parameters are valid and try again."
-        )
-        logger.error(error_msg)
-        logger.error(f"  - Full traceback: ", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=error_msg,
-        )
+    service = get_persona_service()
+    personas, total = await service.list_personas(limit, offset)
+
+    logger.info(f"Listed {len(personas)} personas (total: {total})")
+    return PersonaListResponse.model_construct(
+        items=personas,
+        total=total,
+        limit=limit,
+        offset=offset,
+    )
 
 
 @router.post(
@@ -256,8 +204,8 @@ async def list_personas(
     responses={
         200: {"description": "Personas merged successfully"},
         404: {"description": "One or both personas not found"},
-        400: {"description": "Invalid request data"},
-        500: {"description": "Internal server error"},
+        400: INVALID_REQUEST_RESPONSE,
+        500: INTERNAL_ERROR_RESPONSE,
     },
     include_in_schema=False,
 )
@@ -285,46 +233,11 @@ async def merge_personas(
         POST /v1/persona/merge?persona_id_1=uuid1&persona_id_2=uuid2
         ```
     """
-    try:
-        logger.info(f"Merging personas: {persona_id_1} + {persona_id_2}")
-        service = get_persona_service()
-        merged = await service.merge_personas(persona_id_1, persona_id_2, merged_raw_text)
-        logger.info(f"Merge successful: {persona_id_1}")
-        return PersonaResponse(**merged.model_dump())
-
-    except ValueError as e:
-        error_msg = f"Merge error: {str(e)}"
-        logger.warning(error_msg)
-        if "not found" in str(e).lower():
-            detailed_error = (
-                f"Cannot merge personas: {str(e)}. "
-                f"Persona ID 1: {persona_id_1}, Persona ID 2: {persona_id_2}. "
-                f"Please verify both persona IDs exist and are valid UUIDs."
-            )
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=detailed_error,
-            )
-        detailed_error = (
-            f"Validation error during merge: {str(e)}. "
-            f"Persona IDs: {persona_id_1} and {persona_id_2}"
-        )
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=detailed_error,
-        )
-    except Exception as e:
-        error_msg = (
-            f"Failed to merge personas: {type(e).__name__}: {str(e)}. "
-            f"Persona ID 1: {persona_id_1}, Persona ID 2: {persona_id_2}. "
-            f"Please verify both personas exist and try again."
-        )
-        logger.error(error_msg)
-        logger.error(f"  - Full traceback: ", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=error_msg,
-        )
+    logger.info(f"Merging personas: {persona_id_1} + {persona_id_2}")
+    service = get_persona_service()
+    merged = await service.merge_personas(persona_id_1, persona_id_2, merged_raw_text)
+    logger.info(f"Merge successful: {persona_id_1}")
+    return PersonaResponse.model_construct(**merged.__dict__)
 
 
 @router.post(
@@ -334,8 +247,8 @@ async def merge_personas(
     summary="Batch generate personas",
     responses={
         201: {"description": "Personas generated successfully"},
-        400: {"description": "Invalid request data"},
-        500: {"description": "Internal server error"},
+        400: INVALID_REQUEST_RESPONSE,
+        500: INTERNAL_ERROR_RESPONSE,
     },
     include_in_schema=False,
 )
@@ -345,7 +258,7 @@ async def batch_generate_personas(
     """
     Batch generate multiple personas.
 
-    Creates multiple personas in sequence from a list of raw texts.
+    Creates multiple personas concurrently from a list of raw texts.
 
     Args:
         raw_texts: List of unstructured text entries
@@ -359,36 +272,14 @@ async def batch_generate_personas(
         ["Text about person 1", "Text about person 2"]
         ```
     """
-    try:
-        if not raw_texts:
-            raise ValueError("raw_texts list cannot be empty")
-
-        logger.info(f"Batch generating {len(raw_texts)} personas")
-        service = get_persona_service()
-        personas = await service.batch_generate_personas(raw_texts)
-        logger.info(f"Batch generation complete: {len(personas)} personas")
-        return [PersonaResponse(**p.model_dump()) for p in personas]
-
-    except ValueError as e:
-        error_msg = f"Batch generation validation error: {str(e)}. Input received {len(raw_texts) if raw_texts else 0} text entries."
-        logger.warning(error_msg)
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=error_msg,
-        )
-    except Exception as e:
-        error_msg = (
-            f"Batch generation failed: {type(e).__name__}: {str(e)}. "
-            f"Attempted to generate {len(raw_texts)} personas. "
-            f"Some personas may have been created before the error occurred. "
-            f"Please check created personas and retry the remaining entries."
-        )
-        logger.error(error_msg)
-        logger.error(f"  - Full traceback: ", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=error_msg,
-        )
+    if not raw_texts:
+        raise ValueError("raw_texts list cannot be empty")
+
+    logger.info(f"Batch generating {len(raw_texts)} personas")
+    service = get_persona_service()
+    personas = await service.batch_generate_personas(raw_texts)
+    logger.info(f"Batch generation complete: {len(personas)} personas")
+    return [PersonaResponse.model_construct(**p.__dict__) for p in personas]
 
 
 @router.get(
@@ -398,7 +289,7 @@ async def batch_generate_personas(
     responses={
         200: {"description": "Search completed successfully"},
         400: {"description": "Invalid query"},
-        500: {"description": "Internal server error"},
+        500: INTERNAL_ERROR_RESPONSE,
     },
     include_in_schema=False,
 )
@@ -423,25 +314,11 @@ async def search_personas(
         GET /v1/persona/search?q=engineer&limit=20
         ```
     """
-    try:
-        logger.debug(f"Searching personas for '{q}'")
-        service = get_persona_service()
-        results = await service.search_personas(q, limit)
-        logger.info(f"Search found {len(results)} results for '{q}'")
-        return [PersonaResponse(**p.model_dump()) for p in results]
-
-    except Exception as e:
-        error_msg = (
-            f"Search failed: {type(e).__name__}: {str(e)}. "
-            f"Search query: '{q}', limit: {limit}. "
-            f"Please verify the search query is valid and try again."
-        )
-        logger.error(error_msg)
-        logger.error(f"  - Full traceback: ", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=error_msg,
-        )
+    logger.debug("Searching personas for '{}'", q)
+    service = get_persona_service()
+    results = await service.search_personas(q, limit)
+    logger.info(f"Search found {len(results)} results for '{q}'")
+    return [PersonaResponse.model_construct(**p.__dict__) for p in results]
 
 
 @router.get(
@@ -449,7 +326,7 @@ async def search_personas(
     summary="Get persona statistics",
     responses={
         200: {"description": "Stats retrieved successfully"},
-        500: {"description": "Internal server error"},
+        500: INTERNAL_ERROR_RESPONSE,
     },
     include_in_schema=False,
 )
@@ -467,87 +344,54 @@ async def get_persona_stats() -> Dict[str, Any]:
         GET /v1/persona/stats
         ```
     """
-    try:
-        logger.debug("Getting persona statistics")
-        service = get_persona_service()
-        stats = await service.get_persona_stats()
-        logger.info("Statistics retrieved")
-        return stats
-
-    except Exception as e:
-        error_msg = (
-            f"Failed to retrieve statistics: {type(e).__name__}: {str(e)}. "
-            f"The statistics aggregation operation encountered an error. "
-            f"Please try again later."
-        )
-        logger.error(error_msg)
-        logger.error(f"  - Full traceback: ", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=error_msg,
-        )
+    logger.debug("Getting persona statistics")
+    service = get_persona_service()
+    stats = await service.get_persona_stats()
+    logger.info("Statistics retrieved")
+    return stats
 
 
 @router.get(
     "/export",
+    response_class=StreamingResponse,
     summary="Export all personas",
     responses={
         200: {"description": "Export successful"},
         400: {"description": "Invalid format"},
-        500: {"description": "Internal server error"},
+        500: INTERNAL_ERROR_RESPONSE,
     },
     include_in_schema=False,
 )
 async def export_personas(
     format: str = Query("json", description="Export format (json)"),
     limit: int = Query(1000, ge=1, le=10000, description="Max personas to export"),
-) -> Dict[str, Any]:
+) -> StreamingResponse:
     """
     Export personas in specified format.
 
+    The JSON document (same shape as PersonaExportResponse) is streamed
+    persona by persona, so large exports are never held in memory whole.
+
     Args:
         format: Export format (currently 'json' only)
         limit: Maximum personas to include (1-10000)
 
     Returns:
-        Exported data with metadata
+        StreamingResponse: Exported personas with metadata
 
     Example:
         ```
         GET /v1/persona/export?format=json&limit=500
         ```
     """
-    try:
-        logger.info(f"Exporting personas as {format}")
-        service = get_persona_service()
-        export_data = await service.export_personas(format, limit)
-        logger.info(f"Export complete: {export_data['total_exported']} personas")
-        return export_data
-
-    except ValueError as e:
-        error_msg = (
-            f"Invalid export format: {str(e)}. "
-            f"Requested format: '{format}'. "
-            f"Only 'json' format is currently supported. "
-            f"Limit: {limit}"
-        )
-        logger.warning(error_msg)
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=error_msg,
-        )
-    except Exception as e:
-        error_msg = (
-            f"Export failed: {type(e).__name__}: {str(e)}. "
-            f"Format: {format}, Limit: {limit}. "
-            f"The export operation encountered an error. Please try again with different parameters."
-        )
-        logger.error(error_msg)
-        logger.error(f"  - Full traceback: ", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=error_msg,
-        )
+    logger.info(f"Exporting personas as {format}")
+    service = get_persona_service()
+    total, personas = await service.stream_export(format, limit)
+
+    return StreamingResponse(
+        _json_export_chunks(format, total, personas),
+        media_type="application/json",
+    )
 
 
 # GENERIC PERSONA ENDPOINTS - MUST BE LAST!
@@ -561,12 +405,12 @@ async def export_personas(
     summary="Retrieve a persona",
     responses={
         200: {"description": "Persona retrieved successfully"},
-        404: {"description": "Persona not found"},
-        500: {"description": "Internal server error"},
+        404: PERSONA_NOT_FOUND_RESPONSE,
+        500: INTERNAL_ERROR_RESPONSE,
     },
 )
 async def get_persona(
-    persona_id: str,
+    persona_id: str = Path(..., pattern=UUID_PATTERN),
 ) -> PersonaResponse:
     """
     Retrieve a persona by ID.
@@ -578,45 +422,20 @@ async def get_persona(
         PersonaResponse: The requested persona
 
     Raises:
-        HTTPException: If persona not found or error occurs
+        NotFoundError: If persona not found
 
     Example:
         ```
         GET /v1/persona/550e8400-e29b-41d4-a716-446655440000
         ```
     """
-    try:
-        logger.debug(f"Retrieving persona: {persona_id}")
-
-        service = get_persona_service()
-        persona = await service.get_persona(persona_id)
+    logger.debug("Retrieving persona: {}", persona_id)
 
-        logger.info(f"Persona retrieved: {persona_id}")
-        return PersonaResponse(**persona.model_dump())
+    service = get_persona_service()
+    persona = await service.get_persona(persona_id)
 
-    except ValueError as e:
-        error_msg = (
-            f"Persona not found: {str(e)}. "
-            f"Requested persona ID: {persona_id}. "
-            f"Please verify the persona ID is correct and the persona exists in the system."
-        )
-        logger.warning(error_msg)
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=error_msg,
-        )
-    except Exception as e:
-        error_msg = (
-            f"Failed to retrieve persona: {type(e).__name__}: {str(e)}. "
-            f"Persona ID: {persona_id}. "
-            f"Please verify the persona ID is valid and try again."
-        )
-        logger.error(error_msg)
-        logger.error(f"  - Full traceback: ", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=error_msg,
-        )
+    logger.info(f"Persona retrieved: {persona_id}")
+    return PersonaResponse.model_construct(**persona.__dict__)
 
 
 @router.patch(
@@ -625,14 +444,14 @@ async def get_persona(
     summary="Update a persona",
     responses={
         200: {"description": "Persona updated successfully"},
-        404: {"description": "Persona not found"},
-        400: {"description": "Invalid request data"},
-        500: {"description": "Internal server error"},
+        404: PERSONA_NOT_FOUND_RESPONSE,
+        400: INVALID_REQUEST_RESPONSE,
+        500: INTERNAL_ERROR_RESPONSE,
     },
 )
 async def update_persona_endpoint(
-    persona_id: str,
     request: PersonaCreate,
+    persona_id: str = Path(..., pattern=UUID_PATTERN),
 ) -> PersonaResponse:
     """
     Update a persona with new information.
@@ -648,7 +467,8 @@ async def update_persona_endpoint(
         PersonaResponse: Updated persona
 
     Raises:
-        HTTPException: If persona not found or update fails
+        NotFoundError: If persona not found
+        ServiceError: If update fails
 
     Example:
         ```json
@@ -659,52 +479,14 @@ async def update_persona_endpoint(
         }
         ```
     """
-    try:
-        logger.info(f"Updating persona: {persona_id}")
-        logger.debug(f"Update text length: {len(request.raw_text) if request.raw_text else 0} chars")
+    logger.info(f"Updating persona: {persona_id}")
+    logger.debug("Update text length: {} chars", len(request.raw_text) if request.raw_text else 0)
 
-        service = get_persona_service()
-        persona = await service.update_persona(persona_id, request.raw_text)
+    service = get_persona_service()
+    persona = await service.update_persona(persona_id, request.raw_text)
 
-        logger.info(f"Persona updated: {persona_id}")
-        return PersonaResponse(**persona.model_dump())
-
-    except ValueError as e:
-        if "not found" in str(e).lower():
-            error_msg = (
-                f"Cannot update persona: {str(e)}. "
-                f"Persona ID: {persona_id}. "
-                f"Please verify the persona ID exists and is valid."
-            )
-            logger.warning(error_msg)
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=error_msg,
-            )
-        else:
-            error_msg = (
-                f"Validation error updating persona: {str(e)}. "
-                f"Persona ID: {persona_id}. "
-                f"Text length: {len(request.raw_text) if request.raw_text else 0} chars."
-            )
-            logger.error(error_msg)
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=error_msg,
-            )
-    except Exception as e:
-        error_msg = (
-            f"Failed to update persona: {type(e).__name__}: {str(e)}. "
-            f"Persona ID: {persona_id}. "
-            f"Text length: {len(request.raw_text) if request.raw_text else 0} chars. "
-            f"The update operation encountered an error. Please verify the input and try again."
-        )
-        logger.error(error_msg)
-        logger.error(f"  - Full traceback: ", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=error_msg,
-        )
+    logger.info(f"Persona updated: {persona_id}")
+    return PersonaResponse.model_construct(**persona.__dict__)
 
 
 @router.delete(
@@ -713,12 +495,12 @@ async def update_persona_endpoint(
     summary="Delete a persona",
     responses={
         204: {"description": "Persona deleted successfully"},
-        404: {"description": "Persona not found"},
-        500: {"description": "Internal server error"},
+        404: PERSONA_NOT_FOUND_RESPONSE,
+        500: INTERNAL_ERROR_RESPONSE,
     },
 )
 async def delete_persona_endpoint(
-    persona_id: str,
+    persona_id: str = Path(..., pattern=UUID_PATTERN),
 ) -> None:
     """
     Delete a persona.
@@ -727,44 +509,28 @@ async def delete_persona_endpoint(
         persona_id: UUID of the persona to delete
 
     Raises:
-        HTTPException: If persona not found or deletion fails
+        HTTPException: If persona not found
 
     Example:
         ```
         DELETE /v1/persona/550e8400-e29b-41d4-a716-446655440000
         ```
     """
-    try:
-        logger.info(f"Deleting persona: {persona_id}")
+    logger.info(f"Deleting persona: {persona_id}")
 
-        service = get_persona_service()
-        deleted = await service.delete_persona(persona_id)
+    service = get_persona_service()
+    deleted = await service.delete_persona(persona_id)
 
-        if not deleted:
-            error_msg = (
-                f"Cannot delete persona: persona not found. "
-                f"Persona ID: {persona_id}. "
-                f"Please verify the persona ID is correct and the persona exists in the system."
-            )
-            logger.warning(error_msg)
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=error_msg,
-            )
-
-        logger.info(f"Persona deleted: {persona_id}")
-
-    except HTTPException:
-        raise
-    except Exception as e:
+    if not deleted:
         error_msg = (
-            f"Failed to delete persona: {type(e).__name__}: {str(e)}. "
+            f"Cannot delete persona: persona not found. "
             f"Persona ID: {persona_id}. "
-            f"The deletion operation encountered an error. Please try again."
+            f"Please verify the persona ID is correct and the persona exists in the system."
         )
-        logger.error(error_msg)
-        logger.error(f"  - Full traceback: ", exc_info=True)
+        logger.warning(error_msg)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=status.HTTP_404_NOT_FOUND,
             detail=error_msg,
         )
+
+    logger.info(f"Persona deleted: {persona_id}")
@@ -3,12 +3,11 @@ Core application modules for configuration, logging, and database setup.
 """
 
 from .config import settings, validate_settings
-from .logging import setup_logging, get_logger, cleanup_old_logs
+from .logging import setup_logging, get_logger
 
 __all__ = [
     "settings",
     "validate_settings",
     "setup_logging",
     "get_logger",
-    "cleanup_old_logs",
 ]
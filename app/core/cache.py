@@ -0,0 +1,202 @@
+"""
+In-process TTL cache for read-heavy API paths.
+
+Provides a small cache-aside store keyed by string, with per-entry
+expiry and LRU eviction once the configured size is reached.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Optional, Union
+from uuid import UUID
+
+from app.core.config import settings
+
+
+class TTLCache:
+    """Thread-safe key/value cache with a fixed time-to-live per entry."""
+
+    def __init__(self, ttl_seconds: float, max_size: int = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: Seconds an entry stays valid after being set
+            max_size: Maximum number of entries before the least recently
+                used one is evicted
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value under a key.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, *keys: str) -> None:
+        """
+        Remove one or more keys if present.
+
+        Args:
+            keys: Cache keys to remove
+        """
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+def person_cache_key(person_id: Union[UUID, str]) -> str:
+    """Cache key for a person's PersonResponse."""
+    return f"person:{str(person_id).lower()}"
+
+
+def person_row_cache_key(person_id: Union[UUID, str]) -> str:
+    """Cache key for a person's stored PersonInDB row."""
+    return f"person_row:{str(person_id).lower()}"
+
+
+def persona_cache_key(person_id: Union[UUID, str]) -> str:
+    """Cache key for a person's current persona."""
+    return f"persona:{str(person_id).lower()}"
+
+
+def persona_row_cache_key(persona_id: Union[UUID, str]) -> str:
+    """Cache key for a stored PersonaInDB row, by persona ID."""
+    return f"persona_row:{str(persona_id).lower()}"
+
+
+def generation_cache_key(raw_text: str) -> str:
+    """Cache key for the persona generated from a given input text."""
+    digest = hashlib.blake2b(raw_text.encode(), digest_size=16).hexdigest()
+    return f"generation:{digest}"
+
+
+def generation_source_cache_key(persona_id: Union[UUID, str]) -> str:
+    """Generation cache key recording which input text produced a persona."""
+    return f"generation_source:{str(persona_id).lower()}"
+
+
+def invalidate_generation(persona_id: Union[UUID, str]) -> None:
+    """
+    Stop reusing a persona for the input text it was generated from.
+
+    Call before any write that changes or removes the persona, so a repeat
+    of the original input generates a fresh one.
+
+    Args:
+        persona_id: UUID of the persona
+    """
+    cache = get_generation_cache()
+    source_key = generation_source_cache_key(persona_id)
+    text_key = cache.get(source_key)
+    if text_key is not None:
+        cache.delete(text_key, source_key)
+
+
+def invalidate_person(person_id: Union[UUID, str]) -> None:
+    """
+    Drop all cached entries for a person.
+
+    Call after any write that changes the person, its data submissions,
+    or its persona.
+
+    Args:
+        person_id: UUID of the person
+    """
+    cache = get_cache()
+    keys = [person_cache_key(person_id), persona_cache_key(person_id)]
+
+    # The person's persona may also be cached by its own ID
+    persona = cache.get(persona_cache_key(person_id))
+    persona_id = getattr(persona, "id", None)
+    if persona_id is not None:
+        keys.append(persona_row_cache_key(persona_id))
+
+    cache.delete(*keys)
+
+
+# Global cache instances
+_cache: Optional[TTLCache] = None
+_generation_cache: Optional[TTLCache] = None
+
+
+def get_cache() -> TTLCache:
+    """
+    Get or create the global cache instance.
+
+    Returns:
+        TTLCache: Shared cache instance
+    """
+    global _cache
+
+    if _cache is None:
+        _cache = TTLCache(
+            ttl_seconds=settings.cache_ttl_seconds,
+            max_size=settings.cache_max_entries,
+        )
+
+    return _cache
+
+
+def get_generation_cache() -> TTLCache:
+    """
+    Get or create the global persona generation cache.
+
+    Maps generation_cache_key(raw_text) to the ID of the persona generated
+    from that text, and generation_source_cache_key(persona_id) back to that
+    key so edits can drop the pairing. Kept separate from the response
+    cache because entries live much longer.
+
+    Returns:
+        TTLCache: Shared generation cache instance
+    """
+    global _generation_cache
+
+    if _generation_cache is None:
+        _generation_cache = TTLCache(
+            ttl_seconds=settings.generation_cache_ttl_seconds,
+            max_size=settings.cache_max_entries,
+        )
+
+    return _generation_cache
@@ -4,6 +4,8 @@ Application configuration using Pydantic Settings.
 Loads environment variables from .env file and validates them.
 """
 
+from functools import lru_cache
+from pydantic import ValidationInfo, field_validator
 from pydantic_settings import BaseSettings
 from typing import Literal
 import sys
@@ -15,6 +17,8 @@ class Settings(BaseSettings):
     # OpenAI Configuration
     openai_api_key: str
     openai_model: str = "gpt-4o-mini"
+    llm_single_pass: bool = True
+    batch_generation_concurrency: int = 5
 
     # Supabase Configuration
     supabase_url: str
@@ -24,11 +28,40 @@ class Settings(BaseSettings):
     environment: Literal["development", "staging", "production"] = "development"
     log_level: str = "INFO"
     debug: bool = False
+    cors_allow_origins: list[str] = ["*"]
+
+    # Database Configuration
+    db_warmup_connections: int = 4
+
+    # Cache Configuration
+    cache_ttl_seconds: float = 60.0
+    cache_max_entries: int = 1024
+    generation_cache_ttl_seconds: float = 3600.0
+
+    # Persona Regeneration Configuration
+    regenerate_debounce_ms: float = 200.0
+
+    # Submission Batching Configuration
+    submission_batch_size: int = 50
+    submission_batch_wait_ms: float = 5.0
+
+    # Persona Upsert Batching Configuration
+    persona_upsert_batch_size: int = 32
+    persona_upsert_batch_wait_ms: float = 5.0
 
     class Config:
         env_file = ".env"
         case_sensitive = False
         extra = "ignore"  # Ignore extra fields in .env
+        frozen = True  # Read-only after load, safe to read without copies
+
+    @field_validator("openai_api_key", "supabase_url", "supabase_anon_key")
+    @classmethod
+    def _require_non_empty(cls, value: str, info: ValidationInfo) -> str:
+        """Reject required credentials that are set but empty."""
+        if not value:
+            raise ValueError(f"{info.field_name.upper()} is required but not set")
+        return value
 
     @property
     def is_production(self) -> bool:
@@ -41,10 +74,14 @@ class Settings(BaseSettings):
         return self.environment == "development"
 
 
+@lru_cache(maxsize=1)
 def validate_settings() -> Settings:
     """
     Validate that all required settings are properly configured.
 
+    The environment is read and validated once; later calls return the
+    same Settings instance.
+
     Raises:
         ValueError: If required settings are missing or invalid
     """
@@ -65,14 +102,6 @@ def validate_settings() -> Settings:
     print(f"  - supabase_anon_key set: {bool(s.supabase_anon_key)}", file=sys.stderr)
     print(f"  - log_level: {s.log_level}", file=sys.stderr)
 
-    # Additional validation
-    if not s.openai_api_key:
-        raise ValueError("OPENAI_API_KEY is required but not set")
-    if not s.supabase_url:
-        raise ValueError("SUPABASE_URL is required but not set")
-    if not s.supabase_anon_key:
-        raise ValueError("SUPABASE_ANON_KEY is required but not set")
-
     return s
 
 
@@ -7,13 +7,64 @@ Provides centralized error handling with detailed error messages.
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError, HTTPException
-from typing import Union
-from datetime import datetime
-from traceback import format_exc
+from typing import Tuple, Union
+from datetime import datetime, timezone
+import time
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# (epoch second, formatted timestamp) of the last error response
+_last_timestamp: Tuple[int, str] = (-1, "")
+
+
+class NotFoundError(ValueError):
+    """Raised when a requested resource does not exist (HTTP 404)."""
+
+
+class ServiceError(Exception):
+    """Raised when a service operation fails for reasons other than bad input (HTTP 500)."""
+
+
+def _utc_timestamp() -> str:
+    """
+    Current UTC time as an ISO 8601 string with second precision.
+
+    The formatted string is reused for every error within the same second.
+    """
+    global _last_timestamp
+
+    now = int(time.time())
+    if _last_timestamp[0] != now:
+        _last_timestamp = (
+            now,
+            datetime.fromtimestamp(now, timezone.utc).isoformat(timespec="seconds"),
+        )
+    return _last_timestamp[1]
+
+
+def _error_response(status_code: int, error: str, error_type: str) -> JSONResponse:
+    """
+    Build the standard error response body.
+
+    Args:
+        status_code: HTTP status code
+        error: Human-readable error message
+        error_type: Name of the error category
+
+    Returns:
+        JSONResponse with the standard error fields
+    """
+    return JSONResponse(
+        status_code=status_code,
+        content={
+            "error": error,
+            "error_type": error_type,
+            "status_code": status_code,
+            "timestamp": _utc_timestamp()
+        }
+    )
+
 
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """
@@ -36,7 +87,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
             "error": error_message,
             "error_type": "ValidationError",
             "status_code": status.HTTP_422_UNPROCESSABLE_ENTITY,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _utc_timestamp(),
             "details": error_details
         }
     )
@@ -57,17 +108,36 @@ async def http_exception_handler(request: Request, exc: HTTPException):
         f"HTTP Exception: {status_code}: {detail}"
     )
 
-    return JSONResponse(
-        status_code=status_code,
-        content={
-            "error": str(detail) if detail else "An error occurred",
-            "error_type": "HTTPException",
-            "status_code": status_code,
-            "timestamp": datetime.utcnow().isoformat()
-        }
+    return _error_response(
+        status_code,
+        str(detail) if detail else "An error occurred",
+        "HTTPException",
     )
 
 
+async def not_found_exception_handler(request: Request, exc: NotFoundError):
+    """
+    Handle NotFoundError raised by services.
+
+    Returns 404 with the exception message.
+    """
+    logger.warning(f"Not found: {exc}")
+
+    return _error_response(status.HTTP_404_NOT_FOUND, str(exc), "NotFoundError")
+
+
+async def value_error_exception_handler(request: Request, exc: ValueError):
+    """
+    Handle ValueError raised by services for invalid input.
+
+    Returns 400 with the exception message.
+    """
+    error_type = type(exc).__name__
+    logger.warning(f"Invalid request: {error_type}: {exc}")
+
+    return _error_response(status.HTTP_400_BAD_REQUEST, str(exc), error_type)
+
+
 async def general_exception_handler(request: Request, exc: Exception):
     """
     Handle all unhandled exceptions.
@@ -76,18 +146,12 @@ async def general_exception_handler(request: Request, exc: Exception):
     """
     error_type = type(exc).__name__
     error_message = str(exc)
-    traceback_str = format_exc()
 
-    logger.error(f"Unhandled exception: {error_type}")
-    logger.error(f"  - Message: {error_message}")
-    logger.error(f"  - Traceback: {traceback_str}")
+    # Loguru renders the traceback only when a sink actually emits the record
+    logger.opt(exception=exc).error(f"Unhandled exception: {error_type}: {error_message}")
 
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "error": f"{error_type}: {error_message}" if error_message else error_type,
-            "error_type": error_type,
-            "status_code": status.HTTP_500_INTERNAL_SERVER_ERROR,
-            "timestamp": datetime.utcnow().isoformat()
-        }
+    return _error_response(
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        f"{error_type}: {error_message}" if error_message else error_type,
+        error_type,
     )
@@ -0,0 +1,59 @@
+"""
+Shared outbound HTTP client.
+
+Keeps one pooled httpx.AsyncClient for the application so outbound
+requests reuse keep-alive connections instead of paying for a new
+TCP/TLS handshake each time.
+
+Unlike the Supabase client (app.db.supabase_client), this one stays on
+HTTP/1.1: it fetches user-supplied URLs spread across many hosts, so
+there is rarely a second concurrent request to multiplex onto a
+connection, and HTTP/2 would only add negotiation with arbitrary servers.
+"""
+
+from typing import Optional
+
+import httpx
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_TIMEOUT = 30.0  # seconds
+
+# Global client instance
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get or create the global HTTP client.
+
+    Returns:
+        httpx.AsyncClient: Shared pooled client
+    """
+    global _http_client
+
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            ),
+            timeout=DEFAULT_TIMEOUT,
+        )
+        logger.debug("Shared HTTP client created")
+
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the global HTTP client and release its connections."""
+    global _http_client
+
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+        logger.debug("Shared HTTP client closed")
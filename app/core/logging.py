@@ -7,14 +7,27 @@ Provides structured logging with console and file output depending on environmen
 import sys
 from pathlib import Path
 from loguru import logger
-from datetime import datetime, timedelta
-import glob
 import contextvars
-from uuid import uuid4
+import secrets
+from functools import lru_cache
 
 # Context variable for storing correlation ID
 correlation_id_var = contextvars.ContextVar('correlation_id', default=None)
 
+# Routes records to the LLM interactions sink; the correlation ID comes from
+# logger.contextualize() in the request middleware
+_llm_logger = logger.bind(llm_log=True)
+
+# Sink formats, parsed by Loguru once per sink when it is added
+_CONSOLE_FORMAT = (
+    "<level>{time:YYYY-MM-DD HH:mm:ss}</level> | "
+    "<level>{level: <8}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
+    "<level>{message}</level>"
+)
+_APP_FILE_FORMAT = "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}"
+_LLM_FILE_FORMAT = "{time:YYYY-MM-DD HH:mm:ss} | {extra[correlation_id]} | {level: <8} | {message}"
+
 
 def setup_logging(log_level: str = "INFO", environment: str = "development") -> None:
     """
@@ -27,15 +40,20 @@ def setup_logging(log_level: str = "INFO", environment: str = "development") ->
     # Remove default handler
     logger.remove()
 
+    # Records logged outside a request (no contextualized ID) still format
+    logger.configure(extra={"correlation_id": "-"})
+
+    # Variable capture in tracebacks walks every frame; keep it out of production
+    diagnose = environment != "production"
+
     # Console handler - always present
     logger.add(
         sys.stderr,
-        format="<level>{time:YYYY-MM-DD HH:mm:ss}</level> | "
-               "<level>{level: <8}</level> | "
-               "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
-               "<level>{message}</level>",
+        format=_CONSOLE_FORMAT,
         level=log_level,
-        colorize=True if environment == "development" else False,
+        colorize=environment == "development",  # Color markup only for local terminals
+        backtrace=diagnose,
+        diagnose=diagnose,
     )
 
     # Create logs directory
@@ -45,29 +63,40 @@ def setup_logging(log_level: str = "INFO", environment: str = "development") ->
     # File handler for general application logs
     logger.add(
         log_dir / "app.log",
-        format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
+        format=_APP_FILE_FORMAT,
         level="INFO",
-        rotation="00:00",  # Rotate daily
-        retention="7 days",  # Keep 7 days of logs
+        rotation="50 MB",  # Rotate by size, checked as records are written
+        retention=7,  # Keep the 7 most recent rotated files
+        compression="gz",
+        enqueue=True,  # Write from a background thread, not the event loop
+        buffering=8192,  # Batch writes; flushed on rotation and shutdown
+        backtrace=diagnose,
+        diagnose=diagnose,
     )
 
     # File handler for LLM requests and responses
     logger.add(
         log_dir / "llm_interactions.log",
-        format="{time:YYYY-MM-DD HH:mm:ss} | {extra[correlation_id]} | {level: <8} | {message}",
+        format=_LLM_FILE_FORMAT,
         level="INFO",
-        rotation="00:00",  # Rotate daily
-        retention="7 days",  # Keep 7 days of logs
+        rotation="100 MB",
+        retention=7,
+        compression="gz",
+        enqueue=True,
+        buffering=8192,
         filter=lambda record: record.get("extra", {}).get("llm_log", False),
     )
 
     logger.info(f"Logging initialized - Environment: {environment}, Level: {log_level}")
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str = None):
     """
     Get a logger instance.
 
+    One bound logger is shared per name.
+
     Usage:
         from app.core.logging import get_logger
         logger = get_logger(__name__)
@@ -88,7 +117,7 @@ def get_correlation_id() -> str:
     """Get the current correlation ID or create a new one."""
     corr_id = correlation_id_var.get()
     if not corr_id:
-        corr_id = str(uuid4())[:8]  # Short 8-character ID
+        corr_id = secrets.token_hex(4)  # Short 8-character ID
         correlation_id_var.set(corr_id)
     return corr_id
 
@@ -113,11 +142,14 @@ def log_llm_request(
         temperature: Temperature parameter
         max_tokens: Max tokens parameter
     """
-    corr_id = get_correlation_id()
     msg_count = len(messages)
-    total_chars = sum(len(m.get("content", "")) for m in messages)
+    total_chars = 0
+    for message in messages:
+        content = message.get("content")
+        if content:
+            total_chars += len(content)
 
-    logger.bind(llm_log=True, correlation_id=corr_id).info(
+    _llm_logger.info(
         f"LLM Request | Model: {model} | Messages: {msg_count} | "
         f"Chars: {total_chars} | Temp: {temperature} | MaxTokens: {max_tokens}"
     )
@@ -138,7 +170,6 @@ def log_llm_response(
         usage: Token usage dict with 'prompt_tokens', 'completion_tokens', 'total_tokens'
         latency_ms: Request latency in milliseconds
     """
-    corr_id = get_correlation_id()
     response_chars = len(response_text)
 
     usage_str = ""
@@ -151,24 +182,6 @@ def log_llm_response(
 
     latency_str = f" | Latency: {latency_ms:.0f}ms" if latency_ms else ""
 
-    logger.bind(llm_log=True, correlation_id=corr_id).info(
+    _llm_logger.info(
         f"LLM Response | Model: {model} | ResponseChars: {response_chars}{usage_str}{latency_str}"
     )
-
-
-def cleanup_old_logs(days_to_keep: int = 7) -> None:
-    """Remove log files older than specified days."""
-    log_dir = Path("logs")
-    if not log_dir.exists():
-        return
-
-    cutoff_time = datetime.now() - timedelta(days=days_to_keep)
-
-    for log_file in glob.glob(str(log_dir / "*.log")):
-        file_mtime = datetime.fromtimestamp(Path(log_file).stat().st_mtime)
-        if file_mtime < cutoff_time:
-            try:
-                Path(log_file).unlink()
-                logger.info(f"Deleted old log file: {log_file}")
-            except Exception as e:
-                logger.error(f"Failed to delete log file {log_file}: {e}")
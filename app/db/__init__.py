@@ -2,10 +2,18 @@
 Database module with Supabase client and database utilities.
 """
 
-from .supabase_client import get_supabase_client, reset_supabase_client, SupabaseClient
+from .supabase_client import (
+    get_supabase_client,
+    reset_supabase_client,
+    run_query,
+    warm_up_supabase_client,
+    SupabaseClient,
+)
 
 __all__ = [
     "get_supabase_client",
     "reset_supabase_client",
+    "run_query",
+    "warm_up_supabase_client",
     "SupabaseClient",
 ]
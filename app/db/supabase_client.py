@@ -5,19 +5,32 @@ Provides a singleton client for database operations with connection pooling
 and error handling.
 """
 
-from supabase import create_client, Client
+import asyncio
+import threading
+import httpx
 from app.core.config import settings
 from app.core.logging import get_logger
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from supabase import Client
 
 logger = get_logger(__name__)
 
+# Connection pool shared by every PostgREST request. Queries run in worker
+# threads (see run_query), so keep-alive connections are sized to cover them
+# all; HTTP/2 lets concurrent queries share a connection.
+POOL_MAX_CONNECTIONS = 100
+POOL_MAX_KEEPALIVE_CONNECTIONS = 50
+QUERY_TIMEOUT = 120.0  # seconds, supabase-py's default for PostgREST
+
 
 class SupabaseClient:
     """Supabase database client wrapper with connection management."""
 
     _instance: Optional["SupabaseClient"] = None
-    _client: Optional[Client] = None
+    _client: Optional["Client"] = None
+    _http_client: Optional[httpx.Client] = None
 
     def __new__(cls) -> "SupabaseClient":
         """Implement singleton pattern."""
@@ -37,13 +50,26 @@ class SupabaseClient:
         Raises:
             Exception: If client initialization fails
         """
+        # Imported here: supabase pulls in its auth, storage and realtime
+        # clients, which only need loading once a client is actually built
+        from supabase import ClientOptions, create_client
+
         try:
             logger.debug(
                 f"Initializing Supabase client for {settings.supabase_url}"
             )
+            self._http_client = httpx.Client(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=POOL_MAX_CONNECTIONS,
+                    max_keepalive_connections=POOL_MAX_KEEPALIVE_CONNECTIONS,
+                ),
+                timeout=QUERY_TIMEOUT,
+            )
             self._client = create_client(
                 settings.supabase_url,
                 settings.supabase_anon_key,
+                options=ClientOptions(httpx_client=self._http_client),
             )
             logger.info("Supabase client initialized successfully")
         except Exception as e:
@@ -51,7 +77,7 @@ class SupabaseClient:
             raise
 
     @property
-    def client(self) -> Client:
+    def client(self) -> "Client":
         """Get the Supabase client instance."""
         if self._client is None:
             self._initialize_client()
@@ -81,8 +107,8 @@ class SupabaseClient:
             True if connected, False otherwise
         """
         try:
-            # Test connection by querying system tables
-            self.client.table("personas").select("id", count="exact").limit(1).execute()
+            # Fetch a single id; count="exact" would add a COUNT(*) per probe
+            self.client.table("personas").select("id").limit(1).execute()
             return True
         except Exception as e:
             logger.warning(f"Connection check failed: {e}")
@@ -92,15 +118,20 @@ class SupabaseClient:
         """Close the client connection."""
         if self._client is not None:
             try:
-                # Supabase client doesn't have explicit close, but we can reset
+                # Supabase client doesn't have explicit close; release the
+                # pooled connections and drop the client
+                if self._http_client is not None:
+                    self._http_client.close()
+                    self._http_client = None
                 self._client = None
                 logger.info("Supabase client connection closed")
             except Exception as e:
                 logger.error(f"Error closing Supabase client: {e}")
 
 
-# Global client instance
+# Global client instance, created during application startup
 _supabase: Optional[SupabaseClient] = None
+_supabase_lock = threading.Lock()
 
 
 def get_supabase_client() -> SupabaseClient:
@@ -117,13 +148,77 @@ def get_supabase_client() -> SupabaseClient:
     """
     global _supabase
     if _supabase is None:
-        _supabase = SupabaseClient()
+        # Double-checked so concurrent first callers (worker threads included)
+        # don't each create a client
+        with _supabase_lock:
+            if _supabase is None:
+                _supabase = SupabaseClient()
     return _supabase
 
 
+async def run_query(query: Any) -> Any:
+    """
+    Execute a PostgREST query without blocking the event loop.
+
+    The Supabase client is synchronous, so the HTTP request runs in a worker
+    thread. This keeps the event loop free while the query is in flight and
+    lets independent queries overlap via asyncio.gather().
+
+    Args:
+        query: A PostgREST request builder (anything with an execute() method)
+
+    Returns:
+        The PostgREST API response
+
+    Usage:
+        response = await run_query(
+            supabase.client.table('personas').select('*').eq('id', persona_id)
+        )
+    """
+    return await asyncio.to_thread(query.execute)
+
+
+async def warm_up_supabase_client(connections: int) -> None:
+    """
+    Open the Supabase client's HTTP connections ahead of the first request.
+
+    Issues cheap queries in parallel so the underlying connection pool
+    already holds established (TCP + TLS) keep-alive connections. Failures
+    are logged and ignored; requests will connect on demand as before.
+
+    Args:
+        connections: Number of parallel warm-up queries (0 to skip)
+    """
+    if connections <= 0:
+        return
+
+    supabase = get_supabase_client()
+    results = await asyncio.gather(
+        *(
+            run_query(supabase.client.table("persons").select("id").limit(1))
+            for _ in range(connections)
+        ),
+        return_exceptions=True,
+    )
+
+    failures = [r for r in results if isinstance(r, Exception)]
+    if failures:
+        logger.warning(
+            f"Supabase warm-up: {len(failures)}/{connections} queries failed: {failures[0]}"
+        )
+    else:
+        logger.debug(f"Supabase warm-up: {connections} connections ready")
+
+
 def reset_supabase_client() -> None:
-    """Reset the global Supabase client instance (for testing)."""
+    """
+    Close and reset the global Supabase client instance.
+
+    Called on application shutdown; tests also use it to start from a
+    fresh client.
+    """
     global _supabase
-    if _supabase is not None:
-        _supabase.close()
-    _supabase = None
+    with _supabase_lock:
+        if _supabase is not None:
+            _supabase.close()
+        _supabase = None
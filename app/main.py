@@ -8,37 +8,94 @@ from fastapi import FastAPI, Request, status, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from contextlib import asynccontextmanager
 from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+import asyncio
+import secrets
 from app.core import settings, setup_logging, get_logger
-from app.core.logging import set_correlation_id, get_correlation_id
-from app.core.exceptions import validation_exception_handler, http_exception_handler, general_exception_handler
+from app.core.logging import correlation_id_var
+from app.core.exceptions import (
+    NotFoundError,
+    validation_exception_handler,
+    http_exception_handler,
+    not_found_exception_handler,
+    value_error_exception_handler,
+    general_exception_handler,
+)
 from app.api import router as persona_router
 from app.api.person_routes import router as person_router
+from app.core.http import close_http_client
+from app.db.supabase_client import reset_supabase_client, warm_up_supabase_client
+from app.services.person_service import get_person_service
+from app.services.persona_service import get_persona_service
+from app.services.persona_upsert_batcher import get_persona_upsert_batcher
+from app.services.submission_batcher import get_submission_batcher
 
 # Initialize logging
 setup_logging(log_level=settings.log_level, environment=settings.environment)
 logger = get_logger(__name__)
 
+MIGRATION_FILE = "002_create_person_aggregate_schema.sql"
+MIGRATION_PATH = Path(__file__).parent.parent / "db" / "migrations" / MIGRATION_FILE
 
-class CorrelationIDMiddleware(BaseHTTPMiddleware):
-    """Middleware to handle correlation IDs for request tracing."""
 
-    async def dispatch(self, request: Request, call_next):
-        # Check for correlation ID in request headers
-        corr_id = request.headers.get("x-correlation-id")
-        if not corr_id:
-            corr_id = get_correlation_id()
-        else:
-            set_correlation_id(corr_id)
+def _read_migration_sql() -> Optional[str]:
+    """Read the pending migration SQL, or None if the file is missing."""
+    try:
+        return MIGRATION_PATH.read_text()
+    except FileNotFoundError:
+        return None
 
-        # Process request
-        response = await call_next(request)
 
-        # Add correlation ID to response headers
-        response.headers["X-Correlation-ID"] = corr_id
-        return response
+class CorrelationIDMiddleware:
+    """
+    Middleware to handle correlation IDs for request tracing.
+
+    Plain ASGI rather than BaseHTTPMiddleware, so requests don't pay for
+    an extra task group and response stream.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Check for correlation ID in request headers
+        corr_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-correlation-id":
+                corr_id = value.decode("latin-1")
+                break
+        if not corr_id:
+            corr_id = secrets.token_hex(4)
+        header_value = corr_id.encode("latin-1")
+
+        async def send_with_correlation_id(message: Message) -> None:
+            # Add correlation ID to response headers
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"x-correlation-id", header_value),
+                ]
+            await send(message)
+
+        # Process request; every record logged while handling it carries the ID.
+        # The context var is only written when it doesn't already hold the ID.
+        token = None
+        if correlation_id_var.get() != corr_id:
+            token = correlation_id_var.set(corr_id)
+        try:
+            with logger.contextualize(correlation_id=corr_id):
+                await self.app(scope, receive, send_with_correlation_id)
+        finally:
+            if token is not None:
+                correlation_id_var.reset(token)
 
 
 @asynccontextmanager
@@ -46,8 +103,10 @@ async def lifespan(app: FastAPI):
     """
     Manage application lifecycle.
 
-    Startup: Log initialization
-    Shutdown: Cleanup
+    Startup: Log initialization, warm database connections and services,
+             start the submission and persona upsert batchers
+    Shutdown: Flush pending submissions and personas, close outbound HTTP
+              and database connections
     """
     # Startup
     logger.info(f"🚀 Persona-API starting in {settings.environment} mode")
@@ -55,10 +114,31 @@ async def lifespan(app: FastAPI):
     logger.debug(f"🤖 Using model: {settings.openai_model}")
     logger.debug(f"🗄️  Supabase URL: {settings.supabase_url[:30]}...")
 
+    # Open database connections and build shared services before the first
+    # request so it doesn't pay for connection setup
+    await warm_up_supabase_client(settings.db_warmup_connections)
+    get_person_service()
+    get_persona_service()
+
+    submission_batcher = get_submission_batcher()
+    submission_batcher.start()
+    persona_upsert_batcher = get_persona_upsert_batcher()
+    persona_upsert_batcher.start()
+
+    # The migration SQL never changes while running; read it once, off the loop
+    if settings.is_development:
+        app.state.migration_sql = await asyncio.to_thread(_read_migration_sql)
+
     yield
 
     # Shutdown
     logger.info("🛑 Persona-API shutting down")
+    await submission_batcher.stop()
+    await persona_upsert_batcher.stop()
+    await close_http_client()
+    reset_supabase_client()
+    # Drain queued file log writes before the process exits
+    await logger.complete()
 
 
 # Initialize FastAPI app
@@ -76,12 +156,15 @@ app = FastAPI(
 app.add_middleware(CorrelationIDMiddleware)
 
 # Add CORS middleware
+# Explicit methods and headers keep preflight answers static instead of
+# echoing each request's headers back. Credentials are only allowed with an
+# explicit origin list; browsers reject them alongside a wildcard origin.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, restrict to specific origins
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=settings.cors_allow_origins,
+    allow_credentials="*" not in settings.cors_allow_origins,
+    allow_methods=["GET", "POST", "PATCH", "DELETE"],
+    allow_headers=["authorization", "content-type", "x-correlation-id"],
 )
 
 # Include API routes
@@ -92,11 +175,13 @@ app.include_router(person_router)
 # Order matters: more specific handlers should come before general ones
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
 app.add_exception_handler(HTTPException, http_exception_handler)
+app.add_exception_handler(NotFoundError, not_found_exception_handler)
+app.add_exception_handler(ValueError, value_error_exception_handler)
 app.add_exception_handler(Exception, general_exception_handler)
 
 
 @app.get("/", tags=["Health"])
-async def root():
+async def root() -> Dict[str, str]:
     """Root endpoint - API is running."""
     return {
         "message": "Persona-API is running",
@@ -106,7 +191,7 @@ async def root():
 
 
 @app.get("/health", tags=["Health"])
-async def health_check():
+async def health_check() -> Dict[str, str]:
     """Health check endpoint."""
     return {
         "status": "healthy",
@@ -116,52 +201,39 @@ async def health_check():
 
 
 @app.post("/migrate", tags=["Admin"])
-async def run_migration():
+async def run_migration(request: Request) -> Dict[str, Any]:
     """
     Apply pending database migrations (development only).
 
     This endpoint applies the 002_create_person_aggregate_schema.sql migration
     to add first_name, last_name, and gender columns to the persons table.
     """
-    import os
-    from pathlib import Path
-
     if not settings.is_development:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Migration endpoint only available in development mode"
         )
 
-    try:
-        # Read migration file
-        migration_path = Path(__file__).parent.parent / "db" / "migrations" / "002_create_person_aggregate_schema.sql"
-        if not migration_path.exists():
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Migration file not found: {migration_path}"
-            )
-
-        with open(migration_path, 'r') as f:
-            sql_content = f.read()
-
-        # For now, return the SQL that needs to be applied
-        logger.warning("Migration endpoint called - SQL content prepared for manual execution")
-
-        return {
-            "status": "pending",
-            "message": "Migration SQL prepared",
-            "migration_file": "002_create_person_aggregate_schema.sql",
-            "instructions": "This migration needs to be applied manually via Supabase dashboard SQL Editor",
-            "sql_content": sql_content
-        }
-
-    except Exception as e:
-        logger.error(f"Migration error: {str(e)}")
+    sql_content = getattr(request.app.state, "migration_sql", None)
+    if sql_content is None:
+        sql_content = await asyncio.to_thread(_read_migration_sql)
+    if sql_content is None:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Migration failed: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Migration file not found: {MIGRATION_PATH}"
         )
 
+    # For now, return the SQL that needs to be applied
+    logger.warning("Migration endpoint called - SQL content prepared for manual execution")
+
+    return {
+        "status": "pending",
+        "message": "Migration SQL prepared",
+        "migration_file": MIGRATION_FILE,
+        "instructions": "This migration needs to be applied manually via Supabase dashboard SQL Editor",
+        "sql_content": sql_content
+    }
+
 
 if __name__ == "__main__":
     import uvicorn
@@ -6,6 +6,7 @@ from .person import (
     PersonCreate,
     PersonInDB,
     PersonResponse,
+    PersonListAdapter,
 )
 
 # PersonData models
@@ -15,6 +16,7 @@ from .person_data import (
     PersonDataInDB,
     PersonDataResponse,
     PersonDataListResponse,
+    PersonDataListAdapter,
 )
 
 # Persona models
@@ -23,10 +25,13 @@ from .persona import (
     PersonaCreate,
     PersonaUpdate,
     PersonaInDB,
+    PersonaListAdapter,
     PersonaResponse,
     PersonaWithHistory,
+    PersonDataWithPersonaResponse,
     PersonaCreateResponse,
     PersonaListResponse,
+    PersonaExportResponse,
     ErrorResponse,
 )
 
@@ -36,20 +41,25 @@ __all__ = [
     "PersonCreate",
     "PersonInDB",
     "PersonResponse",
+    "PersonListAdapter",
     # PersonData
     "PersonDataBase",
     "PersonDataCreate",
     "PersonDataInDB",
     "PersonDataResponse",
     "PersonDataListResponse",
+    "PersonDataListAdapter",
     # Persona
     "PersonaBase",
     "PersonaCreate",
     "PersonaUpdate",
     "PersonaInDB",
+    "PersonaListAdapter",
     "PersonaResponse",
     "PersonaWithHistory",
+    "PersonDataWithPersonaResponse",
     "PersonaCreateResponse",
     "PersonaListResponse",
+    "PersonaExportResponse",
     "ErrorResponse",
 ]
@@ -4,7 +4,7 @@ Person data models using Pydantic for validation and serialization.
 Represents the person aggregate root in the domain model.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from typing import Optional
 from uuid import UUID
 from datetime import datetime
@@ -61,8 +61,11 @@ class PersonInDB(PersonBase):
     created_at: datetime = Field(..., description="Timestamp when person record created")
     updated_at: datetime = Field(..., description="Timestamp when person record last updated")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Validates a list of person rows in one call
+PersonListAdapter = TypeAdapter(list[PersonInDB])
 
 
 class PersonResponse(PersonInDB):
@@ -81,5 +84,4 @@ class PersonResponse(PersonInDB):
         description="Version number of the latest computed persona (None if no persona yet)"
     )
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -5,7 +5,7 @@ Represents the history of unstructured data submissions for a person.
 Each record = one API call with all data sent in that call.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from typing import Optional
 from uuid import UUID
 from datetime import datetime
@@ -56,8 +56,11 @@ class PersonDataInDB(PersonDataBase):
     person_id: UUID = Field(..., description="Foreign key to persons table")
     created_at: datetime = Field(..., description="Timestamp when data was submitted")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Validates a list of person_data rows in one call
+PersonDataListAdapter = TypeAdapter(list[PersonDataInDB])
 
 
 class PersonDataResponse(PersonDataInDB):
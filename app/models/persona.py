@@ -2,10 +2,20 @@
 Persona data models using Pydantic for validation and serialization.
 """
 
-from pydantic import BaseModel, Field, HttpUrl, validator
-from typing import Optional, Any, Dict, List, Union
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    StringConstraints,
+    TypeAdapter,
+    field_validator,
+    model_validator,
+)
+from typing import Annotated, Optional, Any, Dict, List, Union
+from urllib.parse import urlsplit
 from uuid import UUID
 from datetime import datetime
+from app.models.person_data import PersonDataInDB
 
 
 class PersonaBase(BaseModel):
@@ -35,26 +45,45 @@ class PersonaCreate(BaseModel):
         max_length=50000,
         description="Raw text containing persona information"
     )
-    urls: Optional[List[HttpUrl]] = Field(
+    urls: Optional[List[Annotated[str, StringConstraints(max_length=2048)]]] = Field(
         None,
-        min_items=1,
-        max_items=10,
+        min_length=1,
+        max_length=10,
         description="URLs containing persona information (1-10 URLs)"
     )
 
-    @validator('urls', pre=True, always=True)
-    def at_least_one_input(cls, v, values):
+    @field_validator('urls')
+    @classmethod
+    def valid_urls(cls, v: Optional[List[str]]) -> Optional[List[str]]:
+        """Ensure every URL is an absolute http(s) URL."""
+        if v is None:
+            return v
+        for url in v:
+            try:
+                parts = urlsplit(url)
+                parts.port  # Raises ValueError for a non-numeric or out-of-range port
+            except ValueError:
+                raise ValueError(f'Invalid URL: {url}')
+            if (
+                parts.scheme not in ('http', 'https')
+                or not parts.hostname
+                or any(c.isspace() for c in url)
+            ):
+                raise ValueError(f'Invalid URL: {url}')
+        return v
+
+    @model_validator(mode='after')
+    def at_least_one_input(self) -> "PersonaCreate":
         """Ensure at least one input source is provided."""
-        raw_text = values.get('raw_text')
-        if not raw_text and (v is None or len(v) == 0):
+        if not self.raw_text and not self.urls:
             raise ValueError(
                 'Either raw_text or urls must be provided. '
                 'Provide raw text directly or 1-10 URLs containing persona information.'
             )
-        return v
+        return self
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "examples": [
                 {
                     "raw_text": "John is a software engineer with 10 years of experience in full-stack development..."
@@ -68,6 +97,7 @@ class PersonaCreate(BaseModel):
                 }
             ]
         }
+    )
 
 
 class PersonaUpdate(BaseModel):
@@ -98,8 +128,11 @@ class PersonaInDB(PersonaBase):
     created_at: datetime = Field(..., description="When persona first computed for this person")
     updated_at: datetime = Field(..., description="When persona last recomputed")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Validates a list of persona rows in one call
+PersonaListAdapter = TypeAdapter(list[PersonaInDB])
 
 
 class PersonaResponse(PersonaInDB):
@@ -122,6 +155,17 @@ class PersonaWithHistory(PersonaResponse):
     )
 
 
+class PersonDataWithPersonaResponse(BaseModel):
+    """
+    Response model for POST /v1/person/{person_id}/data-and-regenerate.
+
+    Contains the new data submission and the persona regenerated from it.
+    """
+
+    person_data: PersonDataInDB = Field(..., description="Created data submission")
+    persona: PersonaInDB = Field(..., description="Regenerated persona")
+
+
 class PersonaCreateResponse(BaseModel):
     """
     Response model for POST /v1/persona endpoint (201 Created).
@@ -140,8 +184,7 @@ class PersonaCreateResponse(BaseModel):
     created_at: datetime = Field(..., description="Creation timestamp (ISO 8601)")
     updated_at: datetime = Field(..., description="Last update timestamp (ISO 8601)")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PersonaListResponse(BaseModel):
@@ -153,6 +196,16 @@ class PersonaListResponse(BaseModel):
     offset: int = Field(..., description="Pagination offset")
 
 
+class PersonaExportResponse(BaseModel):
+    """Model for a bulk persona export."""
+
+    export_format: str = Field(..., description="Export format")
+    exported_at: datetime = Field(..., description="When the export was produced")
+    total_exported: int = Field(..., description="Number of personas in this export")
+    total_in_system: int = Field(..., description="Total count of personas")
+    personas: list[PersonaInDB] = Field(..., description="Exported personas")
+
+
 class ErrorResponse(BaseModel):
     """
     Standard error response model.
@@ -166,8 +219,8 @@ class ErrorResponse(BaseModel):
     status_code: int = Field(..., description="HTTP status code")
     timestamp: datetime = Field(default_factory=datetime.utcnow, description="Timestamp when error occurred (ISO 8601)")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "error": "Persona not found with ID: 550e8400-e29b-41d4-a716-446655440000",
                 "error_type": "ValueError",
@@ -175,3 +228,4 @@ class ErrorResponse(BaseModel):
                 "timestamp": "2024-11-08T10:30:45.123456"
             }
         }
+    )
@@ -5,10 +5,10 @@ Provides CRUD operations for unstructured data submissions with
 proper error handling and logging.
 """
 
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Tuple
 from uuid import UUID
-from app.models.person_data import PersonDataInDB
-from app.db.supabase_client import get_supabase_client
+from app.models.person_data import PersonDataInDB, PersonDataListAdapter
+from app.db.supabase_client import get_supabase_client, run_query
 from app.core.logging import get_logger
 from postgrest.exceptions import APIError
 
@@ -48,9 +48,9 @@ class PersonDataRepository:
             APIError: If database operation fails
         """
         try:
-            logger.debug(f"PersonDataRepository.create() called for person_id: {person_id}")
-            logger.debug(f"  - raw_text length: {len(raw_text)}")
-            logger.debug(f"  - source: {source}")
+            logger.debug("PersonDataRepository.create() called for person_id: {}", person_id)
+            logger.debug("  - raw_text length: {}", len(raw_text))
+            logger.debug("  - source: {}", source)
 
             data = {
                 "person_id": str(person_id),
@@ -58,10 +58,9 @@ class PersonDataRepository:
                 "source": source,
             }
 
-            response = (
+            response = await run_query(
                 self.supabase.client.table(self.table_name)
                 .insert(data)
-                .execute()
             )
 
             if not response.data or len(response.data) == 0:
@@ -69,16 +68,65 @@ class PersonDataRepository:
                 raise APIError("Failed to create person data: no data returned")
 
             submission_data = response.data[0]
-            logger.debug(f"Person data created: {submission_data.get('id')} for person {person_id}")
+            logger.debug("Person data created: {} for person {}", submission_data.get('id'), person_id)
 
             return PersonDataInDB(**submission_data)
 
         except APIError as e:
-            logger.error(f"Database error while creating person data: {str(e)}")
+            logger.error(f"Database error while creating person data: {e}")
             raise
         except Exception as e:
-            logger.error(f"Unexpected error while creating person data: {str(e)}")
-            raise APIError(f"Failed to create person data: {str(e)}")
+            logger.error(f"Unexpected error while creating person data: {e}")
+            raise APIError(f"Failed to create person data: {e}")
+
+    async def create_many(
+        self,
+        submissions: List[Tuple[UUID, str, str]]
+    ) -> List[PersonDataInDB]:
+        """
+        Create several person data submissions in a single insert.
+
+        Args:
+            submissions: List of (person_id, raw_text, source) tuples
+
+        Returns:
+            List[PersonDataInDB]: Created records, in the same order as
+                the input
+
+        Raises:
+            APIError: If database operation fails
+        """
+        try:
+            logger.debug("PersonDataRepository.create_many() called with {} submissions", len(submissions))
+
+            data = [
+                {
+                    "person_id": str(person_id),
+                    "raw_text": raw_text,
+                    "source": source,
+                }
+                for person_id, raw_text, source in submissions
+            ]
+
+            response = await run_query(
+                self.supabase.client.table(self.table_name)
+                .insert(data)
+            )
+
+            if not response.data or len(response.data) != len(data):
+                logger.error("Unexpected row count from Supabase bulk insert")
+                raise APIError("Failed to create person data: incomplete data returned")
+
+            logger.debug("Created {} person data submissions", len(response.data))
+
+            return PersonDataListAdapter.validate_python(response.data)
+
+        except APIError as e:
+            logger.error(f"Database error while creating person data batch: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error while creating person data batch: {e}")
+            raise APIError(f"Failed to create person data: {e}")
 
     async def get_by_id(self, data_id: UUID) -> Optional[PersonDataInDB]:
         """
@@ -94,30 +142,65 @@ class PersonDataRepository:
             APIError: If database operation fails
         """
         try:
-            logger.debug(f"PersonDataRepository.get_by_id() called for data_id: {data_id}")
+            logger.debug("PersonDataRepository.get_by_id() called for data_id: {}", data_id)
 
-            response = (
+            response = await run_query(
                 self.supabase.client.table(self.table_name)
                 .select("*")
                 .eq("id", str(data_id))
-                .execute()
             )
 
             if not response.data or len(response.data) == 0:
-                logger.debug(f"Person data not found: {data_id}")
+                logger.debug("Person data not found: {}", data_id)
                 return None
 
             submission_data = response.data[0]
-            logger.debug(f"Person data retrieved: {data_id}")
+            logger.debug("Person data retrieved: {}", data_id)
 
             return PersonDataInDB(**submission_data)
 
         except APIError as e:
-            logger.error(f"Database error while reading person data {data_id}: {str(e)}")
+            logger.error(f"Database error while reading person data {data_id}: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error while reading person data {data_id}: {e}")
+            raise APIError(f"Failed to read person data: {e}")
+
+    async def get_by_ids(self, data_ids: List[UUID]) -> List[PersonDataInDB]:
+        """
+        Retrieve several person data submissions by ID in a single query.
+
+        Args:
+            data_ids: UUIDs of the submissions to retrieve
+
+        Returns:
+            List[PersonDataInDB]: Submissions found, ordered by creation time
+                (oldest first); missing IDs are skipped
+
+        Raises:
+            APIError: If database operation fails
+        """
+        if not data_ids:
+            return []
+
+        try:
+            logger.debug("PersonDataRepository.get_by_ids() called with {} IDs", len(data_ids))
+
+            response = await run_query(
+                self.supabase.client.table(self.table_name)
+                .select("*")
+                .in_("id", list(map(str, data_ids)))
+                .order("created_at", desc=False)
+            )
+
+            return PersonDataListAdapter.validate_python(response.data)
+
+        except APIError as e:
+            logger.error(f"Database error while reading person data by ID: {e}")
             raise
         except Exception as e:
-            logger.error(f"Unexpected error while reading person data {data_id}: {str(e)}")
-            raise APIError(f"Failed to read person data: {str(e)}")
+            logger.error(f"Unexpected error while reading person data by ID: {e}")
+            raise APIError(f"Failed to read person data: {e}")
 
     async def get_all_for_person(
         self,
@@ -143,29 +226,83 @@ class PersonDataRepository:
             APIError: If database operation fails
         """
         try:
-            logger.debug(f"PersonDataRepository.get_all_for_person() for person_id: {person_id}")
-            logger.debug(f"  - limit: {limit}, offset: {offset}")
+            logger.debug("PersonDataRepository.get_all_for_person() for person_id: {}", person_id)
+            logger.debug("  - limit: {}, offset: {}", limit, offset)
 
-            response = (
+            response = await run_query(
                 self.supabase.client.table(self.table_name)
                 .select("*")
                 .eq("person_id", str(person_id))
                 .order("created_at", desc=False)  # Oldest first for recomputation
                 .range(offset, offset + limit - 1)
-                .execute()
             )
 
-            submissions = [PersonDataInDB(**item) for item in response.data]
-            logger.debug(f"Retrieved {len(submissions)} person data submissions for {person_id}")
+            submissions = PersonDataListAdapter.validate_python(response.data)
+            logger.debug("Retrieved {} person data submissions for {}", len(submissions), person_id)
 
             return submissions
 
         except APIError as e:
-            logger.error(f"Database error while reading person data for {person_id}: {str(e)}")
+            logger.error(f"Database error while reading person data for {person_id}: {e}")
             raise
         except Exception as e:
-            logger.error(f"Unexpected error while reading person data for {person_id}: {str(e)}")
-            raise APIError(f"Failed to read person data: {str(e)}")
+            logger.error(f"Unexpected error while reading person data for {person_id}: {e}")
+            raise APIError(f"Failed to read person data: {e}")
+
+    async def iter_for_person(
+        self,
+        person_id: UUID,
+        limit: int = 50,
+        offset: int = 0,
+        chunk_size: int = 25
+    ) -> AsyncIterator[PersonDataInDB]:
+        """
+        Iterate over a page of data submissions for a person, fetched in chunks.
+
+        Same ordering as get_all_for_person, but rows are yielded as each
+        chunk arrives so callers can stream them out.
+
+        Args:
+            person_id: UUID of the person
+            limit: Maximum records to yield
+            offset: Number of records to skip
+            chunk_size: Number of records fetched per query
+
+        Yields:
+            PersonDataInDB: Submissions ordered by creation time
+
+        Raises:
+            APIError: If database operation fails
+        """
+        try:
+            logger.debug("PersonDataRepository.iter_for_person() for person_id: {}", person_id)
+            logger.debug("  - limit: {}, offset: {}", limit, offset)
+
+            end = offset + limit
+            start = offset
+            while start < end:
+                stop = min(start + chunk_size, end)
+                response = await run_query(
+                    self.supabase.client.table(self.table_name)
+                    .select("*")
+                    .eq("person_id", str(person_id))
+                    .order("created_at", desc=False)
+                    .range(start, stop - 1)
+                )
+
+                for submission in PersonDataListAdapter.validate_python(response.data):
+                    yield submission
+
+                if len(response.data) < stop - start:
+                    break
+                start = stop
+
+        except APIError as e:
+            logger.error(f"Database error while streaming person data for {person_id}: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error while streaming person data for {person_id}: {e}")
+            raise APIError(f"Failed to stream person data: {e}")
 
     async def get_all_for_person_unordered(self, person_id: UUID) -> List[PersonDataInDB]:
         """
@@ -184,27 +321,26 @@ class PersonDataRepository:
             APIError: If database operation fails
         """
         try:
-            logger.debug(f"PersonDataRepository.get_all_for_person_unordered() for person_id: {person_id}")
+            logger.debug("PersonDataRepository.get_all_for_person_unordered() for person_id: {}", person_id)
 
-            response = (
+            response = await run_query(
                 self.supabase.client.table(self.table_name)
                 .select("*")
                 .eq("person_id", str(person_id))
                 .order("created_at", desc=False)  # Oldest first for recomputation
-                .execute()
             )
 
-            submissions = [PersonDataInDB(**item) for item in response.data]
-            logger.debug(f"Retrieved {len(submissions)} total person data submissions for {person_id}")
+            submissions = PersonDataListAdapter.validate_python(response.data)
+            logger.debug("Retrieved {} total person data submissions for {}", len(submissions), person_id)
 
             return submissions
 
         except APIError as e:
-            logger.error(f"Database error while reading all person data for {person_id}: {str(e)}")
+            logger.error(f"Database error while reading all person data for {person_id}: {e}")
             raise
         except Exception as e:
-            logger.error(f"Unexpected error while reading all person data for {person_id}: {str(e)}")
-            raise APIError(f"Failed to read person data: {str(e)}")
+            logger.error(f"Unexpected error while reading all person data for {person_id}: {e}")
+            raise APIError(f"Failed to read person data: {e}")
 
     async def count_for_person(self, person_id: UUID) -> int:
         """
@@ -220,23 +356,44 @@ class PersonDataRepository:
             APIError: If database operation fails
         """
         try:
-            logger.debug(f"PersonDataRepository.count_for_person() for person_id: {person_id}")
+            logger.debug("PersonDataRepository.count_for_person() for person_id: {}", person_id)
 
-            response = (
+            response = await run_query(
                 self.supabase.client.table(self.table_name)
-                .select("id", count="exact")
+                .select("id", count="exact", head=True)
                 .eq("person_id", str(person_id))
-                .execute()
             )
 
             count = response.count or 0
-            logger.debug(f"Person {person_id} has {count} data submissions")
+            logger.debug("Person {} has {} data submissions", person_id, count)
 
             return count
 
         except APIError as e:
-            logger.error(f"Database error while counting person data for {person_id}: {str(e)}")
+            logger.error(f"Database error while counting person data for {person_id}: {e}")
             raise
         except Exception as e:
-            logger.error(f"Unexpected error while counting person data for {person_id}: {str(e)}")
-            raise APIError(f"Failed to count person data: {str(e)}")
+            logger.error(f"Unexpected error while counting person data for {person_id}: {e}")
+            raise APIError(f"Failed to count person data: {e}")
+
+
+# Global repository instance
+_person_data_repository: Optional[PersonDataRepository] = None
+
+
+def get_person_data_repository() -> PersonDataRepository:
+    """
+    Get the shared person data repository instance.
+
+    Returns:
+        PersonDataRepository instance
+
+    Usage:
+        from app.repositories.person_data_repo import get_person_data_repository
+        repo = get_person_data_repository()
+        submissions = await repo.get_all_for_person(person_id)
+    """
+    global _person_data_repository
+    if _person_data_repository is None:
+        _person_data_repository = PersonDataRepository()
+    return _person_data_repository
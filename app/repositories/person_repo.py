@@ -5,15 +5,43 @@ Provides CRUD operations (Create, Read, Update, Delete) for persons
 with proper error handling and logging.
 """
 
-from typing import List, Optional
-from uuid import UUID
-from app.models.person import PersonInDB
-from app.db.supabase_client import get_supabase_client
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+from app.models.person import PersonInDB, PersonListAdapter, PersonResponse
+from app.db.supabase_client import get_supabase_client, run_query
+from app.core.cache import get_cache, person_row_cache_key
 from app.core.logging import get_logger
 from postgrest.exceptions import APIError
 
 logger = get_logger(__name__)
 
+# Embeds the submission count and current persona version alongside each person
+PERSON_WITH_META_SELECT = "*, person_data(count), personas(version)"
+
+
+def _person_response_from_row(row: Dict[str, Any]) -> PersonResponse:
+    """
+    Build a PersonResponse from a row selected with PERSON_WITH_META_SELECT.
+
+    Args:
+        row: Person row with embedded person_data count and personas version
+
+    Returns:
+        PersonResponse: Person with person_data_count and latest_persona_version
+    """
+    data_counts = row.pop("person_data", None) or []
+    persona = row.pop("personas", None)
+    # One-to-one embeds come back as an object, older PostgREST versions
+    # return a single-element array instead
+    if isinstance(persona, list):
+        persona = persona[0] if persona else None
+
+    return PersonResponse(
+        **row,
+        person_data_count=data_counts[0]["count"] if data_counts else 0,
+        latest_persona_version=persona["version"] if persona else None,
+    )
+
 
 class PersonRepository:
     """Repository for person aggregate root data access."""
@@ -34,6 +62,8 @@ class PersonRepository:
 
         The person is created with optional demographic information.
         Related submissions (person_data) and computed personas are added separately.
+        The ID is generated here and the insert returns the stored row, so
+        creation is a single round trip.
 
         Args:
             first_name: Optional first name of the person
@@ -47,13 +77,13 @@ class PersonRepository:
             APIError: If database operation fails
         """
         try:
-            logger.debug(f"PersonRepository.create() called - creating new person aggregate root")
-            logger.debug(f"  - first_name: {first_name}")
-            logger.debug(f"  - last_name: {last_name}")
-            logger.debug(f"  - gender: {gender}")
+            logger.debug("PersonRepository.create() called - creating new person aggregate root")
+            logger.debug("  - first_name: {}", first_name)
+            logger.debug("  - last_name: {}", last_name)
+            logger.debug("  - gender: {}", gender)
 
             # Build data dict with only non-None values
-            data = {}
+            data = {"id": str(uuid4())}
             if first_name is not None:
                 data["first_name"] = first_name
             if last_name is not None:
@@ -61,10 +91,9 @@ class PersonRepository:
             if gender is not None:
                 data["gender"] = gender
 
-            response = (
+            response = await run_query(
                 self.supabase.client.table(self.table_name)
                 .insert(data)
-                .execute()
             )
 
             if not response.data or len(response.data) == 0:
@@ -72,24 +101,29 @@ class PersonRepository:
                 raise APIError("Failed to create person: no data returned")
 
             person_data = response.data[0]
-            logger.debug(f"Person created successfully with ID: {person_data.get('id')}")
-            logger.debug(f"  - first_name: {person_data.get('first_name')}")
-            logger.debug(f"  - last_name: {person_data.get('last_name')}")
-            logger.debug(f"  - gender: {person_data.get('gender')}")
+            logger.debug("Person created successfully with ID: {}", person_data.get('id'))
+            logger.debug("  - first_name: {}", person_data.get('first_name'))
+            logger.debug("  - last_name: {}", person_data.get('last_name'))
+            logger.debug("  - gender: {}", person_data.get('gender'))
 
-            return PersonInDB(**person_data)
+            person = PersonInDB(**person_data)
+            get_cache().set(person_row_cache_key(person.id), person)
+            return person
 
         except APIError as e:
-            logger.error(f"Database error while creating person: {str(e)}")
+            logger.error(f"Database error while creating person: {e}")
             raise
         except Exception as e:
-            logger.error(f"Unexpected error while creating person: {str(e)}")
-            raise APIError(f"Failed to create person: {str(e)}")
+            logger.error(f"Unexpected error while creating person: {e}")
+            raise APIError(f"Failed to create person: {e}")
 
     async def read(self, person_id: UUID) -> Optional[PersonInDB]:
         """
         Retrieve a person by ID.
 
+        Person rows only change when deleted, so found rows are served
+        from the shared cache until they expire or the person is deleted.
+
         Args:
             person_id: UUID of the person to retrieve
 
@@ -100,30 +134,76 @@ class PersonRepository:
             APIError: If database operation fails
         """
         try:
-            logger.debug(f"PersonRepository.read() called for person_id: {person_id}")
+            cache = get_cache()
+            cache_key = person_row_cache_key(person_id)
+            person = cache.get(cache_key)
+            if person is not None:
+                return person
+
+            logger.debug("PersonRepository.read() called for person_id: {}", person_id)
 
-            response = (
+            response = await run_query(
                 self.supabase.client.table(self.table_name)
                 .select("*")
                 .eq("id", str(person_id))
-                .execute()
             )
 
             if not response.data or len(response.data) == 0:
-                logger.debug(f"Person not found: {person_id}")
+                logger.debug("Person not found: {}", person_id)
                 return None
 
-            person_data = response.data[0]
-            logger.debug(f"Person retrieved successfully: {person_id}")
+            person = PersonInDB(**response.data[0])
+            logger.debug("Person retrieved successfully: {}", person_id)
+
+            cache.set(cache_key, person)
+            return person
+
+        except APIError as e:
+            logger.error(f"Database error while reading person {person_id}: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error while reading person {person_id}: {e}")
+            raise APIError(f"Failed to read person: {e}")
+
+    async def read_with_meta(self, person_id: UUID) -> Optional[PersonResponse]:
+        """
+        Retrieve a person with metadata in a single query.
+
+        The data submission count and latest persona version are embedded
+        in the same request instead of being fetched separately.
+
+        Args:
+            person_id: UUID of the person to retrieve
+
+        Returns:
+            PersonResponse: Person with metadata if found, None otherwise
 
-            return PersonInDB(**person_data)
+        Raises:
+            APIError: If database operation fails
+        """
+        try:
+            logger.debug("PersonRepository.read_with_meta() called for person_id: {}", person_id)
+
+            response = await run_query(
+                self.supabase.client.table(self.table_name)
+                .select(PERSON_WITH_META_SELECT)
+                .eq("id", str(person_id))
+            )
+
+            if not response.data or len(response.data) == 0:
+                logger.debug("Person not found: {}", person_id)
+                return None
+
+            logger.debug("Person retrieved with metadata: {}", person_id)
+
+            return _person_response_from_row(response.data[0])
 
         except APIError as e:
-            logger.error(f"Database error while reading person {person_id}: {str(e)}")
+            logger.error(f"Database error while reading person {person_id}: {e}")
             raise
         except Exception as e:
-            logger.error(f"Unexpected error while reading person {person_id}: {str(e)}")
-            raise APIError(f"Failed to read person: {str(e)}")
+            logger.error(f"Unexpected error while reading person {person_id}: {e}")
+            raise APIError(f"Failed to read person: {e}")
 
     async def read_all(self, limit: int = 50, offset: int = 0) -> List[PersonInDB]:
         """
@@ -140,27 +220,117 @@ class PersonRepository:
             APIError: If database operation fails
         """
         try:
-            logger.debug(f"PersonRepository.read_all() called with limit={limit}, offset={offset}")
+            logger.debug("PersonRepository.read_all() called with limit={}, offset={}", limit, offset)
 
-            response = (
+            response = await run_query(
                 self.supabase.client.table(self.table_name)
                 .select("*")
                 .order("created_at", desc=True)
                 .range(offset, offset + limit - 1)
-                .execute()
             )
 
-            persons = [PersonInDB(**person) for person in response.data]
-            logger.debug(f"Retrieved {len(persons)} persons")
+            persons = PersonListAdapter.validate_python(response.data)
+            logger.debug("Retrieved {} persons", len(persons))
 
             return persons
 
         except APIError as e:
-            logger.error(f"Database error while reading all persons: {str(e)}")
+            logger.error(f"Database error while reading all persons: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error while reading all persons: {e}")
+            raise APIError(f"Failed to read persons: {e}")
+
+    async def read_all_with_meta(
+        self, limit: int = 50, offset: int = 0
+    ) -> Tuple[List[PersonResponse], int]:
+        """
+        Retrieve a page of persons with metadata and the total count.
+
+        The data submission count, latest persona version and total number
+        of persons all come back from a single query instead of one count
+        and one persona lookup per person.
+
+        Args:
+            limit: Maximum number of records to return (default 50)
+            offset: Number of records to skip (default 0)
+
+        Returns:
+            Tuple of (persons with metadata, total count)
+
+        Raises:
+            APIError: If database operation fails
+        """
+        try:
+            logger.debug("PersonRepository.read_all_with_meta() called with limit={}, offset={}", limit, offset)
+
+            response = await run_query(
+                self.supabase.client.table(self.table_name)
+                .select(PERSON_WITH_META_SELECT, count="exact")
+                .order("created_at", desc=True)
+                .range(offset, offset + limit - 1)
+            )
+
+            persons = [_person_response_from_row(row) for row in response.data]
+            total = response.count or 0
+            logger.debug("Retrieved {} persons (total: {})", len(persons), total)
+
+            return persons, total
+
+        except APIError as e:
+            logger.error(f"Database error while reading all persons: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error while reading all persons: {e}")
+            raise APIError(f"Failed to read persons: {e}")
+
+    async def iter_with_meta(
+        self, limit: int = 50, offset: int = 0, chunk_size: int = 25
+    ) -> AsyncIterator[PersonResponse]:
+        """
+        Iterate over a page of persons with metadata, fetched in chunks.
+
+        Rows are yielded as each chunk arrives so callers can stream them
+        out while the next chunk is still being fetched.
+
+        Args:
+            limit: Maximum number of records to yield (default 50)
+            offset: Number of records to skip (default 0)
+            chunk_size: Number of records fetched per query (default 25)
+
+        Yields:
+            PersonResponse: Person with data count and latest persona version
+
+        Raises:
+            APIError: If database operation fails
+        """
+        try:
+            logger.debug("PersonRepository.iter_with_meta() called with limit={}, offset={}", limit, offset)
+
+            end = offset + limit
+            start = offset
+            while start < end:
+                stop = min(start + chunk_size, end)
+                response = await run_query(
+                    self.supabase.client.table(self.table_name)
+                    .select(PERSON_WITH_META_SELECT)
+                    .order("created_at", desc=True)
+                    .range(start, stop - 1)
+                )
+
+                for row in response.data:
+                    yield _person_response_from_row(row)
+
+                if len(response.data) < stop - start:
+                    break
+                start = stop
+
+        except APIError as e:
+            logger.error(f"Database error while streaming persons: {e}")
             raise
         except Exception as e:
-            logger.error(f"Unexpected error while reading all persons: {str(e)}")
-            raise APIError(f"Failed to read persons: {str(e)}")
+            logger.error(f"Unexpected error while streaming persons: {e}")
+            raise APIError(f"Failed to stream persons: {e}")
 
     async def delete(self, person_id: UUID) -> bool:
         """
@@ -179,31 +349,31 @@ class PersonRepository:
             APIError: If database operation fails
         """
         try:
-            logger.debug(f"PersonRepository.delete() called for person_id: {person_id}")
-
-            # Check if person exists
-            existing = await self.read(person_id)
-            if not existing:
-                logger.warning(f"Person not found for deletion: {person_id}")
-                return False
+            logger.debug("PersonRepository.delete() called for person_id: {}", person_id)
 
-            # Delete person (cascade delete handles related records)
-            response = (
+            # Delete person (cascade delete handles related records); the
+            # deleted IDs come back, so an empty result means it didn't exist
+            response = await run_query(
                 self.supabase.client.table(self.table_name)
                 .delete()
                 .eq("id", str(person_id))
-                .execute()
+                .select("id")
             )
+            get_cache().delete(person_row_cache_key(person_id))
+
+            if not response.data:
+                logger.warning(f"Person not found for deletion: {person_id}")
+                return False
 
-            logger.debug(f"Person deleted successfully: {person_id}")
+            logger.debug("Person deleted successfully: {}", person_id)
             return True
 
         except APIError as e:
-            logger.error(f"Database error while deleting person {person_id}: {str(e)}")
+            logger.error(f"Database error while deleting person {person_id}: {e}")
             raise
         except Exception as e:
-            logger.error(f"Unexpected error while deleting person {person_id}: {str(e)}")
-            raise APIError(f"Failed to delete person: {str(e)}")
+            logger.error(f"Unexpected error while deleting person {person_id}: {e}")
+            raise APIError(f"Failed to delete person: {e}")
 
     async def count(self) -> int:
         """
@@ -216,22 +386,43 @@ class PersonRepository:
             APIError: If database operation fails
         """
         try:
-            logger.debug(f"PersonRepository.count() called")
+            logger.debug("PersonRepository.count() called")
 
-            response = (
+            response = await run_query(
                 self.supabase.client.table(self.table_name)
-                .select("id", count="exact")
-                .execute()
+                .select("id", count="exact", head=True)
             )
 
             count = response.count or 0
-            logger.debug(f"Total persons: {count}")
+            logger.debug("Total persons: {}", count)
 
             return count
 
         except APIError as e:
-            logger.error(f"Database error while counting persons: {str(e)}")
+            logger.error(f"Database error while counting persons: {e}")
             raise
         except Exception as e:
-            logger.error(f"Unexpected error while counting persons: {str(e)}")
-            raise APIError(f"Failed to count persons: {str(e)}")
+            logger.error(f"Unexpected error while counting persons: {e}")
+            raise APIError(f"Failed to count persons: {e}")
+
+
+# Global repository instance
+_person_repository: Optional[PersonRepository] = None
+
+
+def get_person_repository() -> PersonRepository:
+    """
+    Get the shared person repository instance.
+
+    Returns:
+        PersonRepository instance
+
+    Usage:
+        from app.repositories.person_repo import get_person_repository
+        repo = get_person_repository()
+        person = await repo.read(person_id)
+    """
+    global _person_repository
+    if _person_repository is None:
+        _person_repository = PersonRepository()
+    return _person_repository
@@ -5,20 +5,49 @@ Provides CRUD operations (Create, Read, Update, Delete) for personas
 with proper error handling and logging.
 """
 
-from typing import List, Optional, Dict, Any
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from uuid import UUID
 from app.models.persona import (
     PersonaCreate,
     PersonaUpdate,
     PersonaInDB,
+    PersonaListAdapter,
     PersonaWithHistory,
 )
-from app.db.supabase_client import get_supabase_client
+from app.models.person_data import PersonDataInDB
+from app.db.supabase_client import get_supabase_client, run_query
+from app.core.cache import get_cache, persona_cache_key, persona_row_cache_key
+from app.core.exceptions import NotFoundError
 from app.core.logging import get_logger
+from app.repositories.person_data_repo import get_person_data_repository
 from postgrest.exceptions import APIError
 
 logger = get_logger(__name__)
 
+# OFFSET pages past this many rows make Postgres scan every skipped row;
+# deeper reads should page with read_page instead
+DEEP_OFFSET_WARNING = 1000
+
+
+def _cache_persona(persona: PersonaInDB) -> PersonaInDB:
+    """
+    Store a persona in the shared cache under its ID and its person's ID.
+
+    Every write below refreshes both entries, so cached reads never serve a
+    row older than the last write made through this process.
+
+    Args:
+        persona: Persona row as stored in the database
+
+    Returns:
+        The same persona, for chaining
+    """
+    cache = get_cache()
+    cache.set(persona_row_cache_key(persona.id), persona)
+    cache.set(persona_cache_key(persona.person_id), persona)
+    return persona
+
 
 class PersonaRepository:
     """Repository for persona data access."""
@@ -43,78 +72,51 @@ class PersonaRepository:
             APIError: If database operation fails
         """
         try:
-            # Detailed input validation logging
-            logger.debug(f"PersonaRepository.create() called")
-            logger.debug(f"  - raw_text type: {type(raw_text)}, length: {len(raw_text) if isinstance(raw_text, str) else 'N/A'}")
-            logger.debug(f"  - raw_text preview: {raw_text[:100] if isinstance(raw_text, str) else repr(raw_text)}")
-            logger.debug(f"  - persona_json type: {type(persona_json)}")
-            logger.debug(f"  - persona_json is dict: {isinstance(persona_json, dict)}")
-
-            if isinstance(persona_json, dict):
-                logger.debug(f"  - persona_json keys: {list(persona_json.keys())}")
-                logger.debug(f"  - persona_json size: {len(str(persona_json))} chars")
-                logger.debug(f"  - persona_json preview: {str(persona_json)[:300]}")
-            else:
-                logger.debug(f"  - persona_json is NOT a dict! It is: {repr(persona_json)[:300]}")
-
-            logger.debug(f"Creating persona from text: {raw_text[:50] if isinstance(raw_text, str) else repr(raw_text)[:50]}...")
+            # Input diagnostics are only computed when a DEBUG sink is enabled
+            logger.opt(lazy=True).debug(
+                "PersonaRepository.create() called - raw_text: {}, persona_json: {}",
+                lambda: f"{len(raw_text)} chars" if isinstance(raw_text, str) else repr(raw_text)[:100],
+                lambda: (
+                    f"{len(str(persona_json))} chars, keys {list(persona_json)}"
+                    if isinstance(persona_json, dict)
+                    else f"NOT a dict: {repr(persona_json)[:300]}"
+                ),
+            )
 
             data = {
                 "raw_text": raw_text,
                 "persona": persona_json,
             }
 
-            logger.debug(f"About to insert data into '{self.table_name}' table")
-            logger.debug(f"Data structure being inserted:")
-            logger.debug(f"  - 'raw_text' key present: {'raw_text' in data}")
-            logger.debug(f"  - 'persona' key present: {'persona' in data}")
-            logger.debug(f"  - data['raw_text'] type: {type(data['raw_text'])}")
-            logger.debug(f"  - data['persona'] type: {type(data['persona'])}")
-
-            response = (
+            response = await run_query(
                 self.supabase.client.table(self.table_name)
                 .insert(data)
-                .execute()
             )
 
-            logger.debug(f"Supabase insert response received")
-            logger.debug(f"  - response type: {type(response)}")
-            logger.debug(f"  - response.data available: {response.data is not None}")
-
             if not response.data:
                 logger.error(f"No data returned from insert operation. Response: {response}")
-                raise ValueError("No data returned from insert operation")
+                raise APIError("Failed to create persona: no data returned")
 
             result = response.data[0]
-            logger.debug(f"Database returned record:")
-            logger.debug(f"  - record type: {type(result)}")
-            logger.debug(f"  - record keys: {list(result.keys()) if isinstance(result, dict) else 'NOT A DICT'}")
-            logger.debug(f"  - record['id']: {result.get('id', 'KEY NOT FOUND')}")
-            logger.debug(f"  - record['raw_text'] type: {type(result.get('raw_text', 'NOT FOUND'))}")
-            logger.debug(f"  - record['persona'] type: {type(result.get('persona', 'NOT FOUND'))}")
+            logger.opt(lazy=True).debug("Database returned record keys: {}", lambda: list(result))
 
             logger.info(f"Persona created successfully: {result['id']}")
 
-            logger.debug(f"About to instantiate PersonaInDB(**result)")
-            logger.debug(f"  - result keys being passed: {list(result.keys())}")
-
-            return PersonaInDB(**result)
+            return _cache_persona(PersonaInDB(**result))
         except APIError as e:
             logger.error(f"API error creating persona: {e}")
-            logger.error(f"  - APIError type: {type(e).__name__}")
-            logger.error(f"  - APIError details: {str(e)}")
             raise
         except Exception as e:
-            logger.error(f"Error creating persona: {e}")
-            logger.error(f"  - Exception type: {type(e).__name__}")
-            logger.error(f"  - Exception args: {e.args}")
-            logger.error(f"  - Full traceback:", exc_info=True)
+            logger.error(f"Error creating persona: {type(e).__name__}: {e}")
             raise
 
     async def read(self, persona_id: UUID) -> Optional[PersonaInDB]:
         """
         Read a persona by ID.
 
+        Found personas are served from the shared cache until they expire
+        or are written again.
+
         Args:
             persona_id: UUID of the persona
 
@@ -125,23 +127,26 @@ class PersonaRepository:
             APIError: If database operation fails
         """
         try:
-            logger.debug(f"Reading persona: {persona_id}")
+            persona = get_cache().get(persona_row_cache_key(persona_id))
+            if persona is not None:
+                return persona
+
+            logger.debug("Reading persona: {}", persona_id)
 
-            response = (
+            response = await run_query(
                 self.supabase.client.table(self.table_name)
                 .select("*")
                 .eq("id", str(persona_id))
-                .execute()
             )
 
             if not response.data:
-                logger.debug(f"Persona not found: {persona_id}")
+                logger.debug("Persona not found: {}", persona_id)
                 return None
 
             result = response.data[0]
-            logger.debug(f"Persona retrieved: {persona_id}")
+            logger.debug("Persona retrieved: {}", persona_id)
 
-            return PersonaInDB(**result)
+            return _cache_persona(PersonaInDB(**result))
         except APIError as e:
             logger.error(f"API error reading persona: {e}")
             raise
@@ -149,6 +154,51 @@ class PersonaRepository:
             logger.error(f"Error reading persona: {e}")
             raise
 
+    async def read_many(self, persona_ids: List[UUID]) -> Dict[UUID, PersonaInDB]:
+        """
+        Read several personas by ID in a single query.
+
+        Use this instead of calling read() in a loop. Cached personas are
+        served from the cache; only the rest are fetched.
+
+        Args:
+            persona_ids: UUIDs of the personas
+
+        Returns:
+            Dict of found personas keyed by persona ID; missing IDs are absent
+
+        Raises:
+            APIError: If database operation fails
+        """
+        try:
+            cache = get_cache()
+            personas: Dict[UUID, PersonaInDB] = {}
+            missing: List[str] = []
+            for persona_id in dict.fromkeys(persona_ids):
+                persona = cache.get(persona_row_cache_key(persona_id))
+                if persona is not None:
+                    personas[persona.id] = persona
+                else:
+                    missing.append(str(persona_id))
+
+            if missing:
+                logger.debug("Reading {} personas by ID", len(missing))
+                response = await run_query(
+                    self.supabase.client.table(self.table_name)
+                    .select("*")
+                    .in_("id", missing)
+                )
+                for persona in PersonaListAdapter.validate_python(response.data):
+                    personas[persona.id] = _cache_persona(persona)
+
+            return personas
+        except APIError as e:
+            logger.error(f"API error reading personas by ID: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Error reading personas by ID: {e}")
+            raise
+
     async def read_all(
         self, limit: int = 10, offset: int = 0
     ) -> tuple[List[PersonaInDB], int]:
@@ -166,27 +216,23 @@ class PersonaRepository:
             APIError: If database operation fails
         """
         try:
-            logger.debug(f"Reading personas: limit={limit}, offset={offset}")
-
-            # Get total count
-            count_response = (
+            logger.debug("Reading personas: limit={}, offset={}", limit, offset)
+            if offset > DEEP_OFFSET_WARNING:
+                logger.warning(
+                    "Deep OFFSET pagination of personas (offset={}); use read_page", offset
+                )
+
+            # The page and the total count come back from a single query
+            response = await run_query(
                 self.supabase.client.table(self.table_name)
-                .select("id", count="exact")
-                .execute()
-            )
-            total = count_response.count or 0
-
-            # Get paginated results
-            response = (
-                self.supabase.client.table(self.table_name)
-                .select("*")
+                .select("*", count="exact")
                 .order("created_at", desc=True)
                 .range(offset, offset + limit - 1)
-                .execute()
             )
+            total = response.count or 0
 
-            personas = [PersonaInDB(**item) for item in response.data]
-            logger.debug(f"Retrieved {len(personas)} personas (total: {total})")
+            personas = PersonaListAdapter.validate_python(response.data)
+            logger.debug("Retrieved {} personas (total: {})", len(personas), total)
 
             return personas, total
         except APIError as e:
@@ -196,6 +242,62 @@ class PersonaRepository:
             logger.error(f"Error reading personas: {e}")
             raise
 
+    async def read_page(
+        self,
+        limit: int = 10,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> Tuple[List[PersonaInDB], Optional[Tuple[datetime, UUID]]]:
+        """
+        Read one page of personas, newest first, using a keyset cursor.
+
+        Pages are located by seeking past the last (created_at, id) seen
+        rather than by OFFSET, so every page costs the same however deep it is.
+
+        Args:
+            limit: Number of items per page
+            after: Cursor returned with the previous page, or None for the first
+
+        Returns:
+            Tuple of (list of personas, cursor for the next page or None when
+            this was the last page)
+
+        Raises:
+            APIError: If database operation fails
+        """
+        try:
+            logger.debug("Reading persona page: limit={}, after={}", limit, after)
+
+            query = (
+                self.supabase.client.table(self.table_name)
+                .select("*")
+                .order("created_at", desc=True)
+                .order("id", desc=True)
+                .limit(limit)
+            )
+            if after is not None:
+                created_at, persona_id = after
+                ts = created_at.isoformat()
+                query = query.or_(
+                    f'created_at.lt."{ts}",'
+                    f'and(created_at.eq."{ts}",id.lt.{persona_id})'
+                )
+
+            response = await run_query(query)
+            personas = PersonaListAdapter.validate_python(response.data)
+
+            next_cursor = None
+            if len(personas) == limit:
+                last = personas[-1]
+                next_cursor = (last.created_at, last.id)
+
+            return personas, next_cursor
+        except APIError as e:
+            logger.error(f"API error reading persona page: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Error reading persona page: {e}")
+            raise
+
     async def update(
         self, persona_id: UUID, update_data: PersonaUpdate
     ) -> PersonaInDB:
@@ -211,10 +313,10 @@ class PersonaRepository:
 
         Raises:
             APIError: If database operation fails
-            ValueError: If persona not found
+            NotFoundError: If persona not found
         """
         try:
-            logger.debug(f"Updating persona: {persona_id}")
+            logger.debug("Updating persona: {}", persona_id)
 
             # Build update data (only non-None fields)
             data = update_data.model_dump(exclude_unset=True)
@@ -222,21 +324,20 @@ class PersonaRepository:
                 logger.debug("No fields to update")
                 return await self.read(persona_id)
 
-            response = (
+            response = await run_query(
                 self.supabase.client.table(self.table_name)
                 .update(data)
                 .eq("id", str(persona_id))
-                .execute()
             )
 
             if not response.data:
                 logger.warning(f"Persona not found for update: {persona_id}")
-                raise ValueError(f"Persona not found: {persona_id}")
+                raise NotFoundError(f"Persona not found: {persona_id}")
 
             result = response.data[0]
             logger.info(f"Persona updated: {persona_id}")
 
-            return PersonaInDB(**result)
+            return _cache_persona(PersonaInDB(**result))
         except APIError as e:
             logger.error(f"API error updating persona: {e}")
             raise
@@ -258,19 +359,26 @@ class PersonaRepository:
             APIError: If database operation fails
         """
         try:
-            logger.debug(f"Deleting persona: {persona_id}")
+            logger.debug("Deleting persona: {}", persona_id)
 
-            response = (
+            # Only the keys needed for cache eviction come back, not the
+            # deleted persona body
+            response = await run_query(
                 self.supabase.client.table(self.table_name)
                 .delete()
                 .eq("id", str(persona_id))
-                .execute()
+                .select("id", "person_id")
             )
 
+            get_cache().delete(persona_row_cache_key(persona_id))
             if not response.data:
-                logger.debug(f"Persona not found for deletion: {persona_id}")
+                logger.debug("Persona not found for deletion: {}", persona_id)
                 return False
 
+            person_id = response.data[0].get("person_id")
+            if person_id:
+                get_cache().delete(persona_cache_key(person_id))
+
             logger.info(f"Persona deleted: {persona_id}")
             return True
         except APIError as e:
@@ -280,6 +388,47 @@ class PersonaRepository:
             logger.error(f"Error deleting persona: {e}")
             raise
 
+    async def iter_all(
+        self, limit: int = 1000, chunk_size: int = 100
+    ) -> AsyncIterator[PersonaInDB]:
+        """
+        Iterate over personas, newest first, fetched in chunks.
+
+        Same ordering as read_all, but rows are yielded as each chunk
+        arrives so callers can stream them out. Chunks are fetched with
+        read_page, so later chunks cost no more than the first.
+
+        Args:
+            limit: Maximum personas to yield
+            chunk_size: Number of personas fetched per query
+
+        Yields:
+            PersonaInDB: Personas ordered by creation time, newest first
+
+        Raises:
+            APIError: If database operation fails
+        """
+        try:
+            logger.debug("Streaming personas: limit={}, chunk_size={}", limit, chunk_size)
+
+            remaining = limit
+            cursor = None
+            while remaining > 0:
+                personas, cursor = await self.read_page(
+                    min(chunk_size, remaining), after=cursor
+                )
+
+                for persona in personas:
+                    yield persona
+
+                if cursor is None:
+                    break
+                remaining -= len(personas)
+
+        except APIError as e:
+            logger.error(f"API error streaming personas: {e}")
+            raise
+
     async def count(self) -> int:
         """
         Get total count of personas.
@@ -291,13 +440,12 @@ class PersonaRepository:
             APIError: If database operation fails
         """
         try:
-            response = (
+            response = await run_query(
                 self.supabase.client.table(self.table_name)
-                .select("id", count="exact")
-                .execute()
+                .select("id", count="exact", head=True)
             )
             count = response.count or 0
-            logger.debug(f"Total personas: {count}")
+            logger.debug("Total personas: {}", count)
             return count
         except APIError as e:
             logger.error(f"API error counting personas: {e}")
@@ -315,7 +463,8 @@ class PersonaRepository:
         Retrieve the current persona for a person.
 
         Each person has exactly one persona record (UNIQUE constraint on person_id).
-        This retrieves the latest/current computed persona for the person.
+        This retrieves the latest/current computed persona for the person,
+        sharing the cache entry GET /v1/person/{id}/persona uses.
 
         Args:
             person_id: UUID of the person (not the persona)
@@ -327,30 +476,160 @@ class PersonaRepository:
             APIError: If database operation fails
         """
         try:
-            logger.debug(f"PersonaRepository.get_by_person_id() for person_id: {person_id}")
+            persona = get_cache().get(persona_cache_key(person_id))
+            if persona is not None:
+                return persona
 
-            response = (
+            logger.debug("PersonaRepository.get_by_person_id() for person_id: {}", person_id)
+
+            response = await run_query(
                 self.supabase.client.table(self.table_name)
                 .select("*")
                 .eq("person_id", str(person_id))
-                .execute()
             )
 
             if not response.data or len(response.data) == 0:
-                logger.debug(f"No persona found for person: {person_id}")
+                logger.debug("No persona found for person: {}", person_id)
                 return None
 
             persona_data = response.data[0]
-            logger.debug(f"Persona retrieved for person {person_id}")
+            logger.debug("Persona retrieved for person {}", person_id)
+
+            return _cache_persona(PersonaInDB(**persona_data))
+
+        except APIError as e:
+            logger.error(f"Database error reading persona for person {person_id}: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error reading persona for person {person_id}: {e}")
+            raise APIError(f"Failed to read persona for person: {e}")
+
+    async def get_by_person_id_with_lineage(
+        self, person_id: UUID
+    ) -> Tuple[Optional[PersonaInDB], List[PersonDataInDB]]:
+        """
+        Retrieve a person's current persona together with the data it was computed from.
 
-            return PersonaInDB(**persona_data)
+        The lineage rows listed in computed_from_data_ids are fetched with one
+        companion query rather than one read per ID.
+
+        Args:
+            person_id: UUID of the person (not the persona)
 
+        Returns:
+            Tuple of (current persona or None, person data submissions it was
+            computed from, oldest first)
+
+        Raises:
+            APIError: If database operation fails
+        """
+        persona = await self.get_by_person_id(person_id)
+        if persona is None:
+            return None, []
+
+        submissions = await get_person_data_repository().get_by_ids(
+            persona.computed_from_data_ids
+        )
+        return persona, submissions
+
+    async def get_by_person_ids(
+        self, person_ids: List[UUID]
+    ) -> Dict[UUID, PersonaInDB]:
+        """
+        Retrieve the current personas for several people in a single query.
+
+        Use this instead of calling get_by_person_id() in a loop. Cached
+        personas are served from the cache; only the rest are fetched.
+
+        Args:
+            person_ids: UUIDs of the people (not the personas)
+
+        Returns:
+            Dict of found personas keyed by person ID; people without a
+            persona are absent
+
+        Raises:
+            APIError: If database operation fails
+        """
+        try:
+            cache = get_cache()
+            personas: Dict[UUID, PersonaInDB] = {}
+            missing: List[str] = []
+            for person_id in dict.fromkeys(person_ids):
+                persona = cache.get(persona_cache_key(person_id))
+                if persona is not None:
+                    personas[persona.person_id] = persona
+                else:
+                    missing.append(str(person_id))
+
+            if missing:
+                logger.debug("Reading personas for {} people", len(missing))
+                response = await run_query(
+                    self.supabase.client.table(self.table_name)
+                    .select("*")
+                    .in_("person_id", missing)
+                )
+                for persona in PersonaListAdapter.validate_python(response.data):
+                    personas[persona.person_id] = _cache_persona(persona)
+
+            return personas
         except APIError as e:
-            logger.error(f"Database error reading persona for person {person_id}: {str(e)}")
+            logger.error(f"Database error reading personas for people: {e}")
             raise
         except Exception as e:
-            logger.error(f"Unexpected error reading persona for person {person_id}: {str(e)}")
-            raise APIError(f"Failed to read persona for person: {str(e)}")
+            logger.error(f"Unexpected error reading personas for people: {e}")
+            raise APIError(f"Failed to read personas for people: {e}")
+
+    async def get_with_person(
+        self, person_id: UUID
+    ) -> Tuple[bool, Optional[PersonaInDB]]:
+        """
+        Check that a person exists and fetch their current persona in one query.
+
+        Embeds the persona in a select on the persons table, so a single
+        round trip answers both "does the person exist?" and "what is their
+        current persona?".
+
+        Args:
+            person_id: UUID of the person (not the persona)
+
+        Returns:
+            Tuple of (person exists, current persona or None)
+
+        Raises:
+            APIError: If database operation fails
+        """
+        try:
+            logger.debug("PersonaRepository.get_with_person() for person_id: {}", person_id)
+
+            response = await run_query(
+                self.supabase.client.table("persons")
+                .select(f"id, {self.table_name}(*)")
+                .eq("id", str(person_id))
+            )
+
+            if not response.data:
+                logger.debug("Person not found: {}", person_id)
+                return False, None
+
+            # One-to-one embeds come back as an object, older PostgREST
+            # versions return a single-element array instead
+            persona_data = response.data[0].get(self.table_name)
+            if isinstance(persona_data, list):
+                persona_data = persona_data[0] if persona_data else None
+
+            if not persona_data:
+                logger.debug("No persona found for person: {}", person_id)
+                return True, None
+
+            return True, PersonaInDB(**persona_data)
+
+        except APIError as e:
+            logger.error(f"Database error reading persona for person {person_id}: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error reading persona for person {person_id}: {e}")
+            raise APIError(f"Failed to read persona for person: {e}")
 
     async def create_for_person(
         self,
@@ -375,21 +654,20 @@ class PersonaRepository:
             APIError: If database operation fails
         """
         try:
-            logger.debug(f"PersonaRepository.create_for_person() for person_id: {person_id}")
-            logger.debug(f"  - version: {version}")
-            logger.debug(f"  - data_ids: {data_ids}")
+            logger.debug("PersonaRepository.create_for_person() for person_id: {}", person_id)
+            logger.debug("  - version: {}", version)
+            logger.debug("  - data_ids: {}", data_ids)
 
             data = {
                 "person_id": str(person_id),
                 "persona": persona_json,
-                "computed_from_data_ids": [str(uid) for uid in data_ids],
+                "computed_from_data_ids": list(map(str, data_ids)),
                 "version": version,
             }
 
-            response = (
+            response = await run_query(
                 self.supabase.client.table(self.table_name)
                 .insert(data)
-                .execute()
             )
 
             if not response.data or len(response.data) == 0:
@@ -399,14 +677,14 @@ class PersonaRepository:
             persona_data = response.data[0]
             logger.info(f"Persona created for person {person_id} with version {version}")
 
-            return PersonaInDB(**persona_data)
+            return _cache_persona(PersonaInDB(**persona_data))
 
         except APIError as e:
-            logger.error(f"Database error creating persona for person {person_id}: {str(e)}")
+            logger.error(f"Database error creating persona for person {person_id}: {e}")
             raise
         except Exception as e:
-            logger.error(f"Unexpected error creating persona for person {person_id}: {str(e)}")
-            raise APIError(f"Failed to create persona: {str(e)}")
+            logger.error(f"Unexpected error creating persona for person {person_id}: {e}")
+            raise APIError(f"Failed to create persona: {e}")
 
     async def update_by_person_id(
         self,
@@ -434,21 +712,20 @@ class PersonaRepository:
             APIError: If database operation fails
         """
         try:
-            logger.debug(f"PersonaRepository.update_by_person_id() for person_id: {person_id}")
-            logger.debug(f"  - new version: {version}")
-            logger.debug(f"  - new data_ids count: {len(data_ids)}")
+            logger.debug("PersonaRepository.update_by_person_id() for person_id: {}", person_id)
+            logger.debug("  - new version: {}", version)
+            logger.debug("  - new data_ids count: {}", len(data_ids))
 
             update_data = {
                 "persona": persona_json,
-                "computed_from_data_ids": [str(uid) for uid in data_ids],
+                "computed_from_data_ids": list(map(str, data_ids)),
                 "version": version,
             }
 
-            response = (
+            response = await run_query(
                 self.supabase.client.table(self.table_name)
                 .update(update_data)
                 .eq("person_id", str(person_id))
-                .execute()
             )
 
             if not response.data or len(response.data) == 0:
@@ -458,14 +735,14 @@ class PersonaRepository:
             persona_data = response.data[0]
             logger.info(f"Persona updated for person {person_id} to version {version}")
 
-            return PersonaInDB(**persona_data)
+            return _cache_persona(PersonaInDB(**persona_data))
 
         except APIError as e:
-            logger.error(f"Database error updating persona for person {person_id}: {str(e)}")
+            logger.error(f"Database error updating persona for person {person_id}: {e}")
             raise
         except Exception as e:
-            logger.error(f"Unexpected error updating persona for person {person_id}: {str(e)}")
-            raise APIError(f"Failed to update persona: {str(e)}")
+            logger.error(f"Unexpected error updating persona for person {person_id}: {e}")
+            raise APIError(f"Failed to update persona: {e}")
 
     async def upsert(
         self,
@@ -479,6 +756,8 @@ class PersonaRepository:
 
         Atomically creates a new persona if one doesn't exist,
         or updates the existing one. Handles version tracking.
+        Runs as a single INSERT ... ON CONFLICT (person_id) DO UPDATE, so
+        there is no separate existence check to race against.
 
         Args:
             person_id: UUID of the person
@@ -493,26 +772,103 @@ class PersonaRepository:
             APIError: If database operation fails
         """
         try:
-            logger.debug(f"PersonaRepository.upsert() for person_id: {person_id}")
+            logger.debug("PersonaRepository.upsert() for person_id: {}", person_id)
+            logger.debug("  - version: {}", version)
+            logger.debug("  - data_ids count: {}", len(data_ids))
 
-            # Check if persona exists
-            existing = await self.get_by_person_id(person_id)
+            data = {
+                "person_id": str(person_id),
+                "persona": persona_json,
+                "computed_from_data_ids": list(map(str, data_ids)),
+                "version": version,
+            }
 
-            if existing:
-                # Update existing
-                return await self.update_by_person_id(person_id, persona_json, data_ids, version)
-            else:
-                # Create new
-                return await self.create_for_person(person_id, persona_json, data_ids, version)
+            # person_id is UNIQUE; an existing row keeps its id and created_at
+            response = await run_query(
+                self.supabase.client.table(self.table_name)
+                .upsert(data, on_conflict="person_id")
+            )
 
+            if not response.data:
+                logger.error("No data returned from persona upsert")
+                raise APIError("Failed to upsert persona: no data returned")
+
+            logger.info(f"Persona saved for person {person_id} with version {version}")
+
+            return _cache_persona(PersonaInDB(**response.data[0]))
+
+        except APIError as e:
+            logger.error(f"Database error in upsert for person {person_id}: {e}")
+            raise
         except Exception as e:
-            logger.error(f"Error in upsert for person {person_id}: {str(e)}")
+            logger.error(f"Unexpected error in upsert for person {person_id}: {e}")
+            raise APIError(f"Failed to upsert persona: {e}")
+
+
+    async def upsert_many(
+        self,
+        personas: List[Tuple[UUID, Dict[str, Any], List[UUID], int]]
+    ) -> List[PersonaInDB]:
+        """
+        Create or update the personas of several people in a single statement.
+
+        Runs one multi-row INSERT ... ON CONFLICT (person_id) DO UPDATE.
+        Postgres rejects a statement that touches the same row twice, so
+        each person may appear at most once.
+
+        Args:
+            personas: List of (person_id, persona_json, data_ids, version) tuples
+
+        Returns:
+            List[PersonaInDB]: Saved personas, in no particular order
+
+        Raises:
+            APIError: If database operation fails
+        """
+        try:
+            logger.debug("PersonaRepository.upsert_many() called with {} personas", len(personas))
+
+            data = [
+                {
+                    "person_id": str(person_id),
+                    "persona": persona_json,
+                    "computed_from_data_ids": list(map(str, data_ids)),
+                    "version": version,
+                }
+                for person_id, persona_json, data_ids, version in personas
+            ]
+
+            response = await run_query(
+                self.supabase.client.table(self.table_name)
+                .upsert(data, on_conflict="person_id")
+            )
+
+            if not response.data or len(response.data) != len(data):
+                logger.error("Unexpected row count from persona bulk upsert")
+                raise APIError("Failed to upsert personas: incomplete data returned")
+
+            logger.debug("Saved {} personas", len(response.data))
+
+            return [
+                _cache_persona(persona)
+                for persona in PersonaListAdapter.validate_python(response.data)
+            ]
+
+        except APIError as e:
+            logger.error(f"Database error in bulk persona upsert: {e}")
             raise
+        except Exception as e:
+            logger.error(f"Unexpected error in bulk persona upsert: {e}")
+            raise APIError(f"Failed to upsert personas: {e}")
+
+
+# Global repository instance
+_persona_repository: Optional[PersonaRepository] = None
 
 
 def get_persona_repository() -> PersonaRepository:
     """
-    Get a persona repository instance.
+    Get the shared persona repository instance.
 
     Returns:
         PersonaRepository instance
@@ -522,4 +878,7 @@ def get_persona_repository() -> PersonaRepository:
         repo = get_persona_repository()
         persona = await repo.create(persona_data)
     """
-    return PersonaRepository()
+    global _persona_repository
+    if _persona_repository is None:
+        _persona_repository = PersonaRepository()
+    return _persona_repository
@@ -1,16 +1,33 @@
 """
 Service layer for persona operations including LLM chain and business logic.
+
+Exports are loaded on first access, so importing a lightweight submodule
+(e.g. submission_batcher) doesn't pull in LangChain and the OpenAI SDK.
 """
 
-from .llm_chain import get_persona_llm_chain, PersonaLLMChain
-from .persona_synthesizer import (
-    get_persona_synthesizer,
-    PersonaSynthesizer,
-)
-from .persona_service import (
-    get_persona_service,
-    PersonaService,
-)
+import importlib
+from typing import Any
+
+# Exported name -> submodule defining it
+_LAZY_EXPORTS = {
+    "get_persona_llm_chain": "llm_chain",
+    "PersonaLLMChain": "llm_chain",
+    "get_persona_synthesizer": "persona_synthesizer",
+    "PersonaSynthesizer": "persona_synthesizer",
+    "get_persona_service": "persona_service",
+    "PersonaService": "persona_service",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported name's submodule the first time it is used."""
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{_LAZY_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "get_persona_llm_chain",
@@ -0,0 +1,109 @@
+"""
+Batcher base - queues writes and flushes them together.
+
+Subclasses queue tuples whose last element is the future the caller
+awaits, and implement _write_batch to write a collected batch and
+resolve those futures.
+"""
+
+import asyncio
+from typing import Generic, List, Optional, TypeVar
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# A queued tuple; its last element is the caller's asyncio.Future
+ItemT = TypeVar("ItemT", bound=tuple)
+
+
+class Batcher(Generic[ItemT]):
+    """Collect queued items into batches and hand them to _write_batch."""
+
+    # Name used in log messages
+    name = "Batcher"
+
+    def __init__(self, max_batch_size: int, max_wait_ms: float):
+        """
+        Initialize the batcher.
+
+        Args:
+            max_batch_size: Maximum items per batch
+            max_wait_ms: Longest an item waits for others to join its batch
+        """
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._queue: Optional["asyncio.Queue[ItemT]"] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background flusher is running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the background flusher on the running event loop."""
+        if self.is_running:
+            return
+
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._flusher())
+        logger.debug(
+            f"{self.name} started (batch size {self.max_batch_size}, "
+            f"wait {self.max_wait_ms}ms)"
+        )
+
+    async def stop(self) -> None:
+        """Flush queued items and stop the background flusher."""
+        if not self.is_running:
+            return
+
+        # Let anything already queued be written before cancelling
+        await self._queue.join()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+        self._task = None
+        self._queue = None
+        logger.debug(f"{self.name} stopped")
+
+    async def _flusher(self) -> None:
+        """Collect queued items into batches and write them."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch: List[ItemT] = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait_ms / 1000
+
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self._write_batch(batch)
+            except Exception as e:
+                # An escaped error must not kill the flusher or strand callers
+                logger.error(f"{self.name} failed to write a batch of {len(batch)}: {str(e)}")
+                for item in batch:
+                    if not item[-1].done():
+                        item[-1].set_exception(e)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _write_batch(self, batch: List[ItemT]) -> None:
+        """
+        Write a batch and resolve each item's future.
+
+        Args:
+            batch: Queued items to write
+        """
+        raise NotImplementedError
@@ -4,6 +4,9 @@ LangChain LLM integration for persona generation.
 Implements a two-step pipeline:
 1. Clean/normalize raw text into structured notes
 2. Generate comprehensive persona JSON from cleaned notes
+
+By default both steps are fused into a single JSON-mode call
+(see settings.llm_single_pass).
 """
 
 import json
@@ -14,6 +17,7 @@ from typing import Dict, Any, Optional
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from app.core.config import settings
+from app.core.exceptions import ServiceError
 from app.core.logging import get_logger, log_llm_request, log_llm_response
 
 logger = get_logger(__name__)
@@ -30,6 +34,8 @@ class PersonaLLMChain:
             temperature=0.7,
             max_tokens=2000,
         )
+        # JSON mode guarantees a parseable object for the single-pass call
+        self.json_model = self.model.bind(response_format={"type": "json_object"})
         self._load_prompts()
 
     def _load_prompts(self) -> None:
@@ -52,6 +58,14 @@ class PersonaLLMChain:
             prompts_dir / "step2_persona_user.txt"
         )
 
+        # Single-pass prompt: the invariant persona instructions come first
+        # so OpenAI's automatic prompt caching can reuse the shared prefix
+        self.single_pass_system = (
+            self.step2_system
+            + "\n\n"
+            + self._read_prompt_file(prompts_dir / "single_pass_system.txt")
+        )
+
         logger.debug("Prompt templates loaded successfully")
 
     def _read_prompt_file(self, filepath: Path) -> str:
@@ -85,7 +99,7 @@ class PersonaLLMChain:
             Cleaned, normalized bullet-point summary
 
         Raises:
-            ValueError: If cleaning fails
+            ServiceError: If cleaning fails
         """
         try:
             logger.debug("Starting Step 1: Text Cleaning")
@@ -130,7 +144,7 @@ class PersonaLLMChain:
 
         except Exception as e:
             logger.error(f"Step 1 failed: {e}")
-            raise ValueError(f"Text cleaning failed: {e}") from e
+            raise ServiceError(f"Text cleaning failed: {e}") from e
 
     async def step2_populate_persona(
         self, cleaned_text: str
@@ -145,7 +159,7 @@ class PersonaLLMChain:
             Structured persona JSON as dictionary
 
         Raises:
-            ValueError: If persona generation or JSON parsing fails
+            ServiceError: If persona generation or JSON parsing fails
         """
         try:
             logger.debug("Starting Step 2: Persona Population")
@@ -192,7 +206,7 @@ class PersonaLLMChain:
 
         except Exception as e:
             logger.error(f"Step 2 failed: {e}")
-            raise ValueError(f"Persona generation failed: {e}") from e
+            raise ServiceError(f"Persona generation failed: {e}") from e
 
     async def step2_populate_persona_with_demographics(
         self, cleaned_text: str, demographic_context: str
@@ -211,7 +225,7 @@ class PersonaLLMChain:
             Structured persona JSON as dictionary
 
         Raises:
-            ValueError: If persona generation or JSON parsing fails
+            ServiceError: If persona generation or JSON parsing fails
         """
         try:
             logger.debug("Starting Step 2: Persona Population with Demographics")
@@ -262,7 +276,69 @@ class PersonaLLMChain:
 
         except Exception as e:
             logger.error(f"Step 2 with demographics failed: {e}")
-            raise ValueError(f"Persona generation failed: {e}") from e
+            raise ServiceError(f"Persona generation failed: {e}") from e
+
+    async def generate_persona_single_pass(
+        self, raw_text: str, demographic_context: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate persona JSON from raw text in one LLM call.
+
+        Fuses the cleaning and population steps into a single JSON-mode
+        request, halving round trips and token spend.
+
+        Args:
+            raw_text: Unstructured text about a person
+            demographic_context: Optional demographic information to prepend
+
+        Returns:
+            Structured persona JSON as dictionary
+
+        Raises:
+            ServiceError: If persona generation or JSON parsing fails
+        """
+        try:
+            logger.debug("Starting single-pass persona generation")
+
+            input_text = raw_text
+            if demographic_context:
+                input_text = demographic_context + "\n" + raw_text
+
+            prompt = ChatPromptTemplate.from_messages([
+                ("system", self.single_pass_system),
+                ("human", self.step2_user),
+            ])
+            chain = prompt | self.json_model
+
+            log_llm_request(
+                model=settings.openai_model,
+                messages=[
+                    {"role": "system", "content": self.single_pass_system},
+                    {"role": "user", "content": self.step2_user.replace("{cleaned_text}", input_text[:200])},
+                ],
+                temperature=0.7,
+                max_tokens=2000,
+            )
+
+            start_time = time.time()
+            result = await chain.ainvoke({"cleaned_text": input_text})
+            latency_ms = (time.time() - start_time) * 1000
+
+            persona_text = result.content
+
+            log_llm_response(
+                model=settings.openai_model,
+                response_text=persona_text,
+                latency_ms=latency_ms,
+            )
+
+            persona_json = self._safe_json_parse(persona_text)
+            logger.info(f"Single-pass persona generation completed (latency: {latency_ms:.0f}ms)")
+            return persona_json
+
+        except Exception as e:
+            logger.error(f"Single-pass persona generation failed: {e}")
+            raise ServiceError(f"Persona generation failed: {e}") from e
 
     def _safe_json_parse(self, text: str) -> Dict[str, Any]:
         """
@@ -275,7 +351,7 @@ class PersonaLLMChain:
             Parsed JSON as dictionary
 
         Raises:
-            ValueError: If JSON cannot be parsed
+            ServiceError: If JSON cannot be parsed
         """
         logger.debug(f"_safe_json_parse() called")
         logger.debug(f"  - input text type: {type(text)}")
@@ -338,11 +414,14 @@ class PersonaLLMChain:
         has_close_brace = '}' in text
         logger.error(f"  - Text contains opening brace: {has_open_brace}")
         logger.error(f"  - Text contains closing brace: {has_close_brace}")
-        raise ValueError("Could not parse JSON response from LLM")
+        raise ServiceError("Could not parse JSON response from LLM")
 
     async def generate_persona(self, raw_text: str, demographic_context: Optional[str] = None) -> Dict[str, Any]:
         """
-        Generate a complete persona from raw text (both steps).
+        Generate a complete persona from raw text.
+
+        Runs the fused single-pass call when settings.llm_single_pass is
+        enabled, otherwise the two-step clean-then-populate pipeline.
 
         Args:
             raw_text: Unstructured text about a person
@@ -352,7 +431,7 @@ class PersonaLLMChain:
             Complete persona JSON
 
         Raises:
-            ValueError: If either step fails
+            ServiceError: If either step fails
         """
         try:
             logger.info("Starting persona generation pipeline")
@@ -362,6 +441,16 @@ class PersonaLLMChain:
             if demographic_context:
                 logger.debug(f"Demographic context provided: {len(demographic_context)} chars")
 
+            if settings.llm_single_pass:
+                persona = await self.generate_persona_single_pass(raw_text, demographic_context)
+                persona["_meta"] = {
+                    "raw_text_length": len(raw_text),
+                    "pipeline": "single_pass",
+                    "model_used": settings.openai_model,
+                }
+                logger.info("Persona generation pipeline completed successfully")
+                return persona
+
             # Step 1: Clean text
             logger.debug("Executing Step 1: Clean text...")
             cleaned_text = await self.step1_clean_text(raw_text)
@@ -386,6 +475,7 @@ class PersonaLLMChain:
             persona["_meta"] = {
                 "raw_text_length": len(raw_text),
                 "cleaned_text_length": len(cleaned_text),
+                "pipeline": "two_step",
                 "model_used": settings.openai_model,
             }
 
@@ -400,10 +490,8 @@ class PersonaLLMChain:
             return persona
 
         except Exception as e:
-            logger.error(f"Persona generation pipeline failed: {e}")
-            logger.error(f"  - Exception type: {type(e).__name__}")
-            logger.error(f"  - Exception details: {str(e)}")
-            logger.error(f"  - Full traceback: ", exc_info=True)
+            # Callers map this to a response; the traceback, if any, is logged once there
+            logger.error(f"Persona generation pipeline failed: {type(e).__name__}: {e}")
             raise
 
 
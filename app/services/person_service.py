@@ -5,15 +5,24 @@ Coordinates person lifecycle, data accumulation, and persona recomputation.
 Implements the core domain logic for the person aggregate root pattern.
 """
 
-from typing import Dict, Any, List, Optional
+import asyncio
+from typing import Dict, Any, AsyncIterator, List, Optional
 from uuid import UUID
 from app.models.person import PersonInDB, PersonCreate, PersonResponse
 from app.models.person_data import PersonDataInDB, PersonDataCreate
 from app.models.persona import PersonaInDB
-from app.repositories.person_repo import PersonRepository
-from app.repositories.person_data_repo import PersonDataRepository
-from app.repositories.persona_repo import PersonaRepository
+from app.repositories.person_repo import PersonRepository, get_person_repository
+from app.repositories.person_data_repo import (
+    PersonDataRepository,
+    get_person_data_repository,
+)
+from app.repositories.persona_repo import PersonaRepository, get_persona_repository
 from app.services.llm_chain import get_persona_llm_chain
+from app.services.persona_upsert_batcher import get_persona_upsert_batcher
+from app.services.submission_batcher import get_submission_batcher
+from app.core.cache import invalidate_person
+from app.core.config import settings
+from app.core.exceptions import NotFoundError, ServiceError
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -36,11 +45,17 @@ class PersonService:
             person_data_repo: PersonDataRepository instance
             persona_repo: PersonaRepository instance
         """
-        self.person_repo = person_repo or PersonRepository()
-        self.person_data_repo = person_data_repo or PersonDataRepository()
-        self.persona_repo = persona_repo or PersonaRepository()
+        self.person_repo = person_repo or get_person_repository()
+        self.person_data_repo = person_data_repo or get_person_data_repository()
+        self.persona_repo = persona_repo or get_persona_repository()
         self.llm_chain = get_persona_llm_chain()
 
+        # Per-person regeneration state, keyed by lowercased person_id:
+        # a lock serializing recomputations, and the not-yet-started
+        # regeneration that new requests can join
+        self._regeneration_locks: Dict[str, asyncio.Lock] = {}
+        self._pending_regenerations: Dict[str, "asyncio.Future[PersonaInDB]"] = {}
+
     # ========================================================================
     # Person Aggregate Root Operations
     # ========================================================================
@@ -66,7 +81,7 @@ class PersonService:
             PersonInDB: Created person with ID and timestamps
 
         Raises:
-            ValueError: If creation fails
+            ServiceError: If creation fails
         """
         logger.info("PersonService: Creating new person aggregate root")
         logger.debug(f"  - first_name: {first_name}")
@@ -84,7 +99,7 @@ class PersonService:
 
         except Exception as e:
             logger.error(f"Failed to create person: {str(e)}")
-            raise ValueError(f"Failed to create person: {str(e)}")
+            raise ServiceError(f"Failed to create person: {str(e)}") from e
 
     async def get_person(self, person_id: UUID) -> Optional[PersonResponse]:
         """
@@ -99,57 +114,68 @@ class PersonService:
             PersonResponse with metadata, or None if not found
 
         Raises:
-            ValueError: If retrieval fails
+            ServiceError: If retrieval fails
         """
         logger.debug(f"PersonService: Getting person {person_id}")
 
         try:
-            person = await self.person_repo.read(person_id)
+            # Person, data count and persona version come back in one query
+            person = await self.person_repo.read_with_meta(person_id)
             if not person:
                 logger.debug(f"Person not found: {person_id}")
                 return None
 
-            # Get metadata
-            data_count = await self.person_data_repo.count_for_person(person_id)
-            persona = await self.persona_repo.get_by_person_id(person_id)
-
-            return PersonResponse(
-                **person.model_dump(),
-                person_data_count=data_count,
-                latest_persona_version=persona.version if persona else None,
-            )
+            return person
 
         except Exception as e:
             logger.error(f"Failed to get person {person_id}: {str(e)}")
-            raise ValueError(f"Failed to get person: {str(e)}")
+            raise ServiceError(f"Failed to get person: {str(e)}") from e
 
     async def list_persons(
         self, limit: int = 50, offset: int = 0
-    ) -> tuple[List[PersonInDB], int]:
+    ) -> tuple[List[PersonResponse], int]:
         """
         List all persons with pagination.
 
+        Each person includes its data submission count and latest persona
+        version, fetched in the same query as the page itself.
+
         Args:
             limit: Maximum number of persons
             offset: Number to skip
 
         Returns:
-            Tuple of (persons list, total count)
+            Tuple of (persons list with metadata, total count)
 
         Raises:
-            ValueError: If listing fails
+            ServiceError: If listing fails
         """
         logger.debug(f"PersonService: Listing persons (limit={limit}, offset={offset})")
 
         try:
-            persons = await self.person_repo.read_all(limit, offset)
-            count = await self.person_repo.count()
+            persons, count = await self.person_repo.read_all_with_meta(limit, offset)
             logger.debug(f"Retrieved {len(persons)} persons (total: {count})")
             return persons, count
 
         except Exception as e:
             logger.error(f"Failed to list persons: {str(e)}")
-            raise ValueError(f"Failed to list persons: {str(e)}")
+            raise ServiceError(f"Failed to list persons: {str(e)}") from e
+
+    def stream_persons(
+        self, limit: int = 50, offset: int = 0
+    ) -> AsyncIterator[PersonResponse]:
+        """
+        Stream a page of persons with metadata as they are fetched.
+
+        Args:
+            limit: Maximum number of persons
+            offset: Number to skip
+
+        Returns:
+            Async iterator of persons with metadata
+        """
+        logger.debug(f"PersonService: Streaming persons (limit={limit}, offset={offset})")
+        return self.person_repo.iter_with_meta(limit, offset)
 
     async def delete_person(self, person_id: UUID) -> bool:
         """
@@ -165,12 +191,13 @@ class PersonService:
             True if deleted, False if not found
 
         Raises:
-            ValueError: If deletion fails
+            ServiceError: If deletion fails
         """
         logger.info(f"PersonService: Deleting person {person_id}")
 
         try:
             success = await self.person_repo.delete(person_id)
+            invalidate_person(person_id)
             if success:
                 logger.info(f"Person deleted: {person_id}")
             else:
@@ -179,7 +206,7 @@ class PersonService:
 
         except Exception as e:
             logger.error(f"Failed to delete person {person_id}: {str(e)}")
-            raise ValueError(f"Failed to delete person: {str(e)}")
+            raise ServiceError(f"Failed to delete person: {str(e)}") from e
 
     # ========================================================================
     # Data Accumulation Operations
@@ -206,7 +233,8 @@ class PersonService:
             PersonDataInDB: Created submission record
 
         Raises:
-            ValueError: If person not found or operation fails
+            NotFoundError: If person not found
+            APIError: If the database operation fails
         """
         logger.debug(f"PersonService: Adding data to person {person_id}")
 
@@ -214,10 +242,12 @@ class PersonService:
             # Verify person exists
             person = await self.person_repo.read(person_id)
             if not person:
-                raise ValueError(f"Person not found: {person_id}")
+                raise NotFoundError(f"Person not found: {person_id}")
 
             # Add data submission
-            submission = await self.person_data_repo.create(person_id, raw_text, source)
+            # Queued so concurrent submissions share one insert
+            submission = await get_submission_batcher().submit(person_id, raw_text, source)
+            invalidate_person(person_id)
             logger.debug(f"Data added to person {person_id}: {submission.id}")
 
             return submission
@@ -226,6 +256,48 @@ class PersonService:
             logger.error(f"Failed to add data to person {person_id}: {str(e)}")
             raise
 
+    async def add_person_data_bulk(
+        self,
+        person_id: UUID,
+        items: List[PersonDataCreate],
+    ) -> List[PersonDataInDB]:
+        """
+        Add several unstructured data submissions to a person at once.
+
+        All submissions are written with a single insert. Like
+        add_person_data, this does not trigger persona recomputation.
+
+        Args:
+            person_id: UUID of the person
+            items: Submissions to add (person_id on each item is ignored)
+
+        Returns:
+            List[PersonDataInDB]: Created submission records, in input order
+
+        Raises:
+            NotFoundError: If person not found
+            APIError: If the database operation fails
+        """
+        logger.debug(f"PersonService: Adding {len(items)} data submissions to person {person_id}")
+
+        try:
+            # Verify person exists
+            person = await self.person_repo.read(person_id)
+            if not person:
+                raise NotFoundError(f"Person not found: {person_id}")
+
+            submissions = await self.person_data_repo.create_many(
+                [(person_id, item.raw_text, item.source) for item in items]
+            )
+            invalidate_person(person_id)
+            logger.debug(f"{len(submissions)} submissions added to person {person_id}")
+
+            return submissions
+
+        except Exception as e:
+            logger.error(f"Failed to add bulk data to person {person_id}: {str(e)}")
+            raise
+
     async def add_person_data_and_regenerate(
         self,
         person_id: UUID,
@@ -248,7 +320,9 @@ class PersonService:
             Tuple of (created submission, regenerated persona)
 
         Raises:
-            ValueError: If person not found or operation fails
+            NotFoundError: If person not found
+            APIError: If the database operation fails
+            ServiceError: If persona regeneration fails
         """
         logger.info(f"PersonService: Adding data and regenerating persona for {person_id}")
 
@@ -256,17 +330,19 @@ class PersonService:
             # Verify person exists
             person = await self.person_repo.read(person_id)
             if not person:
-                raise ValueError(f"Person not found: {person_id}")
+                raise NotFoundError(f"Person not found: {person_id}")
 
             # Add data submission
             submission = await self.person_data_repo.create(person_id, raw_text, source)
+            invalidate_person(person_id)
             logger.debug(f"Data submitted: {submission.id}")
 
-            # Regenerate persona from all accumulated data
-            persona = await self.recompute_persona(person_id)
+            # Regenerate persona from all accumulated data, sharing the run
+            # with any other submissions for this person arriving meanwhile
+            persona = await self._regenerate_coalesced(person_id, person)
 
             if not persona:
-                raise ValueError(f"Failed to regenerate persona for person {person_id}")
+                raise ServiceError(f"Failed to regenerate persona for person {person_id}")
 
             logger.info(f"Persona regenerated for person {person_id} (version {persona.version})")
 
@@ -297,28 +373,51 @@ class PersonService:
             Tuple of (submissions list, total count)
 
         Raises:
-            ValueError: If operation fails
+            ServiceError: If operation fails
         """
         logger.debug(f"PersonService: Getting data history for person {person_id}")
 
         try:
-            submissions = await self.person_data_repo.get_all_for_person(
-                person_id, limit, offset
+            # The page and the total are independent queries; run them together
+            submissions, count = await asyncio.gather(
+                self.person_data_repo.get_all_for_person(person_id, limit, offset),
+                self.person_data_repo.count_for_person(person_id),
             )
-            count = await self.person_data_repo.count_for_person(person_id)
 
             logger.debug(f"Retrieved {len(submissions)} submissions (total: {count})")
             return submissions, count
 
         except Exception as e:
             logger.error(f"Failed to get data history for {person_id}: {str(e)}")
-            raise ValueError(f"Failed to get data history: {str(e)}")
+            raise ServiceError(f"Failed to get data history: {str(e)}") from e
+
+    def stream_person_data_history(
+        self,
+        person_id: UUID,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> AsyncIterator[PersonDataInDB]:
+        """
+        Stream a page of data submissions for a person as they are fetched.
+
+        Args:
+            person_id: UUID of the person
+            limit: Maximum submissions
+            offset: Number to skip
+
+        Returns:
+            Async iterator of submissions ordered by created_at
+        """
+        logger.debug(f"PersonService: Streaming data history for person {person_id}")
+        return self.person_data_repo.iter_for_person(person_id, limit, offset)
 
     # ========================================================================
     # Persona Recomputation (Core Business Logic)
     # ========================================================================
 
-    async def recompute_persona(self, person_id: UUID) -> Optional[PersonaInDB]:
+    async def recompute_persona(
+        self, person_id: UUID, person: Optional[PersonInDB] = None
+    ) -> Optional[PersonaInDB]:
         """
         Recompute persona from all accumulated data.
 
@@ -333,32 +432,38 @@ class PersonService:
         This method is called automatically when new data is added via
         add_person_data_and_regenerate().
 
+        The person, their data submissions and their current persona are
+        independent reads, so they are fetched concurrently.
+
         Args:
             person_id: UUID of the person
+            person: Already-loaded person, if the caller has one (skips a read)
 
         Returns:
             PersonaInDB: Regenerated persona, or None if no data exists
 
         Raises:
-            ValueError: If persona generation fails
+            NotFoundError: If person not found
+            ServiceError: If persona generation fails
         """
         logger.info(f"PersonService: Recomputing persona for person {person_id}")
 
         try:
-            # Fetch the person's demographic data
-            person = await self.person_repo.read(person_id)
+            # Fetch demographics, accumulated data and the current persona concurrently
+            person, all_data, current_persona = await asyncio.gather(
+                self._get_person_or_loaded(person_id, person),
+                self.person_data_repo.get_all_for_person_unordered(person_id),
+                self.persona_repo.get_by_person_id(person_id),
+            )
             if not person:
                 logger.error(f"Person not found: {person_id}")
-                raise ValueError(f"Person not found: {person_id}")
+                raise NotFoundError(f"Person not found: {person_id}")
 
             logger.debug(f"Person demographic data:")
             logger.debug(f"  - first_name: {person.first_name}")
             logger.debug(f"  - last_name: {person.last_name}")
             logger.debug(f"  - gender: {person.gender}")
 
-            # Get all accumulated data for this person
-            all_data = await self.person_data_repo.get_all_for_person_unordered(person_id)
-
             if not all_data:
                 logger.debug(f"No data for person {person_id}, cannot generate persona")
                 return None
@@ -385,8 +490,7 @@ class PersonService:
             )
             logger.debug(f"LLM generated persona JSON")
 
-            # Get current persona to determine version
-            current_persona = await self.persona_repo.get_by_person_id(person_id)
+            # Use the current persona to determine version
             new_version = (current_persona.version + 1) if current_persona else 1
 
             # Collect all data IDs for lineage tracking
@@ -394,13 +498,15 @@ class PersonService:
 
             logger.debug(f"Creating persona version {new_version} with {len(data_ids)} data IDs")
 
-            # Create or update persona with versioning and lineage
-            persona = await self.persona_repo.upsert(
+            # Create or update persona with versioning and lineage; concurrent
+            # recomputations share one upsert
+            persona = await get_persona_upsert_batcher().upsert(
                 person_id=person_id,
                 persona_json=persona_json,
                 data_ids=data_ids,
                 version=new_version,
             )
+            invalidate_person(person_id)
 
             logger.info(
                 f"Persona recomputed for person {person_id}: "
@@ -409,9 +515,81 @@ class PersonService:
 
             return persona
 
+        except NotFoundError:
+            raise
         except Exception as e:
             logger.error(f"Failed to recompute persona for {person_id}: {str(e)}")
-            raise ValueError(f"Failed to recompute persona: {str(e)}")
+            raise ServiceError(f"Failed to recompute persona: {str(e)}") from e
+
+    async def _regenerate_coalesced(
+        self, person_id: UUID, person: Optional[PersonInDB] = None
+    ) -> PersonaInDB:
+        """
+        Recompute a person's persona, coalescing concurrent requests.
+
+        Recomputations for the same person run one at a time. A request
+        joins the pending (not yet started) recomputation if there is one;
+        otherwise it starts a new one that waits out the debounce window
+        and any running recomputation first. Every joined request gets the
+        same persona, which was computed after all their data was stored.
+
+        Args:
+            person_id: UUID of the person
+            person: Already-loaded person, if the caller has it
+
+        Returns:
+            PersonaInDB: Recomputed persona
+
+        Raises:
+            ServiceError: If recomputation fails
+        """
+        key = str(person_id).lower()
+
+        pending = self._pending_regenerations.get(key)
+        if pending is not None:
+            logger.debug(f"Joining pending persona regeneration for {person_id}")
+            return await asyncio.shield(pending)
+
+        future: "asyncio.Future[PersonaInDB]" = asyncio.get_running_loop().create_future()
+        # Mark the exception retrieved when no other request joined
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._pending_regenerations[key] = future
+        lock = self._regeneration_locks.setdefault(key, asyncio.Lock())
+
+        try:
+            async with lock:
+                await asyncio.sleep(settings.regenerate_debounce_ms / 1000)
+                # Requests arriving from here on need a fresh run, since this
+                # one may read the data before theirs is stored
+                self._pending_regenerations.pop(key, None)
+                persona = await self.recompute_persona(person_id, person=person)
+                if not persona:
+                    raise ServiceError(f"Failed to regenerate persona for person {person_id}")
+
+            future.set_result(persona)
+            return persona
+
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+
+        finally:
+            if self._pending_regenerations.get(key) is future:
+                del self._pending_regenerations[key]
+            # No pending run means nobody is waiting on the lock either
+            if key not in self._pending_regenerations and not lock.locked():
+                self._regeneration_locks.pop(key, None)
+
+    async def _get_person_or_loaded(
+        self, person_id: UUID, person: Optional[PersonInDB]
+    ) -> Optional[PersonInDB]:
+        """Return the already-loaded person, or read it from the repository."""
+        if person is not None:
+            return person
+        return await self.person_repo.read(person_id)
 
     def _build_demographic_context(self, person: PersonInDB) -> str:
         """
@@ -477,9 +655,16 @@ class PersonService:
         return result
 
 
+# Global service instance
+_person_service: Optional[PersonService] = None
+
+
 def get_person_service() -> PersonService:
     """
-    Get a person service instance.
+    Get the shared person service instance.
+
+    The service (and the repositories and LLM chain it holds) is built on
+    first use and reused for every subsequent request.
 
     Returns:
         PersonService instance
@@ -489,4 +674,7 @@ def get_person_service() -> PersonService:
         service = get_person_service()
         person = await service.create_person()
     """
-    return PersonService()
+    global _person_service
+    if _person_service is None:
+        _person_service = PersonService()
+    return _person_service
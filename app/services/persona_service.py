@@ -5,12 +5,21 @@ Coordinates persona synthesis, validation, merging, and advanced operations.
 Builds on PersonaSynthesizer for core functionality.
 """
 
-from typing import Dict, Any, List, Optional, Tuple
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from uuid import UUID
 from datetime import datetime
-from app.models.persona import PersonaInDB, PersonaCreate
+from app.models.persona import PersonaInDB, PersonaCreate, PersonaExportResponse
 from app.services.persona_synthesizer import PersonaSynthesizer, get_persona_synthesizer
 from app.repositories.persona_repo import get_persona_repository
+from app.core.config import settings
+from app.core.cache import (
+    generation_cache_key,
+    generation_source_cache_key,
+    get_generation_cache,
+    invalidate_generation,
+)
+from app.core.exceptions import NotFoundError, ServiceError
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -33,17 +42,37 @@ class PersonaService:
         """
         Generate and save a new persona.
 
+        Identical input text submitted again within the generation cache TTL
+        returns the persona already generated from it instead of re-running
+        the LLM pipeline, as long as that persona has not been updated or
+        deleted since.
+
         Args:
             raw_text: Unstructured text about a person
 
         Returns:
-            PersonaInDB: Created persona with ID and metadata
+            PersonaInDB: Created (or previously generated) persona with ID and metadata
 
         Raises:
-            ValueError: If generation fails
+            ServiceError: If generation fails
         """
+        cache = get_generation_cache()
+        cache_key = generation_cache_key(raw_text)
+
+        cached_id = cache.get(cache_key)
+        if cached_id is not None:
+            try:
+                persona = await self.synthesizer.get_persona(cached_id)
+                logger.info(f"PersonaService: Reusing persona {cached_id} generated from identical input")
+                return persona
+            except NotFoundError:
+                cache.delete(cache_key)
+
         logger.info("PersonaService: Generating new persona")
-        return await self.synthesizer.generate_and_save_persona(raw_text)
+        persona = await self.synthesizer.generate_and_save_persona(raw_text)
+        cache.set(cache_key, str(persona.id))
+        cache.set(generation_source_cache_key(persona.id), cache_key)
+        return persona
 
     async def update_persona(self, persona_id: str, new_raw_text: str) -> PersonaInDB:
         """
@@ -57,9 +86,11 @@ class PersonaService:
             PersonaInDB: Updated persona
 
         Raises:
-            ValueError: If update fails or persona not found
+            NotFoundError: If persona not found
+            ServiceError: If update fails
         """
         logger.info(f"PersonaService: Updating persona {persona_id}")
+        invalidate_generation(persona_id)
         return await self.synthesizer.regenerate_persona(persona_id, new_raw_text)
 
     async def get_persona(self, persona_id: str) -> PersonaInDB:
@@ -73,7 +104,7 @@ class PersonaService:
             PersonaInDB: The persona
 
         Raises:
-            ValueError: If persona not found
+            NotFoundError: If persona not found
         """
         logger.debug(f"PersonaService: Getting persona {persona_id}")
         return await self.synthesizer.get_persona(persona_id)
@@ -92,7 +123,7 @@ class PersonaService:
             Tuple of (personas list, total count)
 
         Raises:
-            ValueError: If listing fails
+            ServiceError: If listing fails
         """
         logger.debug(f"PersonaService: Listing personas (limit={limit}, offset={offset})")
         return await self.synthesizer.list_personas(limit, offset)
@@ -108,9 +139,10 @@ class PersonaService:
             True if deleted, False if not found
 
         Raises:
-            ValueError: If deletion fails
+            ServiceError: If deletion fails
         """
         logger.info(f"PersonaService: Deleting persona {persona_id}")
+        invalidate_generation(persona_id)
         return await self.synthesizer.delete_persona(persona_id)
 
     async def merge_personas(
@@ -132,7 +164,8 @@ class PersonaService:
             PersonaInDB: Merged persona with combined information
 
         Raises:
-            ValueError: If merge fails or personas not found
+            NotFoundError: If either persona not found
+            ServiceError: If merge fails
         """
         try:
             logger.info(f"PersonaService: Merging personas {persona_id_1} and {persona_id_2}")
@@ -149,6 +182,8 @@ class PersonaService:
                 logger.debug("Using provided merged raw text")
 
             # Regenerate with merged information
+            invalidate_generation(persona_id_1)
+            invalidate_generation(persona_id_2)
             merged_persona = await self.synthesizer.regenerate_persona(
                 persona_id_1, merged_raw_text
             )
@@ -159,40 +194,52 @@ class PersonaService:
 
             return merged_persona
 
+        except ValueError:
+            raise
         except Exception as e:
             logger.error(f"PersonaService: Merge failed: {e}")
-            raise ValueError(f"Failed to merge personas: {e}") from e
+            raise ServiceError(f"Failed to merge personas: {e}") from e
 
     async def batch_generate_personas(
         self, raw_texts: List[str]
     ) -> List[PersonaInDB]:
         """
-        Generate multiple personas in sequence.
+        Generate multiple personas concurrently.
+
+        At most settings.batch_generation_concurrency generations run at
+        once to stay within OpenAI rate limits. Every generation runs to
+        completion before a failure is reported.
 
         Args:
             raw_texts: List of unstructured text entries
 
         Returns:
-            List of created personas
+            List of created personas, in input order
 
         Raises:
-            ValueError: If any generation fails
+            ServiceError: If any generation fails
         """
-        try:
-            logger.info(f"PersonaService: Batch generating {len(raw_texts)} personas")
-            personas = []
+        logger.info(f"PersonaService: Batch generating {len(raw_texts)} personas")
+        semaphore = asyncio.Semaphore(settings.batch_generation_concurrency)
 
-            for i, raw_text in enumerate(raw_texts, 1):
-                logger.debug(f"Batch progress: {i}/{len(raw_texts)}")
-                persona = await self.synthesizer.generate_and_save_persona(raw_text)
-                personas.append(persona)
+        async def generate_one(raw_text: str) -> PersonaInDB:
+            async with semaphore:
+                return await self.generate_persona(raw_text)
 
-            logger.info(f"PersonaService: Batch complete. Generated {len(personas)} personas")
-            return personas
+        results = await asyncio.gather(
+            *(generate_one(raw_text) for raw_text in raw_texts),
+            return_exceptions=True,
+        )
 
-        except Exception as e:
-            logger.error(f"PersonaService: Batch generation failed: {e}")
-            raise ValueError(f"Failed to batch generate personas: {e}") from e
+        for result in results:
+            if isinstance(result, ValueError):
+                raise result
+            if isinstance(result, BaseException):
+                logger.error(f"PersonaService: Batch generation failed: {result}")
+                raise ServiceError(f"Failed to batch generate personas: {result}") from result
+
+        logger.info(f"PersonaService: Batch complete. Generated {len(results)} personas")
+        return results
 
     async def search_personas(self, query: str, limit: int = 10) -> List[PersonaInDB]:
         """
@@ -208,7 +255,7 @@ class PersonaService:
             List of matching personas
 
         Raises:
-            ValueError: If search fails
+            ServiceError: If search fails
         """
         try:
             logger.debug(f"PersonaService: Searching personas for '{query}'")
@@ -243,9 +290,11 @@ class PersonaService:
             logger.info(f"PersonaService: Found {len(results)} matching personas")
             return results[:limit]
 
+        except ValueError:
+            raise
         except Exception as e:
             logger.error(f"PersonaService: Search failed: {e}")
-            raise ValueError(f"Failed to search personas: {e}") from e
+            raise ServiceError(f"Failed to search personas: {e}") from e
 
     async def get_persona_stats(self) -> Dict[str, Any]:
         """
@@ -255,7 +304,7 @@ class PersonaService:
             Dictionary with stats (total count, creation dates, etc.)
 
         Raises:
-            ValueError: If stats retrieval fails
+            ServiceError: If stats retrieval fails
         """
         try:
             logger.debug("PersonaService: Calculating persona statistics")
@@ -299,13 +348,48 @@ class PersonaService:
             logger.info(f"PersonaService: Stats - {stats}")
             return stats
 
+        except ValueError:
+            raise
         except Exception as e:
             logger.error(f"PersonaService: Stats retrieval failed: {e}")
-            raise ValueError(f"Failed to get persona stats: {e}") from e
+            raise ServiceError(f"Failed to get persona stats: {e}") from e
+
+    async def stream_export(
+        self, format: str = "json", limit: int = 1000
+    ) -> Tuple[int, AsyncIterator[PersonaInDB]]:
+        """
+        Start a streamed persona export.
+
+        The format is validated and the total counted up front, so errors
+        surface before any of the response has been sent.
+
+        Args:
+            format: Export format ('json', 'csv' planned)
+            limit: Maximum personas to export
+
+        Returns:
+            Tuple of (total personas in system, async iterator of personas)
+
+        Raises:
+            ValueError: If format invalid
+            ServiceError: If counting fails
+        """
+        if format != "json":
+            raise ValueError(f"Unsupported export format: {format}")
+
+        logger.info(f"PersonaService: Streaming persona export as {format}")
+
+        try:
+            total = await self.repository.count()
+        except Exception as e:
+            logger.error(f"PersonaService: Export failed: {e}")
+            raise ServiceError(f"Failed to export personas: {e}") from e
+
+        return total, self.repository.iter_all(limit)
 
     async def export_personas(
         self, format: str = "json", limit: int = 1000
-    ) -> Dict[str, Any]:
+    ) -> PersonaExportResponse:
         """
         Export personas in specified format.
 
@@ -314,10 +398,11 @@ class PersonaService:
             limit: Maximum personas to export
 
         Returns:
-            Exported data in requested format
+            PersonaExportResponse: Exported personas with metadata
 
         Raises:
-            ValueError: If export fails or format invalid
+            ValueError: If format invalid
+            ServiceError: If export fails
         """
         try:
             if format != "json":
@@ -327,25 +412,34 @@ class PersonaService:
 
             personas, total = await self.synthesizer.list_personas(limit=limit, offset=0)
 
-            export_data = {
-                "export_format": format,
-                "exported_at": datetime.now().isoformat(),
-                "total_exported": len(personas),
-                "total_in_system": total,
-                "personas": [p.model_dump() for p in personas],
-            }
+            export_data = PersonaExportResponse.model_construct(
+                export_format=format,
+                exported_at=datetime.now(),
+                total_exported=len(personas),
+                total_in_system=total,
+                personas=personas,
+            )
 
             logger.info(f"PersonaService: Exported {len(personas)} personas")
             return export_data
 
+        except ValueError:
+            raise
         except Exception as e:
             logger.error(f"PersonaService: Export failed: {e}")
-            raise ValueError(f"Failed to export personas: {e}") from e
+            raise ServiceError(f"Failed to export personas: {e}") from e
+
+
+# Global service instance
+_persona_service: Optional[PersonaService] = None
 
 
 def get_persona_service(synthesizer: Optional[PersonaSynthesizer] = None) -> PersonaService:
     """
-    Get a PersonaService instance.
+    Get the shared PersonaService instance.
+
+    Built on first use and reused for every subsequent request. Passing a
+    synthesizer returns a separate instance that uses it instead.
 
     Args:
         synthesizer: Optional PersonaSynthesizer to use (uses singleton if not provided)
@@ -358,4 +452,10 @@ def get_persona_service(synthesizer: Optional[PersonaSynthesizer] = None) -> Per
         service = get_persona_service()
         persona = await service.generate_persona(raw_text)
     """
-    return PersonaService(synthesizer=synthesizer)
+    if synthesizer is not None:
+        return PersonaService(synthesizer=synthesizer)
+
+    global _persona_service
+    if _persona_service is None:
+        _persona_service = PersonaService()
+    return _persona_service
@@ -5,10 +5,11 @@ Combines the LLM chain (generation) with the repository (persistence)
 to create a complete persona generation workflow.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from app.models.persona import PersonaCreate, PersonaInDB
 from app.services.llm_chain import get_persona_llm_chain
 from app.repositories.persona_repo import get_persona_repository
+from app.core.exceptions import NotFoundError, ServiceError
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -39,7 +40,7 @@ class PersonaSynthesizer:
             PersonaInDB: Complete persona with database metadata
 
         Raises:
-            ValueError: If generation or persistence fails
+            ServiceError: If generation or persistence fails
         """
         try:
             logger.info("Starting persona generation and save workflow")
@@ -74,11 +75,11 @@ class PersonaSynthesizer:
 
             return persona_in_db
 
+        except ServiceError:
+            raise
         except Exception as e:
-            logger.error(f"Persona generation and save failed: {e}")
-            logger.error(f"Exception type: {type(e).__name__}")
-            logger.error(f"Exception traceback: ", exc_info=True)
-            raise ValueError(
+            logger.error(f"Persona generation and save failed: {type(e).__name__}: {e}")
+            raise ServiceError(
                 f"Failed to generate and save persona: {e}"
             ) from e
 
@@ -98,11 +99,16 @@ class PersonaSynthesizer:
             PersonaInDB: Updated persona
 
         Raises:
-            ValueError: If generation, update, or persistence fails
+            ValueError: If persona_id is not a valid UUID
+            NotFoundError: If persona not found
+            ServiceError: If generation, update, or persistence fails
         """
-        try:
-            from uuid import UUID
+        from uuid import UUID
 
+        # A malformed ID is bad input (400); everything after it is a server failure
+        persona_uuid = UUID(persona_id)
+
+        try:
             logger.info(f"Regenerating persona: {persona_id}")
 
             # Generate new persona
@@ -119,15 +125,17 @@ class PersonaSynthesizer:
             )
 
             updated_persona = await self.repository.update(
-                UUID(persona_id), persona_update
+                persona_uuid, persona_update
             )
             logger.info(f"Persona regenerated and updated: {persona_id}")
 
             return updated_persona
 
+        except (NotFoundError, ServiceError):
+            raise
         except Exception as e:
             logger.error(f"Persona regeneration failed: {e}")
-            raise ValueError(f"Failed to regenerate persona: {e}") from e
+            raise ServiceError(f"Failed to regenerate persona: {e}") from e
 
     async def get_persona(self, persona_id: str) -> PersonaInDB:
         """
@@ -140,7 +148,7 @@ class PersonaSynthesizer:
             PersonaInDB: The persona if found
 
         Raises:
-            ValueError: If persona not found
+            NotFoundError: If persona not found
         """
         try:
             from uuid import UUID
@@ -149,14 +157,16 @@ class PersonaSynthesizer:
             persona = await self.repository.read(UUID(persona_id))
 
             if persona is None:
-                raise ValueError(f"Persona not found: {persona_id}")
+                raise NotFoundError(f"Persona not found: {persona_id}")
 
             logger.debug(f"Persona retrieved: {persona_id}")
             return persona
 
+        except ValueError:
+            raise
         except Exception as e:
             logger.error(f"Persona retrieval failed: {e}")
-            raise ValueError(f"Failed to retrieve persona: {e}") from e
+            raise ServiceError(f"Failed to retrieve persona: {e}") from e
 
     async def list_personas(
         self, limit: int = 10, offset: int = 0
@@ -172,7 +182,7 @@ class PersonaSynthesizer:
             Tuple of (list of personas, total count)
 
         Raises:
-            ValueError: If listing fails
+            ServiceError: If listing fails
         """
         try:
             logger.debug(f"Listing personas: limit={limit}, offset={offset}")
@@ -180,9 +190,11 @@ class PersonaSynthesizer:
             logger.debug(f"Retrieved {len(personas)} personas (total: {total})")
             return personas, total
 
+        except ValueError:
+            raise
         except Exception as e:
             logger.error(f"Persona listing failed: {e}")
-            raise ValueError(f"Failed to list personas: {e}") from e
+            raise ServiceError(f"Failed to list personas: {e}") from e
 
     async def delete_persona(self, persona_id: str) -> bool:
         """
@@ -195,7 +207,7 @@ class PersonaSynthesizer:
             True if deleted, False if not found
 
         Raises:
-            ValueError: If deletion fails
+            ServiceError: If deletion fails
         """
         try:
             from uuid import UUID
@@ -210,14 +222,22 @@ class PersonaSynthesizer:
 
             return deleted
 
+        except ValueError:
+            raise
         except Exception as e:
             logger.error(f"Persona deletion failed: {e}")
-            raise ValueError(f"Failed to delete persona: {e}") from e
+            raise ServiceError(f"Failed to delete persona: {e}") from e
+
+
+# Global synthesizer instance
+_persona_synthesizer: Optional[PersonaSynthesizer] = None
 
 
 def get_persona_synthesizer() -> PersonaSynthesizer:
     """
-    Get a PersonaSynthesizer instance.
+    Get the shared PersonaSynthesizer instance.
+
+    Built on first use and reused for every subsequent request.
 
     Returns:
         PersonaSynthesizer instance
@@ -227,4 +247,7 @@ def get_persona_synthesizer() -> PersonaSynthesizer:
         synthesizer = get_persona_synthesizer()
         persona = await synthesizer.generate_and_save_persona(raw_text)
     """
-    return PersonaSynthesizer()
+    global _persona_synthesizer
+    if _persona_synthesizer is None:
+        _persona_synthesizer = PersonaSynthesizer()
+    return _persona_synthesizer
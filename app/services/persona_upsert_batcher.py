@@ -0,0 +1,148 @@
+"""
+Persona upsert batcher - coalesces recomputed persona saves into bulk upserts.
+
+Personas finished by concurrent recomputations are queued and saved
+together with a single INSERT ... ON CONFLICT, so a burst of regenerations
+costs one database round trip instead of one per person.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple, Union
+from uuid import UUID
+
+from app.models.persona import PersonaInDB
+from app.repositories.persona_repo import PersonaRepository, get_persona_repository
+from app.services.batcher import Batcher
+from app.core.config import settings
+from app.core.exceptions import ServiceError
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# (person_id, persona_json, data_ids, version, future resolved with the saved persona)
+_QueuedUpsert = Tuple[UUID, Dict[str, Any], List[UUID], int, "asyncio.Future[PersonaInDB]"]
+
+
+class PersonaUpsertBatcher(Batcher[_QueuedUpsert]):
+    """Queue persona upserts and write them in batches."""
+
+    name = "Persona upsert batcher"
+
+    def __init__(
+        self,
+        persona_repo: Optional[PersonaRepository] = None,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            persona_repo: Repository used for upserts (shared instance if not provided)
+            max_batch_size: Maximum personas per upsert
+            max_wait_ms: Longest a persona waits for others to join its batch
+        """
+        super().__init__(max_batch_size, max_wait_ms)
+        self.persona_repo = persona_repo or get_persona_repository()
+
+    async def upsert(
+        self,
+        person_id: UUID,
+        persona_json: Dict[str, Any],
+        data_ids: List[UUID],
+        version: int = 1,
+    ) -> PersonaInDB:
+        """
+        Queue a persona and wait for it to be saved.
+
+        Falls back to a direct upsert when the flusher is not running
+        (e.g. outside the FastAPI lifespan).
+
+        Args:
+            person_id: UUID of the person
+            persona_json: Persona JSON
+            data_ids: List of person_data IDs
+            version: Version number (1 for new, incremented for updates)
+
+        Returns:
+            PersonaInDB: Created or updated persona
+
+        Raises:
+            APIError: If this person's upsert fails
+        """
+        if not self.is_running:
+            return await self.persona_repo.upsert(person_id, persona_json, data_ids, version)
+
+        future: "asyncio.Future[PersonaInDB]" = asyncio.get_running_loop().create_future()
+        await self._queue.put((person_id, persona_json, data_ids, version, future))
+        return await future
+
+    async def _write_batch(self, batch: List[_QueuedUpsert]) -> None:
+        """
+        Upsert a batch and resolve each caller's future.
+
+        A statement may only touch each person's row once, so when a person
+        was queued more than once only the latest persona is written and
+        every caller for that person receives it. If the bulk upsert fails,
+        each person is retried on their own so one failure only affects
+        that person's callers. People are keyed by normalized UUID since
+        callers may pass the id as an uppercase string.
+
+        Args:
+            batch: Queued upserts to write
+        """
+        latest: Dict[str, Tuple[UUID, Dict[str, Any], List[UUID], int]] = {}
+        for person_id, persona_json, data_ids, version, _ in batch:
+            latest[str(UUID(str(person_id)))] = (person_id, persona_json, data_ids, version)
+
+        logger.debug(f"Flushing {len(latest)} persona upserts")
+
+        results: Dict[str, Union[PersonaInDB, BaseException]]
+        try:
+            personas = await self.persona_repo.upsert_many(list(latest.values()))
+            # Rows come back in no guaranteed order; match them up by person
+            results = {str(UUID(str(persona.person_id))): persona for persona in personas}
+        except Exception as e:
+            logger.warning(
+                f"Batch upsert of {len(latest)} personas failed, retrying individually: {str(e)}"
+            )
+            outcomes = await asyncio.gather(
+                *(self.persona_repo.upsert(*row) for row in latest.values()),
+                return_exceptions=True,
+            )
+            results = dict(zip(latest, outcomes))
+
+        for person_id, *_, future in batch:
+            if future.done():
+                continue
+            result = results.get(str(UUID(str(person_id))))
+            if result is None:
+                future.set_exception(
+                    ServiceError(f"Failed to upsert persona for person {person_id}: no row returned")
+                )
+            elif isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+# Global batcher instance
+_persona_upsert_batcher: Optional[PersonaUpsertBatcher] = None
+
+
+def get_persona_upsert_batcher() -> PersonaUpsertBatcher:
+    """
+    Get or create the global persona upsert batcher.
+
+    Returns:
+        PersonaUpsertBatcher: Shared batcher instance
+    """
+    global _persona_upsert_batcher
+
+    if _persona_upsert_batcher is None:
+        _persona_upsert_batcher = PersonaUpsertBatcher(
+            max_batch_size=settings.persona_upsert_batch_size,
+            max_wait_ms=settings.persona_upsert_batch_wait_ms,
+        )
+
+    return _persona_upsert_batcher
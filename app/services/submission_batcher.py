@@ -0,0 +1,168 @@
+"""
+Submission batcher - coalesces person data inserts into bulk writes.
+
+Concurrent add-data requests are queued and flushed together with a
+single insert, so a burst of submissions costs one database round trip
+instead of one per request.
+"""
+
+import asyncio
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from app.models.person_data import PersonDataInDB
+from app.repositories.person_data_repo import (
+    PersonDataRepository,
+    get_person_data_repository,
+)
+from app.services.batcher import Batcher
+from app.core.config import settings
+from app.core.exceptions import ServiceError
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# (person_id, raw_text, source, future resolved with the created record)
+_QueuedSubmission = Tuple[UUID, str, str, "asyncio.Future[PersonDataInDB]"]
+
+
+class SubmissionBatcher(Batcher[_QueuedSubmission]):
+    """Queue person data submissions and insert them in batches."""
+
+    name = "Submission batcher"
+
+    def __init__(
+        self,
+        person_data_repo: Optional[PersonDataRepository] = None,
+        max_batch_size: int = 50,
+        max_wait_ms: float = 5.0,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            person_data_repo: Repository used for inserts (shared instance if not provided)
+            max_batch_size: Maximum submissions per insert
+            max_wait_ms: Longest a submission waits for others to join its batch
+        """
+        super().__init__(max_batch_size, max_wait_ms)
+        self.person_data_repo = person_data_repo or get_person_data_repository()
+
+    async def submit(
+        self, person_id: UUID, raw_text: str, source: str = "api"
+    ) -> PersonDataInDB:
+        """
+        Queue a submission and wait for it to be written.
+
+        Falls back to a direct insert when the flusher is not running
+        (e.g. outside the FastAPI lifespan).
+
+        Args:
+            person_id: UUID of the person this data belongs to
+            raw_text: Complete unstructured text submitted
+            source: Source of data (api, urls, import, etc)
+
+        Returns:
+            PersonDataInDB: Created submission record
+
+        Raises:
+            APIError: If this submission's insert fails
+        """
+        if not self.is_running:
+            return await self.person_data_repo.create(person_id, raw_text, source)
+
+        future: "asyncio.Future[PersonDataInDB]" = asyncio.get_running_loop().create_future()
+        await self._queue.put((person_id, raw_text, source, future))
+        return await future
+
+    async def _write_batch(self, batch: List[_QueuedSubmission]) -> None:
+        """
+        Insert a batch and resolve each submitter's future.
+
+        If the bulk insert fails, the submissions are retried one at a time
+        so a single bad row (e.g. a person deleted meanwhile) only fails
+        its own submitter.
+
+        Args:
+            batch: Queued submissions to write
+        """
+        logger.debug(f"Flushing {len(batch)} person data submissions")
+
+        try:
+            records = await self.person_data_repo.create_many(
+                [(person_id, raw_text, source) for person_id, raw_text, source, _ in batch]
+            )
+        except Exception as e:
+            logger.warning(
+                f"Batch insert of {len(batch)} submissions failed, retrying individually: {str(e)}"
+            )
+            await self._write_individually(batch)
+            return
+
+        # Rows come back in no guaranteed order; match them to submitters by
+        # content (identical submissions are interchangeable). The person id
+        # is normalized since callers may pass it uppercase.
+        pending: Dict[Tuple[str, str, str], List["asyncio.Future[PersonDataInDB]"]] = {}
+        for person_id, raw_text, source, future in batch:
+            key = (str(UUID(str(person_id))), raw_text, source)
+            pending.setdefault(key, []).append(future)
+
+        for record in records:
+            key = (str(UUID(str(record.person_id))), record.raw_text, record.source)
+            futures = pending.get(key)
+            if futures:
+                future = futures.pop()
+                if not future.done():
+                    future.set_result(record)
+
+        for futures in pending.values():
+            for future in futures:
+                if not future.done():
+                    future.set_exception(
+                        ServiceError("Failed to create person data: no matching row returned")
+                    )
+
+    async def _write_individually(self, batch: List[_QueuedSubmission]) -> None:
+        """
+        Insert each submission on its own, resolving its future with its own outcome.
+
+        Args:
+            batch: Queued submissions to write
+        """
+        results = await asyncio.gather(
+            *(
+                self.person_data_repo.create(person_id, raw_text, source)
+                for person_id, raw_text, source, _ in batch
+            ),
+            return_exceptions=True,
+        )
+
+        for (*_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+# Global batcher instance
+_submission_batcher: Optional[SubmissionBatcher] = None
+
+
+def get_submission_batcher() -> SubmissionBatcher:
+    """
+    Get or create the global submission batcher.
+
+    Returns:
+        SubmissionBatcher: Shared batcher instance
+    """
+    global _submission_batcher
+
+    if _submission_batcher is None:
+        _submission_batcher = SubmissionBatcher(
+            max_batch_size=settings.submission_batch_size,
+            max_wait_ms=settings.submission_batch_wait_ms,
+        )
+
+    return _submission_batcher
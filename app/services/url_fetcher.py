@@ -5,10 +5,12 @@ Provides safe, timeout-protected HTTP requests with HTML text extraction.
 Handles error cases gracefully and respects size limits to prevent abuse.
 """
 
+import asyncio
 import httpx
-from typing import List
+from typing import List, Optional
 from bs4 import BeautifulSoup
 from pydantic import HttpUrl
+from app.core.http import get_http_client
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -55,6 +57,15 @@ class URLFetcher:
     TIMEOUT = 10.0  # seconds
     USER_AGENT = "PersonaAPI/1.0 (+https://github.com/persona-api)"
 
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        """
+        Initialize the fetcher.
+
+        Args:
+            client: HTTP client to use (defaults to the shared pooled client)
+        """
+        self.client = client
+
     async def fetch_url(self, url: str) -> str:
         """
         Fetch content from a single URL and extract text.
@@ -72,29 +83,30 @@ class URLFetcher:
             ContentSizeExceededError: If content exceeds size limit
         """
         try:
-            async with httpx.AsyncClient(timeout=self.TIMEOUT) as client:
-                response = await client.get(
-                    url,
-                    headers={"User-Agent": self.USER_AGENT},
-                    follow_redirects=True
+            client = self.client or get_http_client()
+            response = await client.get(
+                url,
+                headers={"User-Agent": self.USER_AGENT},
+                follow_redirects=True,
+                timeout=self.TIMEOUT,
+            )
+            response.raise_for_status()
+
+            # Check content size before processing
+            content_length = len(response.content)
+            if content_length > self.MAX_CONTENT_SIZE:
+                logger.warning(
+                    f"Content from {url} exceeds size limit: "
+                    f"{content_length} > {self.MAX_CONTENT_SIZE}"
+                )
+                raise ContentSizeExceededError(
+                    f"Content size {content_length} exceeds limit {self.MAX_CONTENT_SIZE}"
                 )
-                response.raise_for_status()
-
-                # Check content size before processing
-                content_length = len(response.content)
-                if content_length > self.MAX_CONTENT_SIZE:
-                    logger.warning(
-                        f"Content from {url} exceeds size limit: "
-                        f"{content_length} > {self.MAX_CONTENT_SIZE}"
-                    )
-                    raise ContentSizeExceededError(
-                        f"Content size {content_length} exceeds limit {self.MAX_CONTENT_SIZE}"
-                    )
-
-                # Extract text from HTML
-                text = self._extract_text(response.text)
-                logger.info(f"Successfully fetched {len(text)} chars from {url}")
-                return text
+
+            # Extract text from HTML
+            text = self._extract_text(response.text)
+            logger.info(f"Successfully fetched {len(text)} chars from {url}")
+            return text
 
         except httpx.TimeoutException as e:
             logger.warning(f"Timeout fetching {url} after {self.TIMEOUT}s")
@@ -111,12 +123,18 @@ class URLFetcher:
             logger.warning(f"Request error for {url}: {str(e)}")
             raise URLFetchError(f"Failed to fetch {url}: {str(e)}") from e
 
-    async def fetch_multiple(self, urls: List[str]) -> str:
+    async def fetch_multiple(
+        self, urls: List[str], leading_text: Optional[str] = None
+    ) -> str:
         """
-        Fetch from multiple URLs and combine content.
+        Fetch from multiple URLs concurrently and combine content.
+
+        Content is combined in the order the URLs were given, after
+        leading_text if provided, in a single join.
 
         Args:
             urls: List of URLs to fetch
+            leading_text: Optional text placed before the fetched content
 
         Returns:
             Combined text from all successful fetches
@@ -127,14 +145,20 @@ class URLFetcher:
         contents = []
         errors = []
 
-        for url in urls:
-            try:
-                content = await self.fetch_url(url)
-                if content.strip():  # Only add non-empty content
-                    contents.append(content)
-            except URLFetchError as e:
-                logger.warning(f"Failed to fetch {url}: {str(e)}")
-                errors.append((url, str(e)))
+        # Fetch concurrently so total latency tracks the slowest URL rather
+        # than the sum; one failure must not cancel the others
+        results = await asyncio.gather(
+            *(self.fetch_url(url) for url in urls), return_exceptions=True
+        )
+
+        for url, result in zip(urls, results):
+            if isinstance(result, URLFetchError):
+                logger.warning(f"Failed to fetch {url}: {str(result)}")
+                errors.append((url, str(result)))
+            elif isinstance(result, BaseException):
+                raise result
+            elif result.strip():  # Only add non-empty content
+                contents.append(result)
 
         if not contents:
             error_details = "; ".join([f"{url}: {error}" for url, error in errors])
@@ -144,6 +168,8 @@ class URLFetcher:
 
         # Combine with separator for clarity
         logger.info(f"Successfully fetched from {len(contents)}/{len(urls)} URLs")
+        if leading_text:
+            contents.insert(0, leading_text)
         return "\n\n---\n\n".join(contents)
 
     @staticmethod
@@ -0,0 +1,21 @@
+-- Migration: 003_add_person_data_person_created_index.sql
+-- Purpose: Serve per-person data history reads from a single index
+-- Description: person_data is always read filtered by person_id and ordered
+--              by created_at (history pages, streaming, persona recomputation).
+--              A composite index returns those rows already in order instead
+--              of sorting the person's rows after an index lookup.
+-- Date: 2026-10-15
+
+CREATE INDEX IF NOT EXISTS idx_person_data_person_id_created_at
+    ON public.person_data(person_id, created_at);
+
+-- The composite index covers every lookup the single-column index served
+DROP INDEX IF EXISTS public.idx_person_data_person_id;
+
+-- ============================================================================
+-- Migration complete
+-- ============================================================================
+-- Summary of changes:
+--   1. Added (person_id, created_at) index on person_data
+--   2. Dropped the now-redundant person_id index
+-- ============================================================================
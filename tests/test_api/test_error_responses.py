@@ -0,0 +1,40 @@
+"""Tests for how service failures map to HTTP error responses."""
+
+from unittest.mock import MagicMock, patch
+
+from fastapi.testclient import TestClient
+from langchain_core.runnables import RunnableLambda
+
+from app.core.cache import TTLCache
+from app.main import app
+from app.services.llm_chain import PersonaLLMChain
+from app.services.persona_service import PersonaService
+from app.services.persona_synthesizer import PersonaSynthesizer
+
+
+def _failing_llm(_):
+    """Stand-in for the model call that fails upstream."""
+    raise RuntimeError("upstream model unavailable")
+
+
+class TestLLMFailureResponse:
+    """Test LLM failures are reported as server errors, not bad requests."""
+
+    def test_llm_exception_returns_500(self):
+        """Test POST /v1/persona returns 500 when the LLM call raises."""
+        chain = PersonaLLMChain()
+        chain.json_model = RunnableLambda(_failing_llm)
+
+        with patch("app.services.persona_synthesizer.get_persona_llm_chain", return_value=chain), \
+             patch("app.services.persona_synthesizer.get_persona_repository"), \
+             patch("app.services.persona_service.get_persona_repository"):
+            service = PersonaService(synthesizer=PersonaSynthesizer())
+
+        with patch("app.api.routes.get_persona_service", return_value=service), \
+             patch("app.services.persona_service.get_generation_cache", return_value=TTLCache(60)), \
+             patch("app.services.llm_chain.settings", MagicMock(llm_single_pass=True)):
+            client = TestClient(app, raise_server_exceptions=False)
+            response = client.post("/v1/persona", json={"raw_text": "Some text"})
+
+        assert response.status_code == 500
+        assert response.json()["error_type"] == "ServiceError"
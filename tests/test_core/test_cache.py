@@ -0,0 +1,88 @@
+"""Tests for the in-process TTL cache."""
+
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from app.core.cache import (
+    TTLCache,
+    generation_cache_key,
+    get_cache,
+    invalidate_person,
+    person_cache_key,
+    persona_cache_key,
+    persona_row_cache_key,
+)
+
+
+class TestTTLCache:
+    """Test TTLCache behaviour."""
+
+    def test_set_and_get(self):
+        """Test a stored value is returned before it expires."""
+        cache = TTLCache(ttl_seconds=60)
+        cache.set("key", {"value": 1})
+
+        assert cache.get("key") == {"value": 1}
+
+    def test_missing_key_returns_none(self):
+        """Test an unknown key returns None."""
+        cache = TTLCache(ttl_seconds=60)
+
+        assert cache.get("missing") is None
+
+    def test_entry_expires(self):
+        """Test entries are dropped once their TTL has passed."""
+        cache = TTLCache(ttl_seconds=10)
+
+        with patch("app.core.cache.time.monotonic", return_value=100.0):
+            cache.set("key", "value")
+        with patch("app.core.cache.time.monotonic", return_value=111.0):
+            assert cache.get("key") is None
+
+    def test_evicts_least_recently_used(self):
+        """Test the oldest untouched entry is evicted at max size."""
+        cache = TTLCache(ttl_seconds=60, max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_invalidate_person(self):
+        """Test invalidation removes both person and persona entries."""
+        person_id = uuid4()
+        cache = get_cache()
+        cache.set(person_cache_key(person_id), "person")
+        cache.set(persona_cache_key(person_id), "persona")
+
+        invalidate_person(person_id)
+
+        assert cache.get(person_cache_key(person_id)) is None
+        assert cache.get(persona_cache_key(person_id)) is None
+
+    def test_invalidate_person_drops_persona_row(self):
+        """Test invalidation also removes the persona cached by its own ID."""
+        person_id = uuid4()
+        persona = MagicMock(id=uuid4())
+        cache = get_cache()
+        cache.set(persona_cache_key(person_id), persona)
+        cache.set(persona_row_cache_key(persona.id), persona)
+
+        invalidate_person(person_id)
+
+        assert cache.get(persona_row_cache_key(persona.id)) is None
+
+
+class TestGenerationCacheKey:
+    """Test generation_cache_key."""
+
+    def test_same_text_same_key(self):
+        """Test identical input text maps to the same key."""
+        assert generation_cache_key("some text") == generation_cache_key("some text")
+
+    def test_different_text_different_key(self):
+        """Test different input text maps to different keys."""
+        assert generation_cache_key("some text") != generation_cache_key("other text")
@@ -156,6 +156,27 @@ class TestPersonaCreate:
         with pytest.raises(ValidationError):
             PersonaCreate(urls=["not a valid url"])
 
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "http://:80",
+            "http://exa mple.com",
+            "http://example.com:abc",
+            "http://example.com:99999",
+            "ftp://example.com/file",
+            "https:///path-only",
+        ],
+    )
+    def test_persona_create_rejects_malformed_url(self, url):
+        """Test URLs without a usable host, with bad ports, or with whitespace are rejected."""
+        with pytest.raises(ValidationError):
+            PersonaCreate(urls=[url])
+
+    def test_persona_create_accepts_url_with_port(self):
+        """Test a URL with an explicit numeric port is accepted."""
+        persona = PersonaCreate(urls=["https://example.com:8443/bio"])
+        assert persona.urls == ["https://example.com:8443/bio"]
+
     def test_persona_create_with_too_many_urls(self):
         """Test validation error when more than 10 URLs provided."""
         urls = [f"https://example.com/page{i}" for i in range(11)]
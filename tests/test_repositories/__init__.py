@@ -0,0 +1 @@
+"""Test repositories package."""
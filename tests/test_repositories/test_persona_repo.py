@@ -0,0 +1,111 @@
+"""Tests for PersonaRepository keyset pagination."""
+
+import re
+import pytest
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+from uuid import uuid4
+
+from postgrest import SyncPostgrestClient
+
+from app.repositories.persona_repo import PersonaRepository
+
+# The keyset filter read_page sends, as PostgREST receives it
+_AFTER_FILTER = re.compile(
+    r'^\(created_at\.lt\."(?P<ts>[^"]+)",'
+    r'and\(created_at\.eq\."(?P=ts)",id\.lt\.(?P<id>[0-9a-f-]+)\)\)$'
+)
+
+
+def _rows(timestamps):
+    """Build persona rows, one per timestamp, ordered like the query (newest first)."""
+    rows = [
+        {
+            "id": str(uuid4()),
+            "person_id": str(uuid4()),
+            "raw_text": "text",
+            "persona": {},
+            "version": 1,
+            "created_at": ts.isoformat(),
+            "updated_at": ts.isoformat(),
+        }
+        for ts in timestamps
+    ]
+    return sorted(rows, key=lambda r: (datetime.fromisoformat(r["created_at"]), r["id"]), reverse=True)
+
+
+class _FakePersonas:
+    """Serve persona queries from memory, applying the keyset filter and limit."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = 0
+
+    async def run_query(self, query):
+        self.queries += 1
+        params = query.request.params
+        assert params["order"] == "created_at.desc,id.desc"
+
+        rows = self.rows
+        if "or" in params:
+            match = _AFTER_FILTER.match(params["or"])
+            assert match, params["or"]
+            cursor = (datetime.fromisoformat(match["ts"]), match["id"])
+            rows = [
+                r for r in rows
+                if (datetime.fromisoformat(r["created_at"]), r["id"]) < cursor
+            ]
+        return SimpleNamespace(data=rows[: int(params["limit"])])
+
+
+@pytest.fixture
+def repo():
+    """A PersonaRepository building real PostgREST queries without a connection."""
+    with patch("app.repositories.persona_repo.get_supabase_client"):
+        repository = PersonaRepository()
+    repository.supabase.client.table = SyncPostgrestClient("http://localhost").from_
+    return repository
+
+
+@pytest.mark.asyncio
+class TestKeysetPagination:
+    """Test PersonaRepository.read_page and iter_all."""
+
+    async def test_pages_with_tied_timestamps_skip_and_repeat_nothing(self, repo):
+        """Test rows sharing a created_at are split across pages without loss or overlap."""
+        tied = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        fake = _FakePersonas(_rows([tied] * 5 + [tied - timedelta(seconds=1)] * 2))
+
+        seen = []
+        cursor = None
+        with patch("app.repositories.persona_repo.run_query", fake.run_query):
+            while True:
+                page, cursor = await repo.read_page(limit=3, after=cursor)
+                seen.extend(str(p.id) for p in page)
+                if cursor is None:
+                    break
+
+        assert seen == [r["id"] for r in fake.rows]
+
+    async def test_stops_when_last_page_is_exactly_full(self, repo):
+        """Test iteration ends after an empty page when rows are a multiple of the page size."""
+        start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        fake = _FakePersonas(_rows([start - timedelta(seconds=i) for i in range(4)]))
+
+        with patch("app.repositories.persona_repo.run_query", fake.run_query):
+            personas = [p async for p in repo.iter_all(limit=100, chunk_size=2)]
+
+        assert [str(p.id) for p in personas] == [r["id"] for r in fake.rows]
+        assert fake.queries == 3
+
+    async def test_iter_all_respects_limit(self, repo):
+        """Test iter_all yields exactly limit rows, shrinking the final chunk."""
+        start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        fake = _FakePersonas(_rows([start - timedelta(seconds=i) for i in range(10)]))
+
+        with patch("app.repositories.persona_repo.run_query", fake.run_query):
+            personas = [p async for p in repo.iter_all(limit=5, chunk_size=2)]
+
+        assert [str(p.id) for p in personas] == [r["id"] for r in fake.rows[:5]]
+        assert fake.queries == 3
@@ -0,0 +1,79 @@
+"""Tests for PersonService persona regeneration coalescing."""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+from app.services.person_service import PersonService
+
+
+def _service() -> PersonService:
+    """Build a PersonService with mocked repositories."""
+    with patch("app.services.person_service.get_persona_llm_chain"):
+        return PersonService(
+            person_repo=MagicMock(),
+            person_data_repo=MagicMock(),
+            persona_repo=MagicMock(),
+        )
+
+
+@pytest.mark.asyncio
+class TestRegenerationCoalescing:
+    """Test PersonService._regenerate_coalesced."""
+
+    async def test_concurrent_requests_share_one_recompute(self):
+        """Test concurrent regenerations for one person run a single recompute."""
+        service = _service()
+        persona = MagicMock()
+        service.recompute_persona = AsyncMock(return_value=persona)
+        person_id = uuid4()
+
+        results = await asyncio.gather(
+            *(service._regenerate_coalesced(person_id) for _ in range(3))
+        )
+
+        assert results == [persona, persona, persona]
+        service.recompute_persona.assert_awaited_once()
+        assert service._pending_regenerations == {}
+        assert service._regeneration_locks == {}
+
+    async def test_request_during_running_recompute_starts_another(self):
+        """Test a request arriving mid-recompute gets a fresh run afterwards."""
+        service = _service()
+        started = asyncio.Event()
+        release = asyncio.Event()
+        calls = []
+
+        async def recompute(person_id, person=None):
+            calls.append(person_id)
+            started.set()
+            await release.wait()
+            return f"v{len(calls)}"
+
+        service.recompute_persona = recompute
+        person_id = uuid4()
+
+        first = asyncio.create_task(service._regenerate_coalesced(person_id))
+        await started.wait()
+        second = asyncio.create_task(service._regenerate_coalesced(person_id))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await first == "v1"
+        assert await second == "v2"
+        assert len(calls) == 2
+
+    async def test_failure_reaches_all_joined_requests(self):
+        """Test a failed recompute raises for every joined request."""
+        service = _service()
+        service.recompute_persona = AsyncMock(side_effect=ValueError("llm failed"))
+        person_id = uuid4()
+
+        results = await asyncio.gather(
+            *(service._regenerate_coalesced(person_id) for _ in range(2)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+        service.recompute_persona.assert_awaited_once()
@@ -0,0 +1,120 @@
+"""Tests for PersonaService generation caching and batching."""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+from app.core.cache import TTLCache, generation_cache_key
+from app.core.exceptions import NotFoundError, ServiceError
+from app.services.persona_service import PersonaService
+
+
+def _service() -> PersonaService:
+    """Build a PersonaService with a mocked synthesizer and repository."""
+    with patch("app.services.persona_service.get_persona_repository"):
+        return PersonaService(synthesizer=MagicMock())
+
+
+@pytest.mark.asyncio
+class TestGenerationCache:
+    """Test PersonaService.generate_persona caching by input text."""
+
+    @pytest.fixture(autouse=True)
+    def generation_cache(self):
+        """Give each test an empty generation cache."""
+        cache = TTLCache(ttl_seconds=60)
+        with patch("app.services.persona_service.get_generation_cache", return_value=cache), \
+             patch("app.core.cache.get_generation_cache", return_value=cache):
+            yield cache
+
+    async def test_identical_input_reuses_persona(self):
+        """Test a repeated input returns the existing persona without regenerating."""
+        service = _service()
+        persona = MagicMock(id=uuid4())
+        service.synthesizer.generate_and_save_persona = AsyncMock(return_value=persona)
+        service.synthesizer.get_persona = AsyncMock(return_value=persona)
+
+        first = await service.generate_persona("same text")
+        second = await service.generate_persona("same text")
+
+        assert first is persona
+        assert second is persona
+        service.synthesizer.generate_and_save_persona.assert_awaited_once()
+        service.synthesizer.get_persona.assert_awaited_once_with(str(persona.id))
+
+    async def test_deleted_persona_is_regenerated(self):
+        """Test a cached persona that no longer exists is generated again."""
+        service = _service()
+        old, new = MagicMock(id=uuid4()), MagicMock(id=uuid4())
+        service.synthesizer.generate_and_save_persona = AsyncMock(side_effect=[old, new])
+        service.synthesizer.get_persona = AsyncMock(side_effect=NotFoundError("gone"))
+
+        await service.generate_persona("same text")
+        result = await service.generate_persona("same text")
+
+        assert result is new
+        assert service.synthesizer.generate_and_save_persona.await_count == 2
+
+    async def test_updated_persona_is_not_reused(self):
+        """Test input whose persona was since updated generates a new persona."""
+        service = _service()
+        old, new = MagicMock(id=uuid4()), MagicMock(id=uuid4())
+        service.synthesizer.generate_and_save_persona = AsyncMock(side_effect=[old, new])
+        service.synthesizer.regenerate_persona = AsyncMock(return_value=old)
+        service.synthesizer.get_persona = AsyncMock(return_value=old)
+
+        await service.generate_persona("same text")
+        await service.update_persona(str(old.id), "different text")
+        result = await service.generate_persona("same text")
+
+        assert result is new
+        service.synthesizer.get_persona.assert_not_awaited()
+
+    async def test_deleted_persona_is_not_reused(self, generation_cache):
+        """Test deleting a persona drops its generation cache entry."""
+        service = _service()
+        persona = MagicMock(id=uuid4())
+        service.synthesizer.generate_and_save_persona = AsyncMock(return_value=persona)
+        service.synthesizer.delete_persona = AsyncMock(return_value=True)
+
+        await service.generate_persona("same text")
+        await service.delete_persona(str(persona.id))
+
+        assert generation_cache.get(generation_cache_key("same text")) is None
+
+
+@pytest.mark.asyncio
+class TestBatchGeneration:
+    """Test PersonaService.batch_generate_personas."""
+
+    async def test_runs_concurrently_within_limit_and_keeps_order(self):
+        """Test generations overlap up to the concurrency limit and keep input order."""
+        service = _service()
+        in_flight = 0
+        max_in_flight = 0
+
+        async def generate(raw_text):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return raw_text
+
+        service.generate_persona = generate
+
+        with patch("app.services.persona_service.settings") as mock_settings:
+            mock_settings.batch_generation_concurrency = 2
+            results = await service.batch_generate_personas(["a", "b", "c", "d"])
+
+        assert results == ["a", "b", "c", "d"]
+        assert max_in_flight == 2
+
+    async def test_failure_raises_service_error(self):
+        """Test a failed generation is reported as a ServiceError."""
+        service = _service()
+        service.generate_persona = AsyncMock(side_effect=[MagicMock(), RuntimeError("boom")])
+
+        with pytest.raises(ServiceError):
+            await service.batch_generate_personas(["a", "b"])
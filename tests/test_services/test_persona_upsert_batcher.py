@@ -0,0 +1,139 @@
+"""Tests for the persona upsert batcher."""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+from app.core.exceptions import ServiceError
+from app.services.persona_upsert_batcher import PersonaUpsertBatcher
+
+
+def _saved(person_id, persona_json, data_ids, version):
+    """Build a stand-in for a saved PersonaInDB record."""
+    persona = MagicMock()
+    persona.person_id = person_id
+    persona.persona = persona_json
+    persona.version = version
+    return persona
+
+
+def _saved_reversed(rows):
+    """Bulk upsert stand-in that returns rows in reverse order."""
+    return [_saved(*row) for row in reversed(rows)]
+
+
+def _batcher(repo) -> PersonaUpsertBatcher:
+    """Build a started batcher with a window wide enough to batch a gather."""
+    batcher = PersonaUpsertBatcher(repo, max_batch_size=10, max_wait_ms=20)
+    batcher.start()
+    return batcher
+
+
+@pytest.mark.asyncio
+class TestPersonaUpsertBatcher:
+    """Test PersonaUpsertBatcher."""
+
+    async def test_rows_are_matched_by_person(self):
+        """Test one bulk upsert serves every caller, whatever order rows come back in."""
+        repo = MagicMock()
+        repo.upsert_many = AsyncMock(side_effect=_saved_reversed)
+        batcher = _batcher(repo)
+
+        person_ids = [uuid4() for _ in range(3)]
+        try:
+            personas = await asyncio.gather(
+                *(batcher.upsert(pid, {"n": i}, [], 1) for i, pid in enumerate(person_ids))
+            )
+        finally:
+            await batcher.stop()
+
+        repo.upsert_many.assert_awaited_once()
+        assert [p.person_id for p in personas] == person_ids
+
+    async def test_repeated_person_writes_latest_once(self):
+        """Test a person queued twice in one batch is written once with the latest persona."""
+        repo = MagicMock()
+        repo.upsert_many = AsyncMock(side_effect=_saved_reversed)
+        batcher = _batcher(repo)
+
+        person_id = uuid4()
+        try:
+            first, second = await asyncio.gather(
+                batcher.upsert(person_id, {"n": 1}, [], 1),
+                batcher.upsert(person_id, {"n": 2}, [], 2),
+            )
+        finally:
+            await batcher.stop()
+
+        rows = repo.upsert_many.await_args.args[0]
+        assert len(rows) == 1
+        assert first is second
+        assert second.version == 2
+
+    async def test_uppercase_string_id_is_matched(self):
+        """Test a persona queued with an uppercase string id matches the lowercase UUID row."""
+        repo = MagicMock()
+        repo.upsert_many = AsyncMock(
+            side_effect=lambda rows: [_saved(UUID(row[0]), *row[1:]) for row in rows]
+        )
+        batcher = _batcher(repo)
+
+        person_id = str(uuid4()).upper()
+        try:
+            persona = await batcher.upsert(person_id, {}, [])
+        finally:
+            await batcher.stop()
+
+        repo.upsert_many.assert_awaited_once()
+        assert persona.person_id == UUID(person_id)
+
+    async def test_failed_batch_retries_each_person(self):
+        """Test one failing person does not fail the other people in the batch."""
+        bad_person = uuid4()
+
+        async def upsert(person_id, persona_json, data_ids, version):
+            if person_id == bad_person:
+                raise RuntimeError("person deleted")
+            return _saved(person_id, persona_json, data_ids, version)
+
+        repo = MagicMock()
+        repo.upsert_many = AsyncMock(side_effect=RuntimeError("person deleted"))
+        repo.upsert = AsyncMock(side_effect=upsert)
+        batcher = _batcher(repo)
+
+        good_person = uuid4()
+        try:
+            good, bad = await asyncio.gather(
+                batcher.upsert(good_person, {}, []),
+                batcher.upsert(bad_person, {}, []),
+                return_exceptions=True,
+            )
+        finally:
+            await batcher.stop()
+
+        assert good.person_id == good_person
+        assert isinstance(bad, RuntimeError)
+
+    async def test_missing_row_fails_only_its_caller(self):
+        """Test a person missing from the result gets an error and the flusher keeps running."""
+        returned, missing = uuid4(), uuid4()
+        repo = MagicMock()
+        repo.upsert_many = AsyncMock(
+            side_effect=lambda rows: [_saved(*row) for row in rows if row[0] == returned]
+        )
+        batcher = _batcher(repo)
+
+        try:
+            ok, failed = await asyncio.gather(
+                batcher.upsert(returned, {}, []),
+                batcher.upsert(missing, {}, []),
+                return_exceptions=True,
+            )
+            later = await batcher.upsert(returned, {}, [], 2)
+        finally:
+            await batcher.stop()
+
+        assert ok.person_id == returned
+        assert isinstance(failed, ServiceError)
+        assert later.version == 2
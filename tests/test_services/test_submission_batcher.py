@@ -0,0 +1,157 @@
+"""Tests for the person data submission batcher."""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+from app.services.submission_batcher import SubmissionBatcher
+
+
+def _record(person_id, raw_text, source):
+    """Build a stand-in for a created PersonDataInDB record."""
+    record = MagicMock()
+    record.person_id = person_id
+    record.raw_text = raw_text
+    record.source = source
+    return record
+
+
+@pytest.mark.asyncio
+class TestSubmissionBatcher:
+    """Test SubmissionBatcher."""
+
+    async def test_concurrent_submissions_share_one_insert(self):
+        """Test concurrent submissions are written with a single bulk insert."""
+        repo = MagicMock()
+        repo.create_many = AsyncMock(
+            side_effect=lambda rows: [_record(*row) for row in rows]
+        )
+        batcher = SubmissionBatcher(repo, max_batch_size=10, max_wait_ms=20)
+        batcher.start()
+
+        person_ids = [uuid4() for _ in range(3)]
+        try:
+            records = await asyncio.gather(
+                *(batcher.submit(pid, f"text {i}") for i, pid in enumerate(person_ids))
+            )
+        finally:
+            await batcher.stop()
+
+        repo.create_many.assert_awaited_once()
+        assert [r.person_id for r in records] == person_ids
+        assert [r.raw_text for r in records] == ["text 0", "text 1", "text 2"]
+
+    async def test_batch_size_limit(self):
+        """Test batches are split at max_batch_size."""
+        repo = MagicMock()
+        repo.create_many = AsyncMock(
+            side_effect=lambda rows: [_record(*row) for row in rows]
+        )
+        batcher = SubmissionBatcher(repo, max_batch_size=2, max_wait_ms=20)
+        batcher.start()
+
+        try:
+            await asyncio.gather(*(batcher.submit(uuid4(), "text") for _ in range(5)))
+        finally:
+            await batcher.stop()
+
+        batch_sizes = [len(call.args[0]) for call in repo.create_many.await_args_list]
+        assert batch_sizes == [2, 2, 1]
+
+    async def test_insert_failure_propagates(self):
+        """Test every submitter receives the error when their own insert fails too."""
+        repo = MagicMock()
+        repo.create_many = AsyncMock(side_effect=RuntimeError("insert failed"))
+        repo.create = AsyncMock(side_effect=RuntimeError("insert failed"))
+        batcher = SubmissionBatcher(repo, max_batch_size=10, max_wait_ms=20)
+        batcher.start()
+
+        try:
+            results = await asyncio.gather(
+                batcher.submit(uuid4(), "a"),
+                batcher.submit(uuid4(), "b"),
+                return_exceptions=True,
+            )
+        finally:
+            await batcher.stop()
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def test_rows_returned_out_of_order_are_matched(self):
+        """Test records are matched to submitters even when returned in another order."""
+        repo = MagicMock()
+        repo.create_many = AsyncMock(
+            side_effect=lambda rows: [_record(*row) for row in reversed(rows)]
+        )
+        batcher = SubmissionBatcher(repo, max_batch_size=10, max_wait_ms=20)
+        batcher.start()
+
+        person_ids = [uuid4() for _ in range(3)]
+        try:
+            records = await asyncio.gather(
+                *(batcher.submit(pid, f"text {i}") for i, pid in enumerate(person_ids))
+            )
+        finally:
+            await batcher.stop()
+
+        assert [r.person_id for r in records] == person_ids
+
+    async def test_uppercase_string_id_is_matched(self):
+        """Test a submission with an uppercase string id matches the lowercase UUID row."""
+        repo = MagicMock()
+        repo.create_many = AsyncMock(
+            side_effect=lambda rows: [_record(UUID(pid), text, src) for pid, text, src in rows]
+        )
+        batcher = SubmissionBatcher(repo, max_batch_size=10, max_wait_ms=20)
+        batcher.start()
+
+        person_id = str(uuid4()).upper()
+        try:
+            record = await batcher.submit(person_id, "text")
+        finally:
+            await batcher.stop()
+
+        repo.create_many.assert_awaited_once()
+        assert record.person_id == UUID(person_id)
+
+    async def test_failed_batch_retries_rows_individually(self):
+        """Test one bad row only fails its own submitter."""
+        bad_person = uuid4()
+
+        async def create(person_id, raw_text, source):
+            if person_id == bad_person:
+                raise RuntimeError("foreign key violation")
+            return _record(person_id, raw_text, source)
+
+        repo = MagicMock()
+        repo.create_many = AsyncMock(side_effect=RuntimeError("foreign key violation"))
+        repo.create = AsyncMock(side_effect=create)
+        batcher = SubmissionBatcher(repo, max_batch_size=10, max_wait_ms=20)
+        batcher.start()
+
+        good_person = uuid4()
+        try:
+            good, bad = await asyncio.gather(
+                batcher.submit(good_person, "a"),
+                batcher.submit(bad_person, "b"),
+                return_exceptions=True,
+            )
+        finally:
+            await batcher.stop()
+
+        assert good.person_id == good_person
+        assert isinstance(bad, RuntimeError)
+        assert repo.create.await_count == 2
+
+    async def test_submit_without_flusher_inserts_directly(self):
+        """Test submit falls back to a single insert when not started."""
+        repo = MagicMock()
+        repo.create = AsyncMock(return_value="record")
+        batcher = SubmissionBatcher(repo)
+
+        person_id = uuid4()
+        result = await batcher.submit(person_id, "text", "urls")
+
+        assert result == "record"
+        repo.create.assert_awaited_once_with(person_id, "text", "urls")
@@ -1,5 +1,6 @@
 """Tests for URL fetching utility."""
 
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 import httpx
@@ -31,7 +32,7 @@ class TestURLFetcher:
         </html>
         """
 
-        with patch("app.services.url_fetcher.httpx.AsyncClient") as mock_client_class:
+        with patch("app.services.url_fetcher.get_http_client") as mock_get_client:
             mock_response = MagicMock()
             mock_response.text = html_content
             mock_response.content = html_content.encode()
@@ -39,10 +40,8 @@ class TestURLFetcher:
 
             mock_client = AsyncMock()
             mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
 
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             result = await fetcher.fetch_url("https://example.com/bio")
 
@@ -50,17 +49,33 @@ class TestURLFetcher:
             assert "software engineer" in result
             assert len(result) > 0
 
+    async def test_fetch_url_uses_injected_client(self):
+        """Test that an injected client is used instead of the shared one."""
+        mock_response = MagicMock()
+        mock_response.text = "<p>Injected</p>"
+        mock_response.content = b"<p>Injected</p>"
+        mock_response.raise_for_status = MagicMock()
+
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(return_value=mock_response)
+        fetcher = URLFetcher(client=mock_client)
+
+        with patch("app.services.url_fetcher.get_http_client") as mock_get_client:
+            result = await fetcher.fetch_url("https://example.com/bio")
+
+            assert result == "Injected"
+            mock_get_client.assert_not_called()
+            mock_client.get.assert_awaited_once()
+
     async def test_fetch_url_timeout(self):
         """Test URL fetch timeout handling."""
         fetcher = URLFetcher()
 
-        with patch("app.services.url_fetcher.httpx.AsyncClient") as mock_client_class:
+        with patch("app.services.url_fetcher.get_http_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.get = AsyncMock(side_effect=httpx.TimeoutException("timeout"))
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
 
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             with pytest.raises(URLTimeoutError):
                 await fetcher.fetch_url("https://example.com/bio")
@@ -69,13 +84,11 @@ class TestURLFetcher:
         """Test invalid URL format handling."""
         fetcher = URLFetcher()
 
-        with patch("app.services.url_fetcher.httpx.AsyncClient") as mock_client_class:
+        with patch("app.services.url_fetcher.get_http_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.get = AsyncMock(side_effect=httpx.InvalidURL("invalid"))
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
 
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             with pytest.raises(InvalidURLError):
                 await fetcher.fetch_url("not a valid url")
@@ -84,17 +97,15 @@ class TestURLFetcher:
         """Test HTTP error handling."""
         fetcher = URLFetcher()
 
-        with patch("app.services.url_fetcher.httpx.AsyncClient") as mock_client_class:
+        with patch("app.services.url_fetcher.get_http_client") as mock_get_client:
             mock_response = MagicMock()
             mock_response.status_code = 404
             mock_error = httpx.HTTPStatusError("404", request=None, response=mock_response)
 
             mock_client = AsyncMock()
             mock_client.get = AsyncMock(side_effect=mock_error)
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
 
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             with pytest.raises(HTTPError):
                 await fetcher.fetch_url("https://example.com/notfound")
@@ -106,7 +117,7 @@ class TestURLFetcher:
         # Create content larger than max size
         large_content = "x" * (fetcher.MAX_CONTENT_SIZE + 1)
 
-        with patch("app.services.url_fetcher.httpx.AsyncClient") as mock_client_class:
+        with patch("app.services.url_fetcher.get_http_client") as mock_get_client:
             mock_response = MagicMock()
             mock_response.text = large_content
             mock_response.content = large_content.encode()
@@ -114,10 +125,8 @@ class TestURLFetcher:
 
             mock_client = AsyncMock()
             mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
 
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             with pytest.raises(ContentSizeExceededError):
                 await fetcher.fetch_url("https://example.com/large")
@@ -134,7 +143,7 @@ class TestURLFetcher:
         html1 = "<html><body><p>Bio content here</p></body></html>"
         html2 = "<html><body><p>Resume content here</p></body></html>"
 
-        with patch("app.services.url_fetcher.httpx.AsyncClient") as mock_client_class:
+        with patch("app.services.url_fetcher.get_http_client") as mock_get_client:
             # Create mock responses
             mock_responses = []
             for html in [html1, html2]:
@@ -146,10 +155,8 @@ class TestURLFetcher:
 
             mock_client = AsyncMock()
             mock_client.get = AsyncMock(side_effect=mock_responses)
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
 
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             result = await fetcher.fetch_multiple(urls)
 
@@ -182,18 +189,64 @@ class TestURLFetcher:
             mock_response.raise_for_status = MagicMock()
             return mock_response
 
-        with patch("app.services.url_fetcher.httpx.AsyncClient") as mock_client_class:
+        with patch("app.services.url_fetcher.get_http_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.get = mock_get
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
 
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             # Should succeed even though one URL failed
             result = await fetcher.fetch_multiple(urls)
             assert "Success content" in result
 
+    async def test_fetch_multiple_urls_concurrently_in_order(self):
+        """Test that URLs are fetched concurrently and combined in input order."""
+        urls = [
+            "https://example.com/slow",
+            "https://example.com/fast",
+        ]
+        in_flight = 0
+        max_in_flight = 0
+
+        async def mock_get(url, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.02 if "slow" in url else 0)
+            in_flight -= 1
+            html = f"<p>{url.rsplit('/', 1)[-1]} content</p>"
+            mock_response = MagicMock()
+            mock_response.text = html
+            mock_response.content = html.encode()
+            mock_response.raise_for_status = MagicMock()
+            return mock_response
+
+        mock_client = AsyncMock()
+        mock_client.get = mock_get
+        fetcher = URLFetcher(client=mock_client)
+
+        result = await fetcher.fetch_multiple(urls)
+
+        assert max_in_flight == 2
+        assert result.index("slow content") < result.index("fast content")
+
+    async def test_fetch_multiple_urls_with_leading_text(self):
+        """Test that leading text is placed before fetched content."""
+        mock_response = MagicMock()
+        mock_response.text = "<p>URL content</p>"
+        mock_response.content = b"<p>URL content</p>"
+        mock_response.raise_for_status = MagicMock()
+
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(return_value=mock_response)
+        fetcher = URLFetcher(client=mock_client)
+
+        result = await fetcher.fetch_multiple(
+            ["https://example.com/bio"], leading_text="Direct text"
+        )
+
+        assert result == "Direct text\n\n---\n\nURL content"
+
     async def test_fetch_multiple_urls_all_failed(self):
         """Test fetching when all URLs fail."""
         fetcher = URLFetcher()
@@ -206,13 +259,11 @@ class TestURLFetcher:
         async def mock_get(url, **kwargs):
             raise httpx.HTTPStatusError("404", request=None, response=MagicMock(status_code=404))
 
-        with patch("app.services.url_fetcher.httpx.AsyncClient") as mock_client_class:
+        with patch("app.services.url_fetcher.get_http_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.get = mock_get
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
 
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             # Should raise error when all URLs fail
             with pytest.raises(URLFetchError):